@@ -1,6 +1,4 @@
 #Standart library imports
-import time
-from pathlib import Path
 from typing import Tuple
 from packaging import version
 
@@ -8,6 +6,7 @@ from packaging import version
 from selenium_driver_updater.browsers._chromeBrowser import ChromeBrowser
 
 from selenium_driver_updater.util.logger import logger
+from selenium_driver_updater.util.driver_plan import DriverPlan
 from selenium_driver_updater.driver_base import DriverBase
 
 from selenium_driver_updater.util.exceptions import DriverVersionInvalidException
@@ -49,17 +48,31 @@ class ChromeDriver(DriverBase):
         """
         driver_path : str = ''
 
-        self.chromebrowser.main()
+        with self.tracer.span('browser'):
+            self.chromebrowser.main()
+
+        with self.tracer.span('resolve'):
+            plan = self.plan()
+
+        driver_path = super()._install_plan(plan)
+
+        return driver_path
+
+    def plan(self) -> DriverPlan:
+        """Computes exact version and url of chromedriver to install before any archive is downloaded
+
+        Returns:
+            DriverPlan
+
+            plan (DriverPlan) : Resolved installation target.
+
+        """
 
         if not self.version:
 
             #additional checking for main versions to equal - for example, chromedriver version main is 90 and chrome browser is still 89
             is_equal, latest_version_driver, latest_version_browser = self._compare_latest_version_main_chromedriver_and_latest_version_main_chrome_browser()
 
-            if is_equal:
-
-                driver_path = self._check_if_chromedriver_is_up_to_date()
-
             if not is_equal:
 
                 message = (f' Problem with chromedriver latest_version_driver:'
@@ -68,14 +81,10 @@ class ChromeDriver(DriverBase):
                     ' Trying to download the latest previous version of chromedriver')
                 logger.error(message)
 
-                driver_path = self._download_driver(previous_version=True)
-
-        else:
+                return self._plan_download(previous_version=True)
 
-            driver_path = self._download_driver(version=self.version)
+        return super().plan()
 
-        return driver_path
-    
     def _get_latest_version_driver(self, no_messages: bool = False) -> str:
         """Gets the latest driver version based on the specified channel.
 
@@ -113,42 +122,6 @@ class ChromeDriver(DriverBase):
 
         return is_equal, latest_version_chromedriver, latest_version_browser
 
-    def _check_if_chromedriver_is_up_to_date(self) -> str:
-        """Сhecks for the latest version, downloads or updates chromedriver binary
-
-        Returns:
-            str
-
-            driver_path (str) : Path where chromedriver was downloaded or updated.
-
-        """
-        driver_path : str = ''
-
-        if not self.system_name:
-
-            is_driver_up_to_date, current_version, latest_version = super()._compare_current_version_and_latest_version()
-
-            if is_driver_up_to_date:
-                return self.chromedriver_path
-
-        driver_path = self._download_driver()
-
-        if not self.system_name:
-
-            is_driver_up_to_date, current_version, latest_version = super()._compare_current_version_and_latest_version()
-
-            if not is_driver_up_to_date:
-
-                message = (f'Problem with updating chromedriver'
-                        f'current_version: {current_version} latest_version: {latest_version}')
-                logger.error(message)
-                message = 'Trying to download previous latest version of chromedriver'
-                logger.info(message)
-
-                driver_path = self._download_driver(previous_version=True)
-
-        return driver_path
-
     def _get_latest_previous_version_chromedriver_via_requests(self) -> str:
         """Gets previous latest chromedriver version
 
@@ -167,94 +140,60 @@ class ChromeDriver(DriverBase):
 
         latest_version_main_previous = int(latest_version_main) - 1
 
-        url = self.setting["ChromeDriver"]["LinkLatestReleaseSpecificVersion"].format(latest_version_main_previous)
-        json_data = self.requests_getter.get_result_by_request(url=url)
+        platform = self.specific_system if self.system_name else self.setting["ChromeDriver"]["LinkLastReleaseFile"].split("/")[-2]
+        latest_version_previous = self.versions_index.get_latest_version_for_milestone(latest_version_main_previous, platform)
+
+        if not latest_version_previous:
+            url = self.setting["ChromeDriver"]["LinkLatestReleaseSpecificVersion"].format(latest_version_main_previous)
+            json_data = self.requests_getter.get_result_by_request(url=url)
 
-        latest_version_previous = str(json_data)
+            latest_version_previous = str(json_data)
 
         logger.info(f'Latest previous version of chromedriver: {latest_version_previous}')
 
         return latest_version_previous
 
-    def _download_driver(self, version : str = '', previous_version : bool = False) -> str:
-        """Function to download, delete or upgrade current chromedriver
+    def _plan_download(self, version : str = '', previous_version : bool = False) -> DriverPlan:
+        """Resolves version and download url of chromedriver
 
         Args:
             version (str)               : Specific chromedriver version to download. Defaults to empty string.
-            previous_version (boll)     : If true, chromedriver latest previous version will be downloaded. Defaults to False.
+            previous_version (bool)     : If true, chromedriver latest previous version will be resolved. Defaults to False.
 
         Returns:
-            str
+            DriverPlan
 
-            driver_path (str) : Path to unzipped driver.
+            plan (DriverPlan) : Resolved installation target.
 
         """
 
         url : str = ''
-        latest_previous_version : str = ''
-        latest_version : str = ''
-        driver_path : str = ''
-
-        super()._delete_current_driver_for_current_os()
+        driver_version : str = ''
+        reason : str = ''
 
         if previous_version:
 
-            latest_previous_version = self._get_latest_previous_version_chromedriver_via_requests()
+            driver_version = self._get_latest_previous_version_chromedriver_via_requests()
 
-            url = self.setting["ChromeDriver"]["LinkLastReleaseFile"].format(latest_previous_version)
-            logger.info(f'Started download chromedriver latest_previous_version: {latest_previous_version}')
+            url = self.setting["ChromeDriver"]["LinkLastReleaseFile"].format(driver_version)
+            reason = 'previous_version'
+            logger.info(f'Resolved chromedriver latest_previous_version: {driver_version}')
 
         else:
 
-            latest_version = self._get_latest_version_driver()
+            driver_version = self._get_latest_version_driver()
 
-            url = self.setting["ChromeDriver"]["LinkLastReleaseFile"].format(latest_version)
+            url = self.setting["ChromeDriver"]["LinkLastReleaseFile"].format(driver_version)
             channel = 'stable' if '_' not in self.version else self.version.split('_')[1]
-            logger.info(f'Started download chromedriver {channel} latest_version: {latest_version}')
+            reason = 'specific_version' if version else 'latest_version'
+            logger.info(f'Resolved chromedriver {channel} latest_version: {driver_version}')
 
         if self.system_name:
             url = url.replace(url.split("/")[-1], self.system_name)
             url = url.replace(url.split("/")[-2], self.specific_system)
-            
-            logger.info(f'Started downloading chromedriver for specific system: {self.system_name}')
-
-        if any([version, self.system_name ,latest_previous_version]):
-            super()._check_if_version_is_valid(url=url)
-
-        archive_name = url.split("/")[-1]
-        out_path = self.path + archive_name
 
-        if Path(out_path).exists():
-            Path(out_path).unlink()
+            logger.info(f'Resolved chromedriver for specific system: {self.system_name}')
 
-        logger.info(f'Started download chromedriver by url: {url}')
-        archive_path = super()._wget_download_driver(url, out_path)
-        time.sleep(2)
+        validate = any([version, self.system_name, previous_version])
 
-        logger.info(f'\r\nChromedriver was downloaded to path: {archive_path}')
-
-        out_path : str = self.path
-
-        parameters = dict(archive_path=archive_path, out_path=out_path)
-
-        if not self.filename:
-
-            self.extractor.extract_and_detect_archive_format(**parameters)
-
-        else:
-
-            filename = self.setting['ChromeDriver']['LastReleasePlatform']
-            parameters.update(dict(filename=filename, filename_replace=self.filename))
-
-            self.extractor.extract_all_zip_archive_with_specific_name(**parameters)
-
-        if Path(archive_path).exists():
-            Path(archive_path).unlink()
-
-        driver_path = self.chromedriver_path
-
-        logger.info(f'Chromedriver was successfully unpacked by path: {driver_path}')
-
-        super()._chmod_driver()
-
-        return driver_path
+        return super()._make_plan(url=url, driver_version=driver_version, validate=validate, reason=reason)
@@ -1,6 +1,4 @@
 #Standart library imports
-import time
-from pathlib import Path
 from packaging import version
 
 
@@ -10,6 +8,8 @@ from selenium_driver_updater.browsers._edgeBrowser import EdgeBrowser
 
 from selenium_driver_updater.util.logger import logger
 
+from selenium_driver_updater.util.driver_plan import DriverPlan
+
 from selenium_driver_updater.driver_base import DriverBase
 
 class EdgeDriver(DriverBase):
@@ -43,53 +43,41 @@ class EdgeDriver(DriverBase):
         """
 
         driver_path : str = ''
-        self.edgebrowser.main()
-
-        if not self.version:
+        with self.tracer.span('browser'):
+            self.edgebrowser.main()
 
-            driver_path = self.__check_if_edgedriver_is_up_to_date()
+        with self.tracer.span('resolve'):
+            plan = self.plan()
 
-        else:
-
-            driver_path = self._download_driver(version=self.version)
+        driver_path = super()._install_plan(plan)
 
         return driver_path
 
-    def __check_if_edgedriver_is_up_to_date(self) -> str:
-        """Checks for the latest version, downloads or updates edgedriver binary
+    def _get_latest_version_driver(self, no_messages : bool = False) -> str:
+        """Gets latest edgedriver version of specified channel
 
         Returns:
             str
 
-            driver_path (str)       : Path where edgedriver was downloaded or updated.
+            latest_version (str)  : Latest version of edgedriver.
 
         """
-        driver_path : str = ''
-
-        if not self.system_name:
-
-            is_driver_up_to_date, current_version, latest_version = super()._compare_current_version_and_latest_version()
-
-            if is_driver_up_to_date:
-                return self.edgedriver_path
 
-        driver_path = self._download_driver()
+        latest_version : str = ''
 
-        if not self.system_name:
+        url = str(self.setting["EdgeDriver"]["LinkLastRelease"])
+        if '_' in self.version:
+            url = url.replace('STABLE', self.version.split('_')[1].upper())
 
-            is_driver_up_to_date, current_version, latest_version = super()._compare_current_version_and_latest_version()
+        json_data = self.requests_getter.get_result_by_request(url=url)
 
-            if not is_driver_up_to_date:
-                message = ('Problem with updating edgedriver'
-                            f'current_version: {current_version} latest_version: {latest_version}')
-                logger.error(message)
+        latest_version = str(json_data).strip()
 
-                message = 'Trying to download previous latest version of edgedriver'
-                logger.info(message)
+        if not no_messages:
 
-                driver_path = self._download_driver(previous_version=True)
+            logger.info(f'Latest version of edgedriver: {latest_version}')
 
-        return driver_path
+        return latest_version
 
     def _get_latest_previous_version_edgedriver_via_requests(self) -> str:
         """Gets previous latest edgedriver version
@@ -123,99 +111,54 @@ class EdgeDriver(DriverBase):
 
         return latest_previous_version
 
-    def _download_driver(self, version : str = '', previous_version : bool = False) -> str:
-        """Function to download, delete or upgrade current chromedriver
+    def _plan_download(self, version : str = '', previous_version : bool = False) -> DriverPlan:
+        """Resolves version and download url of edgedriver
 
         Args:
-            version (str)               : Specific chromedriver version to download. Defaults to empty string.
-            previous_version (boll)     : If true, chromedriver latest previous version will be downloaded. Defaults to False.
+            version (str)               : Specific edgedriver version to download. Defaults to empty string.
+            previous_version (bool)     : If true, edgedriver latest previous version will be resolved. Defaults to False.
 
         Returns:
-            str
+            DriverPlan
 
-            file_name (str)         : Path to unzipped driver.
+            plan (DriverPlan) : Resolved installation target.
 
         """
 
         url : str = ''
-        latest_previous_version : str = ''
-        latest_version : str = ''
-
-        driver_path : str = ''
-
-        super()._delete_current_driver_for_current_os()
+        driver_version : str = ''
+        reason : str = ''
 
         if previous_version:
 
-            latest_previous_version = self._get_latest_previous_version_edgedriver_via_requests()
+            driver_version = self._get_latest_previous_version_edgedriver_via_requests()
 
-            url = str(self.setting["EdgeDriver"]["LinkLastReleaseFile"]).format(latest_previous_version)
-            logger.info(f'Started download edgedriver latest_previous_version: {latest_previous_version}')
+            url = str(self.setting["EdgeDriver"]["LinkLastReleaseFile"]).format(driver_version)
+            reason = 'previous_version'
+            logger.info(f'Resolved edgedriver latest_previous_version: {driver_version}')
 
         else:
-            
-            if self.version:
-                self.setting["EdgeDriver"]["LinkLastRelease"] = self.setting["EdgeDriver"]["LinkLastRelease"].replace('STABLE', self.version.split('_')[1].upper())
 
-            latest_version = super()._get_latest_version_driver()
+            driver_version = self._get_latest_version_driver()
 
-            url = str(self.setting["EdgeDriver"]["LinkLastReleaseFile"]).format(latest_version)
+            url = str(self.setting["EdgeDriver"]["LinkLastReleaseFile"]).format(driver_version)
             channel = '' if '_' not in self.version else self.version.split('_')[1]
-            logger.info(f'Started download edgedriver {channel} latest_version: {latest_version}')
+            reason = 'specific_version' if version else 'latest_version'
+            logger.info(f'Resolved edgedriver {channel} latest_version: {driver_version}')
 
         if self.system_name:
             url = url.replace(url.split("/")[-1], '')
             url = url + self.system_name
 
-            logger.info(f'Started downloading edgedriver for specific system: {self.system_name}')
+            logger.info(f'Resolved edgedriver for specific system: {self.system_name}')
 
-        if any([version, self.system_name ,latest_previous_version]):
-            if 'mac64_m1' in url:
-                try:
-                    super()._check_if_version_is_valid(url=url)
-                except Exception:
-                    logger.warning('Could not find binary with mac64_m1 name, trying to download standart mac binary')
-                    url = url.replace('mac64_m1', 'mac64')
-                    super()._check_if_version_is_valid(url=url)
-            else:
-                super()._check_if_version_is_valid(url=url)
+        validate = any([version, self.system_name, previous_version])
 
-        archive_name = url.split("/")[-1]
-        out_path = self.path + archive_name
+        if validate and 'mac64_m1' in url:
+            try:
+                return super()._make_plan(url=url, driver_version=driver_version, validate=validate, reason=reason)
+            except Exception:
+                logger.warning('Could not find binary with mac64_m1 name, trying to download standart mac binary')
+                url = url.replace('mac64_m1', 'mac64')
 
-        if Path(out_path).exists():
-            Path(out_path).unlink()
-
-        logger.info(f'Started download edgedriver by url: {url}')
-        archive_path = super()._wget_download_driver(url, out_path)
-        time.sleep(2)
-
-        logger.info(f'Edgedriver was downloaded to path: {archive_path}')
-
-        out_path = self.path
-
-        parameters = dict(archive_path=archive_path, out_path=out_path)
-
-        if not self.filename:
-
-            self.extractor.extract_and_detect_archive_format(**parameters)
-
-        else:
-
-
-            filename = str(self.setting['EdgeDriver']['LastReleasePlatform'])
-            parameters.update(dict(filename=filename, filename_replace=self.filename))
-
-            self.extractor.extract_all_zip_archive_with_specific_name(**parameters)
-
-        if Path(archive_path).exists():
-            Path(archive_path).unlink()
-
-        driver_path = self.edgedriver_path
-
-        logger.info(f'Edgedriver was successfully unpacked by path: {driver_path}')
-
-        super()._chmod_driver()
-
-        return driver_path
-        
\ No newline at end of file
+        return super()._make_plan(url=url, driver_version=driver_version, validate=validate, reason=reason)
@@ -1,9 +1,6 @@
 #Standart library imports
 import platform
 
-#Third library imports
-from bs4 import BeautifulSoup
-
 # Local imports
 from selenium_driver_updater.util.logger import logger
 
@@ -65,6 +62,9 @@ class SafariDriver(DriverBase):
         latest_version : str = ''
         url = self.setting["SafariDriver"]["LinkLastRelease"]
 
+        #Third library imports
+        from bs4 import BeautifulSoup
+
         json_data = self.requests_getter.get_result_by_request(url=url)
         soup = BeautifulSoup(json_data, 'html.parser')
 
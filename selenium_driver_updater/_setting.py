@@ -1,14 +1,19 @@
 #Standart library imports
 import os
+import sys
 import platform
 
 base_dir = os.path.dirname(os.path.abspath(__file__)) + os.path.sep
 
-os_bit = platform.architecture()[0][:-3]
+default_cache_dir = os.environ.get('LOCALAPPDATA', '') if os.name == 'nt' else os.environ.get('XDG_CACHE_HOME', '')
+default_cache_dir = default_cache_dir or os.path.join(os.path.expanduser('~'), '.cache')
+cache_dir = os.environ.get('SELENIUM_DRIVER_UPDATER_CACHE_DIR') or os.path.join(default_cache_dir, 'selenium_driver_updater')
+cache_dir = os.path.abspath(cache_dir) + os.path.sep
 
-is_arm = 'arm' in platform.processor().lower()
-if os.name != 'nt':  # Check if not on Windows
-    is_arm = is_arm or 'arm' in str(os.uname().machine)
+#sys.maxsize and platform.machine() are cheap, platform.architecture() and platform.processor() may spawn processes
+os_bit = '64' if sys.maxsize > 2**32 else '32'
+
+is_arm = 'arm' in platform.machine().lower()
 
 os_type = {
     'Windows': {
@@ -99,6 +104,33 @@ setting = dict(
             'DriversFileFormat'         : ".exe" if platform.system() == 'Windows' else '',
             'OSBitness'                 : os_bit,
         },
+        "Http":
+        {
+            'poolConnections'           : 10,
+            'poolMaxsize'               : 10,
+            'maxRetries'                : 3,
+            'timeout'                   : (10, 60),
+        },
+        "Cache":
+        {
+            'enabled'                   : os.environ.get('SELENIUM_DRIVER_UPDATER_NO_CACHE', '') == '',
+            'path'                      : cache_dir,
+            'metadataTTL'               : 300,
+            'storePath'                 : os.environ.get('SELENIUM_DRIVER_UPDATER_STORE_DIR') or cache_dir + 'store' + os.path.sep,
+        },
+        "Watch":
+        {
+            'interval'                  : 3600,
+            'jitter'                    : 300,
+            'statusHost'                : '127.0.0.1',
+            'statusPort'                : 8787,
+        },
+        "Mirror":
+        {
+            'host'                      : '127.0.0.1',
+            'port'                      : 8788,
+            'path'                      : cache_dir + 'mirror' + os.path.sep,
+        },
         "ChromeDriver":
         {
             "LinkLastRelease"                   : "https://googlechromelabs.github.io/chrome-for-testing/last-known-good-versions.json",
@@ -161,6 +193,9 @@ setting = dict(
             "linkLatestReleaseBySpecificRepoName"   : 'https://api.github.com/repos/{}/releases/latest',
             "linkAllReleasesTags"                   : 'https://api.github.com/repos/{}/git/refs/tags',
             "linkAllReleases"                       : 'https://api.github.com/repos/{}/releases?per_page=100000',
+            "linkReleasesPage"                      : 'https://api.github.com/repos/{}/releases?per_page={}&page={}',
+            "linkReleaseByTag"                      : 'https://api.github.com/repos/{}/releases/tags/{}',
+            "releasesPerPage"                       : 10,
         },
         "PyPi":
         {
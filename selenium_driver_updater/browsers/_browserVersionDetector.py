@@ -0,0 +1,222 @@
+#Standart library imports
+import configparser
+import os
+import platform
+import plistlib
+import re
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Callable, List
+
+# Local imports
+from selenium_driver_updater._setting import setting
+from selenium_driver_updater.util.logger import logger
+
+class BrowserVersionDetector():
+    """Class for detecting version of installed browser from on-disk artifacts without launching it"""
+
+    _lock = threading.Lock()
+    _cache : dict = {}
+
+    dpkg_status_path = '/var/lib/dpkg/status'
+    config_path = os.environ.get('XDG_CONFIG_HOME') or os.path.join(os.path.expanduser('~'), '.config')
+
+    browsers = {
+        'chrome': dict(
+            packages=['google-chrome-stable', 'google-chrome-beta', 'chromium', 'chromium-browser'],
+            profiles=['google-chrome', 'chromium'],
+            binaries=['google-chrome-stable', 'google-chrome', 'chromium', 'chromium-browser'],
+            directories=['/opt/google/chrome', '/usr/lib/chromium'],
+            ),
+        'edge': dict(
+            packages=['microsoft-edge-stable', 'microsoft-edge-beta', 'microsoft-edge-dev'],
+            profiles=['microsoft-edge'],
+            binaries=['microsoft-edge-stable', 'microsoft-edge'],
+            directories=['/opt/microsoft/msedge'],
+            ),
+        'firefox': dict(
+            packages=['firefox', 'firefox-esr'],
+            profiles=[],
+            binaries=['firefox', 'firefox-esr'],
+            directories=['/usr/lib/firefox', '/usr/lib64/firefox', '/opt/firefox', '/snap/firefox/current/usr/lib/firefox'],
+            ),
+        'opera': dict(
+            packages=['opera-stable', 'opera'],
+            profiles=['opera'],
+            binaries=['opera'],
+            directories=['/usr/lib/x86_64-linux-gnu/opera', '/usr/lib/opera'],
+            ),
+    }
+
+    @staticmethod
+    def get_version(browser_name : str) -> str:
+        """Gets version of installed browser from package metadata, application.ini, version directories or profile
+
+        Args:
+            browser_name (str) : Name of browser: chrome, edge, firefox or opera.
+
+        Returns:
+            str
+
+            browser_version (str) : Version of installed browser or empty string if it could not be detected.
+
+        """
+
+        browser_version : str = ''
+
+        if platform.system() == 'Linux':
+            browser_version = BrowserVersionDetector._get_version_linux(browser_name)
+        elif platform.system() == 'Darwin':
+            browser_version = BrowserVersionDetector._get_version_darwin(browser_name)
+
+        if browser_version:
+            logger.info(f'Current version of {browser_name} browser was detected without launching it: {browser_version}')
+
+        return browser_version
+
+    @staticmethod
+    def clear() -> None:
+        """Forgets all parsed artifacts"""
+
+        with BrowserVersionDetector._lock:
+            BrowserVersionDetector._cache.clear()
+
+    @staticmethod
+    def _get_version_linux(browser_name : str) -> str:
+        sources = BrowserVersionDetector.browsers.get(browser_name)
+        if not sources:
+            return ''
+
+        directories = list(sources['directories'])
+        for binary in sources['binaries']:
+            binary_path = shutil.which(binary)
+            if binary_path:
+                directories.insert(0, os.path.dirname(os.path.realpath(binary_path)))
+
+        detectors : List[Callable[[], str]] = [
+            lambda: BrowserVersionDetector._get_version_from_application_ini(directories),
+            lambda: BrowserVersionDetector._get_version_from_dpkg(sources['packages']),
+            lambda: BrowserVersionDetector._get_version_from_version_directory(directories),
+            lambda: BrowserVersionDetector._get_version_from_last_version(sources['profiles']),
+        ]
+
+        for detector in detectors:
+            browser_version = detector()
+            if browser_version:
+                return browser_version
+
+        return ''
+
+    @staticmethod
+    def _get_version_darwin(browser_name : str) -> str:
+        browser_path = setting[f'{browser_name.capitalize()}Browser']['Path']
+        browser_paths = browser_path if isinstance(browser_path, list) else [browser_path]
+
+        for path in browser_paths:
+            #/Applications/Firefox.app/Contents/MacOS/firefox -> /Applications/Firefox.app/Contents/Info.plist
+            info_path = os.path.join(os.path.dirname(os.path.dirname(str(path))), 'Info.plist')
+            browser_version = BrowserVersionDetector._read_cached(info_path, BrowserVersionDetector._parse_info_plist)
+            if browser_version:
+                return browser_version
+
+        return ''
+
+    @staticmethod
+    def _get_version_from_application_ini(directories : list) -> str:
+        for directory in directories:
+            browser_version = BrowserVersionDetector._read_cached(
+                os.path.join(directory, 'application.ini'), BrowserVersionDetector._parse_application_ini
+                )
+            if browser_version:
+                return browser_version
+        return ''
+
+    @staticmethod
+    def _get_version_from_dpkg(packages : list) -> str:
+        installed = BrowserVersionDetector._read_cached(BrowserVersionDetector.dpkg_status_path, BrowserVersionDetector._parse_dpkg_status)
+        for package in packages:
+            browser_version = BrowserVersionDetector._find_version((installed or {}).get(package, ''))
+            if browser_version:
+                return browser_version
+        return ''
+
+    @staticmethod
+    def _get_version_from_version_directory(directories : list) -> str:
+        #chromium based browsers keep resources in directory named by version, like 120.0.6099.109/
+        for directory in directories:
+            try:
+                names = [entry.name for entry in os.scandir(directory) if entry.is_dir()]
+            except OSError:
+                continue
+
+            versions = [name for name in names if re.fullmatch(r'\d+(\.\d+){3}', name)]
+            if versions:
+                return max(versions, key=lambda name: [int(part) for part in name.split('.')])
+        return ''
+
+    @staticmethod
+    def _get_version_from_last_version(profiles : list) -> str:
+        for profile in profiles:
+            browser_version = BrowserVersionDetector._read_cached(
+                os.path.join(BrowserVersionDetector.config_path, profile, 'Last Version'), BrowserVersionDetector._parse_last_version
+                )
+            if browser_version:
+                return browser_version
+        return ''
+
+    @staticmethod
+    def _read_cached(path : str, parser : Callable[[bytes], Any]) -> Any:
+        try:
+            file_stat = os.stat(path)
+        except OSError:
+            return None
+
+        key = (path, parser.__name__)
+        identity = (file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns)
+
+        cached = BrowserVersionDetector._cache.get(key)
+        if cached and cached[0] == identity:
+            return cached[1]
+
+        try:
+            result = parser(Path(path).read_bytes())
+        except (OSError, ValueError, configparser.Error, plistlib.InvalidFileException):
+            return None
+
+        with BrowserVersionDetector._lock:
+            BrowserVersionDetector._cache[key] = (identity, result)
+
+        return result
+
+    @staticmethod
+    def _find_version(text : str) -> str:
+        text = re.sub(r'^\d+:', '', text.strip()) #epoch of debian package version, like 1:128.0
+        find_string = re.findall(setting["Program"]["wedriverVersionPattern"], text)
+        return find_string[0] if len(find_string) > 0 else ''
+
+    @staticmethod
+    def _parse_last_version(data : bytes) -> str:
+        return BrowserVersionDetector._find_version(data.decode('utf-8', errors='replace'))
+
+    @staticmethod
+    def _parse_application_ini(data : bytes) -> str:
+        parser = configparser.ConfigParser(interpolation=None)
+        parser.read_string(data.decode('utf-8', errors='replace'))
+        return BrowserVersionDetector._find_version(parser.get('App', 'Version', fallback=''))
+
+    @staticmethod
+    def _parse_dpkg_status(data : bytes) -> dict:
+        installed : dict = {}
+
+        for paragraph in data.decode('utf-8', errors='replace').split('\n\n'):
+            fields = dict(re.findall(r'^(Package|Status|Version): (.*)$', paragraph, flags=re.MULTILINE))
+            if fields.get('Package') and fields.get('Status', '').endswith(' installed'):
+                installed[fields['Package']] = fields.get('Version', '')
+
+        return installed
+
+    @staticmethod
+    def _parse_info_plist(data : bytes) -> str:
+        info = plistlib.loads(data)
+        return BrowserVersionDetector._find_version(str(info.get('CFBundleShortVersionString', '')))
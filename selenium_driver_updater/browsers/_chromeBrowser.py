@@ -5,14 +5,6 @@ import platform
 from typing import Any
 from pathlib import Path
 
-# Third party imports
-from bs4 import BeautifulSoup
-
-# Selenium imports
-from selenium import webdriver
-from selenium.common.exceptions import SessionNotCreatedException
-from selenium.common.exceptions import WebDriverException
-
 # Local imports
 from selenium_driver_updater._setting import setting
 
@@ -20,6 +12,8 @@ from selenium_driver_updater.util.extractor import Extractor
 from selenium_driver_updater.util.requests_getter import RequestsGetter
 from selenium_driver_updater.util.logger import logger
 
+from selenium_driver_updater.browsers._browserVersionDetector import BrowserVersionDetector
+
 class ChromeBrowser():
     """Class for working with Chrome browser"""
 
@@ -30,6 +24,7 @@ class ChromeBrowser():
         self.chromedriver_path = str(kwargs.get('path'))
         self.extractor = Extractor
         self.requests_getter = RequestsGetter
+        self.version_detector = BrowserVersionDetector
 
     def main(self) -> None:
         """Main function, checks for the latest version, downloads or updates chrome browser"""
@@ -56,69 +51,35 @@ class ChromeBrowser():
             message = f"Your existing chrome browser is up to date. current_version: {current_version} latest_version: {latest_version}"
             logger.warning(message)
 
-    def _get_current_version_chrome_browser_selenium(self) -> str:
-        """Gets current chrome browser version
-
-
-        Returns:
-            str
-
-            browser_version (str)   : Current chrome browser version.
-
-        Raises:
-            SessionNotCreatedException: Occurs when current chromedriver could not start.
-
-            WebDriverException: Occurs when current chromedriver could not start or critical error occured.
-
-            Except: If unexpected error raised.
-
-        """
-
-        browser_version : str = ''
-
-        try:
-
-            browser_version = self._get_current_version_chrome_browser_selenium_via_terminal()
-            if not browser_version:
-                message = 'Trying to get current version of chrome browser via chromedriver'
-                logger.info(message)
-
-            if Path(self.chromedriver_path).exists() and not browser_version:
-
-                chrome_options = webdriver.ChromeOptions()
-
-                chrome_options.add_argument('--headless')
-
-                with webdriver.Chrome(executable_path = self.chromedriver_path, options = chrome_options) as driver:
-                    browser_version = str(driver.capabilities['browserVersion'])
-
-            logger.info(f'Current version of chrome browser: {browser_version}')
-
-        except (WebDriverException, SessionNotCreatedException, OSError):
-            pass #[Errno 86] Bad CPU type in executable:
-
-        return browser_version
-
     def _get_current_version_chrome_browser_selenium(self) -> str:
         """Gets current chrome browser version"""
         browser_version = ''
         try:
-            browser_version = self._get_current_version_chrome_browser_selenium_via_terminal()
+            browser_version = self.version_detector.get_version('chrome')
+            if not browser_version:
+                browser_version = self._get_current_version_chrome_browser_selenium_via_terminal()
             if not browser_version:
                 logger.info('Trying to get current version of chrome browser via chromedriver')
             if Path(self.chromedriver_path).exists() and not browser_version:
                 browser_version = self._get_version_via_chromedriver()
             logger.info(f'Current version of chrome browser: {browser_version}')
-        except (WebDriverException, SessionNotCreatedException, OSError):
+        except OSError:
             pass  # [Errno 86] Bad CPU type in executable:
         return browser_version
 
     def _get_version_via_chromedriver(self) -> str:
-        """Get Chrome version via chromedriver"""
-        chrome_options = webdriver.ChromeOptions()
-        chrome_options.add_argument('--headless')
-        with webdriver.Chrome(executable_path=self.chromedriver_path, options=chrome_options) as driver:
-            return str(driver.capabilities['browserVersion'])
+        """Get Chrome version via chromedriver, selenium is imported only when browser has to be launched"""
+        # Selenium imports
+        from selenium import webdriver
+        from selenium.common.exceptions import SessionNotCreatedException, WebDriverException
+
+        try:
+            chrome_options = webdriver.ChromeOptions()
+            chrome_options.add_argument('--headless')
+            with webdriver.Chrome(executable_path=self.chromedriver_path, options=chrome_options) as driver:
+                return str(driver.capabilities['browserVersion'])
+        except (WebDriverException, SessionNotCreatedException):
+            return ''
 
     def _get_current_version_chrome_browser_selenium_via_terminal(self) -> str:
         """Gets current chrome browser version via command in terminal"""
@@ -178,6 +139,9 @@ class ChromeBrowser():
         url = self.setting["ChromeBrowser"]["LinkAllLatestRelease"]
         json_data = self.requests_getter.get_result_by_request(url=url)
 
+        # Third party imports
+        from bs4 import BeautifulSoup
+
         soup = BeautifulSoup(json_data, 'html.parser')
         elements_news = soup.findAll('div', attrs={'class' : 'post'})
         stable_channel_header_text = 'Stable Channel Update for Desktop'
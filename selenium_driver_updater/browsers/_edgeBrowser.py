@@ -5,19 +5,14 @@ from typing import Any
 from pathlib import Path
 import platform
 
-# Selenium imports
-from selenium import webdriver
-from selenium.common.exceptions import SessionNotCreatedException
-from selenium.common.exceptions import WebDriverException
-from selenium.webdriver.edge.service import Service
-from selenium.webdriver.edge.options import Options
-
 # Local imports
 from selenium_driver_updater._setting import setting
 
 from selenium_driver_updater.util.requests_getter import RequestsGetter
 from selenium_driver_updater.util.logger import logger
 
+from selenium_driver_updater.browsers._browserVersionDetector import BrowserVersionDetector
+
 class EdgeBrowser():
     """Class for working with Edge browser"""
 
@@ -28,6 +23,7 @@ class EdgeBrowser():
         self.edgedriver_path = str(kwargs.get('path'))
 
         self.requests_getter = RequestsGetter
+        self.version_detector = BrowserVersionDetector
 
     def main(self):
         """Main function, checks for the latest version, downloads or updates edge browser"""
@@ -55,27 +51,47 @@ class EdgeBrowser():
 
         try:
 
-            browser_version = self._get_current_version_edge_browser_selenium_via_terminal()
+            browser_version = self.version_detector.get_version('edge')
+
+            if not browser_version:
+                browser_version = self._get_current_version_edge_browser_selenium_via_terminal()
+
             if not browser_version:
                 message = 'Trying to get current version of edge browser via edgedriver'
                 logger.info(message)
 
             if Path(self.edgedriver_path).exists() and not browser_version:
 
-                service = Service(self.edgedriver_path)
-
-                options = Options()
-
-                with webdriver.Edge(service=service, options=options) as driver:
-                    browser_version = str(driver.capabilities['browserVersion'])
+                browser_version = self._get_current_version_edge_browser_via_edgedriver()
 
             logger.info(f'Current version of edge browser: {browser_version}')
 
-        except (WebDriverException, SessionNotCreatedException, OSError):
+        except OSError:
             pass #[Errno 86] Bad CPU type in executable:
 
         return browser_version
 
+    def _get_current_version_edge_browser_via_edgedriver(self) -> str:
+        """Gets current edge browser version by launching it, selenium is imported only here"""
+
+        # Selenium imports
+        from selenium import webdriver
+        from selenium.common.exceptions import SessionNotCreatedException, WebDriverException
+        from selenium.webdriver.edge.service import Service
+        from selenium.webdriver.edge.options import Options
+
+        try:
+
+            service = Service(self.edgedriver_path)
+
+            options = Options()
+
+            with webdriver.Edge(service=service, options=options) as driver:
+                return str(driver.capabilities['browserVersion'])
+
+        except (WebDriverException, SessionNotCreatedException):
+            return ''
+
     def _get_latest_version_edge_browser(self) -> str:
         """Gets latest edge browser version
 
@@ -5,16 +5,6 @@ import platform
 from typing import Any
 from pathlib import Path
 
-# Third party imports
-from bs4 import BeautifulSoup
-
-# Selenium imports
-from selenium import webdriver
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.common.exceptions import SessionNotCreatedException
-from selenium.common.exceptions import WebDriverException
-from selenium.webdriver.firefox.service import Service
-
 # Local imports
 from selenium_driver_updater._setting import setting
 
@@ -22,6 +12,8 @@ from selenium_driver_updater.util.requests_getter import RequestsGetter
 from selenium_driver_updater.util.extractor import Extractor
 from selenium_driver_updater.util.logger import logger
 
+from selenium_driver_updater.browsers._browserVersionDetector import BrowserVersionDetector
+
 class FirefoxBrowser():
     """Class for working with Firefox browser"""
 
@@ -32,6 +24,7 @@ class FirefoxBrowser():
         self.geckodriver_path = str(kwargs.get('path'))
 
         self.requests_getter = RequestsGetter
+        self.version_detector = BrowserVersionDetector
         self.extractor = Extractor
 
     def main(self) -> None:
@@ -65,28 +58,48 @@ class FirefoxBrowser():
 
         try:
 
-            browser_version = self._get_current_version_firefox_browser_selenium_via_terminal()
+            browser_version = self.version_detector.get_version('firefox')
+
+            if not browser_version:
+                browser_version = self._get_current_version_firefox_browser_selenium_via_terminal()
+
             if not browser_version:
                 message = 'Trying to get current version of firefox browser via geckodriver'
                 logger.info(message)
 
             if Path(self.geckodriver_path).exists() and not browser_version:
 
-                options = FirefoxOptions()
-                options.add_argument("--headless")
-
-                service = Service(self.geckodriver_path)
-
-                with webdriver.Firefox(service=service, options=options) as driver:
-                    browser_version = str(driver.capabilities['browserVersion'])
+                browser_version = self._get_current_version_firefox_browser_via_geckodriver()
 
             logger.info(f'Current version of firefox browser: {browser_version}')
 
-        except (WebDriverException, SessionNotCreatedException, OSError):
+        except OSError:
             pass #[Errno 86] Bad CPU type in executable:
 
         return browser_version
 
+    def _get_current_version_firefox_browser_via_geckodriver(self) -> str:
+        """Gets current firefox browser version by launching it, selenium is imported only here"""
+
+        # Selenium imports
+        from selenium import webdriver
+        from selenium.webdriver.firefox.options import Options as FirefoxOptions
+        from selenium.common.exceptions import SessionNotCreatedException, WebDriverException
+        from selenium.webdriver.firefox.service import Service
+
+        try:
+
+            options = FirefoxOptions()
+            options.add_argument("--headless")
+
+            service = Service(self.geckodriver_path)
+
+            with webdriver.Firefox(service=service, options=options) as driver:
+                return str(driver.capabilities['browserVersion'])
+
+        except (WebDriverException, SessionNotCreatedException):
+            return ''
+
     def _get_latest_version_firefox_browser(self) -> str:
         """Gets latest firefox browser version
 
@@ -106,6 +119,9 @@ class FirefoxBrowser():
         url = self.setting["FirefoxBrowser"]["LinkAllLatestReleases"]
         json_data = self.requests_getter.get_result_by_request(url=url)
 
+        # Third party imports
+        from bs4 import BeautifulSoup
+
         soup = BeautifulSoup(json_data, 'html.parser')
         latest_version = soup.findAll('html')[0].attrs.get('data-latest-firefox')
 
@@ -5,15 +5,6 @@ import platform
 from typing import Any
 from pathlib import Path
 
-# Third party imports
-from bs4 import BeautifulSoup
-
-# Selenium imports
-from selenium import webdriver
-from selenium.common.exceptions import SessionNotCreatedException
-from selenium.common.exceptions import WebDriverException
-from selenium.webdriver.chrome.service import Service
-
 # Local imports
 from selenium_driver_updater._setting import setting
 
@@ -21,6 +12,8 @@ from selenium_driver_updater.util.requests_getter import RequestsGetter
 from selenium_driver_updater.util.extractor import Extractor
 from selenium_driver_updater.util.logger import logger
 
+from selenium_driver_updater.browsers._browserVersionDetector import BrowserVersionDetector
+
 class OperaBrowser():
     """Class for working with Opera browser"""
 
@@ -31,6 +24,7 @@ class OperaBrowser():
         self.operadriver_path = str(kwargs.get('path'))
 
         self.requests_getter = RequestsGetter
+        self.version_detector = BrowserVersionDetector
         self.extractor = Extractor
         self.system_name = ''
         self.url_release = ''
@@ -61,27 +55,46 @@ class OperaBrowser():
 
         try:
 
-            browser_version = self._get_current_version_opera_browser_selenium_via_terminal()
+            browser_version = self.version_detector.get_version('opera')
+
+            if not browser_version:
+                browser_version = self._get_current_version_opera_browser_selenium_via_terminal()
+
             if not browser_version:
                 message = 'Trying to get current version of opera browser via operadriver'
                 logger.info(message)
 
             if Path(self.operadriver_path).exists() and not browser_version:
 
-                service = Service(self.operadriver_path)
-                with webdriver.Chrome(service=service) as driver:
-                    browser_version = driver.execute_script("return navigator.userAgent")
+                browser_version = self._get_current_version_opera_browser_via_operadriver()
 
                 find_string = re.findall('OPR/' + self.setting["Program"]["wedriverVersionPattern"], browser_version)
                 browser_version = find_string[0] if len(find_string) > 0 else ''
 
             logger.info(f'Current version of opera browser: {browser_version}')
 
-        except (WebDriverException, SessionNotCreatedException, OSError):
+        except OSError:
             pass #[Errno 86] Bad CPU type in executable:
 
         return browser_version
 
+    def _get_current_version_opera_browser_via_operadriver(self) -> str:
+        """Gets user agent of current opera browser by launching it, selenium is imported only here"""
+
+        # Selenium imports
+        from selenium import webdriver
+        from selenium.common.exceptions import SessionNotCreatedException, WebDriverException
+        from selenium.webdriver.chrome.service import Service
+
+        try:
+
+            service = Service(self.operadriver_path)
+            with webdriver.Chrome(service=service) as driver:
+                return str(driver.execute_script("return navigator.userAgent"))
+
+        except (WebDriverException, SessionNotCreatedException):
+            return ''
+
     def _get_latest_version_opera_browser(self) -> str:
         """Gets latest opera browser version
 
@@ -102,6 +115,9 @@ class OperaBrowser():
         url = self.setting["OperaBrowser"]["LinkAllLatestRelease"]
         json_data = self.requests_getter.get_result_by_request(url=url)
 
+        # Third party imports
+        from bs4 import BeautifulSoup
+
         soup = BeautifulSoup(json_data, 'html.parser')
 
         system_name = platform.system()
@@ -1,5 +1,6 @@
 #Standart library imports
 import argparse
+import sys
 
 #Local imports
 from selenium_driver_updater._setting import setting
@@ -31,7 +32,6 @@ class ConsoleUpdater():
             metavar="DRIVER_NAME",
             help="Specified driver name/names which will be downloaded or updated, if you want to specify multiple drivers, use commas",
             default='',
-            required=True,
         )
         parser.add_argument(
             "--path",
@@ -86,9 +86,161 @@ class ConsoleUpdater():
             help="Specific version for driver",
             default='',
         )
+        parser.add_argument(
+            "--watch",
+            action="store_true",
+            dest="watch",
+            help="If given, it will keep running and update drivers on a schedule, state is served over local http",
+            default=False,
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            action="store",
+            dest="interval",
+            metavar="SECONDS",
+            help=f"Seconds between checks in watch mode. Defaults to {setting['Watch']['interval']}",
+            default=None,
+        )
+        parser.add_argument(
+            "--jitter",
+            type=float,
+            action="store",
+            dest="jitter",
+            metavar="SECONDS",
+            help=f"Maximum random seconds added to interval in watch mode. Defaults to {setting['Watch']['jitter']}",
+            default=None,
+        )
+        parser.add_argument(
+            "--status_port",
+            type=int,
+            action="store",
+            dest="status_port",
+            metavar="PORT",
+            help=(f"Port of local status endpoint in watch mode, negative disables it. "
+                  f"Defaults to {setting['Watch']['statusPort']}"),
+            default=None,
+        )
+        parser.add_argument(
+            "--offline",
+            action="store_true",
+            dest="offline",
+            help="If given, drivers are installed only from imported bundle or earlier downloads without network",
+            default=False,
+        )
+        parser.add_argument(
+            "--mirror",
+            action="store",
+            dest="mirror",
+            metavar="URL",
+            help="Base url of selenium driver updater mirror, like http://mirror:8788/ If given, drivers are downloaded from it",
+            default='',
+        )
+        parser.add_argument(
+            "--serve_mirror",
+            action="store_true",
+            dest="serve_mirror",
+            help="If given, it will run caching mirror of driver upstreams for other machines instead of installing drivers",
+            default=False,
+        )
+        parser.add_argument(
+            "--mirror_host",
+            action="store",
+            dest="mirror_host",
+            metavar="HOST",
+            help=f"Host which mirror listens on, use 0.0.0.0 to serve other machines. Defaults to {setting['Mirror']['host']}",
+            default=None,
+        )
+        parser.add_argument(
+            "--mirror_port",
+            type=int,
+            action="store",
+            dest="mirror_port",
+            metavar="PORT",
+            help=f"Port which mirror listens on. Defaults to {setting['Mirror']['port']}",
+            default=None,
+        )
+        parser.add_argument(
+            "--report",
+            action="store",
+            dest="report_path",
+            metavar="FILE",
+            help="If given, json report with duration, bytes, cache hits and http status of every phase is written to this file",
+            default='',
+        )
+        parser.add_argument(
+            "--metrics_textfile",
+            action="store",
+            dest="metrics_path",
+            metavar="FILE",
+            help="If given, metrics of run are written to this Prometheus textfile for node exporter textfile collector, like selenium_driver_updater.prom",
+            default='',
+        )
         parser.add_argument("--version", action="version", version=str(setting["Program"]["version"]))
-        return parser.parse_args()
+
+        args = parser.parse_args()
+        if not args.driver_name and not args.serve_mirror:
+            parser.error('the following arguments are required: --driver_name/-d')
+
+        return args
     
+    @staticmethod
+    def parse_bundle_command_line(argv):
+        "Function for parsing arguments of bundle command: selupd bundle export|import FILE"
+
+        parser = argparse.ArgumentParser(
+            prog='selupd bundle',
+            description="Export drivers with their metadata into single archive or import it for installing with --offline",
+        )
+        parser.add_argument("command", choices=['export', 'import'], help="Export or import bundle")
+        parser.add_argument("bundle_path", metavar="FILE", help="Path of bundle, like drivers.tar.gz")
+        parser.add_argument(
+            "--driver_name",
+            "-d",
+            type=lambda value: value.split(','),
+            dest="driver_names",
+            metavar="DRIVER_NAME",
+            help="Drivers which will be exported, use commas for multiple drivers",
+            default=[],
+        )
+        parser.add_argument(
+            "--system_name",
+            type=lambda value: value.split(','),
+            dest="system_names",
+            metavar="SYSTEM_NAME",
+            help="OSes for which drivers will be exported, use commas for multiple OSes. Defaults to current OS",
+            default=[''],
+        )
+        parser.add_argument(
+            "--driver-version",
+            "-dv",
+            type=lambda value: value.split(','),
+            dest="versions",
+            metavar="DRIVER_VERSION",
+            help="Channels which will be exported in addition to stable, like chromedriver_beta, use commas for multiple channels",
+            default=[],
+        )
+
+        args = parser.parse_args(argv)
+        if args.command == 'export' and not args.driver_names:
+            parser.error('the following arguments are required for export: --driver_name/-d')
+
+        return args
+
+    @staticmethod
+    def bundle(argv):
+        "Function which exports or imports bundle of drivers"
+
+        # Local imports
+        from selenium_driver_updater.util.driver_bundle import DriverBundle
+
+        args = ConsoleUpdater.parse_bundle_command_line(argv)
+
+        if args.command == 'export':
+            DriverBundle.export_bundle(args.bundle_path, args.driver_names, args.system_names, args.versions)
+        else:
+            DriverBundle.import_bundle(args.bundle_path)
+
     @staticmethod
     def comma_separated_string(value):
         """Convert a comma-separated string into a list or return as a string if no comma."""
@@ -100,6 +252,10 @@ class ConsoleUpdater():
     def install():
         "Main function that initializes all variables and pass it to main module (driver Updater)"
 
+        if sys.argv[1:2] == ['bundle']:
+            ConsoleUpdater.bundle(sys.argv[2:])
+            return
+
         args = ConsoleUpdater.parse_command_line()
         kwargs = vars(args)
         
@@ -107,4 +263,24 @@ class ConsoleUpdater():
             if isinstance(kwargs['driver_name'], list) and isinstance(kwargs['filename'], str):
                 kwargs['filename'] = [kwargs['filename']]
 
-        DriverUpdater.install(**kwargs)
+        mirror_options = {key: kwargs.pop(key) for key in ('mirror', 'serve_mirror', 'mirror_host', 'mirror_port')}
+
+        if mirror_options['serve_mirror']:
+            # Local imports
+            from selenium_driver_updater.driverMirror import DriverMirror
+
+            DriverMirror(host=mirror_options['mirror_host'], port=mirror_options['mirror_port']).serve_forever()
+            return
+
+        if mirror_options['mirror']:
+            kwargs.update(endpoints=dict(mirror=mirror_options['mirror']))
+
+        watch_options = {key: kwargs.pop(key) for key in ('watch', 'interval', 'jitter', 'status_port')}
+
+        if watch_options.pop('watch'):
+            # Local imports
+            from selenium_driver_updater.driverWatcher import DriverWatcher
+
+            DriverWatcher(**watch_options, **kwargs).run()
+        else:
+            DriverUpdater.install(**kwargs)
@@ -0,0 +1,284 @@
+#Standart library imports
+import hashlib
+import os
+import re
+import shutil
+import threading
+import traceback
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from email.utils import formatdate
+from typing import Any, Optional, Tuple
+from urllib.parse import urlsplit
+
+# Local imports
+from selenium_driver_updater._setting import setting
+from selenium_driver_updater.util.downloader import Downloader
+from selenium_driver_updater.util.file_lock import FileLock
+from selenium_driver_updater.util.http_cache import HttpCache
+from selenium_driver_updater.util.requests_getter import RequestsGetter
+from selenium_driver_updater.util.github_viewer import GithubViewer
+from selenium_driver_updater.util.endpoints import Endpoints
+from selenium_driver_updater.util.logger import logger
+from selenium_driver_updater.util.exceptions import StatusCodeNotEqualException, NotAvailableOfflineException
+
+class DriverMirror():
+    """Caching http mirror of driver upstreams, one instance fetches metadata and archives once and serves them to other nodes"""
+
+    #http://<mirror>/<name>/<rest> is served from <base><rest>
+    upstreams = Endpoints.defaults
+
+    archive_suffixes = ('.zip', '.tar.gz', '.tgz')
+
+    def __init__(self, host : Optional[str] = None, port : Optional[int] = None, path : Optional[str] = None):
+        """Prepares mirror
+
+        Args:
+            host (str) : Host which mirror listens on. Defaults to setting value.
+            port (int) : Port which mirror listens on, 0 picks free port. Defaults to setting value.
+            path (str) : Directory where downloaded archives are kept. Defaults to setting value.
+
+        """
+
+        self.host = str(host or setting["Mirror"]["host"])
+        self.port = int(port if port is not None else setting["Mirror"]["port"])
+        self.path = os.path.abspath(str(path or setting["Mirror"]["path"])) + os.path.sep
+
+        self._server : Any = None
+
+    def start(self) -> Tuple[str, int]:
+        """Starts mirror in background thread
+
+        Returns:
+            tuple
+
+            address (tuple) : Host and port which mirror listens on.
+
+        """
+
+        if self._server is None:
+            self._server = ThreadingHTTPServer((self.host, self.port), _MirrorHandler)
+            self._server.daemon_threads = True
+            setattr(self._server, 'mirror', self)
+
+            threading.Thread(target=self._server.serve_forever, name='selenium_driver_updater_mirror', daemon=True).start()
+
+            logger.info(f'Mirror of driver upstreams is available at http://{self.host}:{self._server.server_address[1]}/')
+
+        return self._server.server_address[:2]
+
+    def serve_forever(self) -> None:
+        """Starts mirror and serves until process is interrupted"""
+
+        self.start()
+
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            logger.info('Mirror was interrupted')
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        """Stops mirror"""
+
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def get_upstream_url(self, request_path : str) -> Tuple[str, str]:
+        """Gets upstream url of mirrored path
+
+        Args:
+            request_path (str) : Path of mirror url with query, like /chrome-for-testing/last-known-good-versions.json
+
+        Returns:
+            tuple
+
+            name (str)  : Name of upstream or empty string if path is not mirrored.
+            url (str)   : Url of upstream resource or empty string if path is not mirrored.
+
+        """
+
+        name, _, rest = request_path.lstrip('/').partition('/')
+        base = DriverMirror.upstreams.get(name)
+
+        if not base or '..' in urlsplit(rest).path.split('/') or '\\' in rest:
+            return '', ''
+
+        #query of the base itself, like listing of edgewebdriver container, is sent without trailing slash
+        return name, (base.rstrip('/') if rest.startswith('?') else base) + rest
+
+    def get_archive(self, name : str, url : str) -> str:
+        """Gets path of mirrored archive, it is downloaded from upstream only once
+
+        Args:
+            name (str)  : Name of upstream.
+            url (str)   : Url of archive on upstream.
+
+        Returns:
+            str
+
+            archive_path (str) : Path to archive in mirror directory.
+
+        """
+
+        relative_path = urlsplit(url[len(DriverMirror.upstreams[name]):]).path
+        archive_path = os.path.join(self.path, name, *relative_path.split('/'))
+
+        if not Path(archive_path).exists():
+            Path(archive_path).parent.mkdir(parents=True, exist_ok=True)
+
+            #nodes asking for the same archive at the same time wait for the first download
+            with FileLock(archive_path + '.lock', remove_on_release=True):
+                if not Path(archive_path).exists():
+                    logger.info(f'Mirroring archive: {url}')
+                    Downloader.download(url=url, path=archive_path)
+
+        return archive_path
+
+    def get_metadata(self, url : str, mirror_url : str) -> Tuple[bytes, str, dict]:
+        """Gets metadata from upstream through on-disk http cache, links to upstreams are rewritten to mirror
+
+        Args:
+            url (str)           : Url of metadata on upstream.
+            mirror_url (str)    : Base url of this mirror as seen by client, like http://mirror:8788/
+
+        Returns:
+            tuple
+
+            body (bytes)        : Body of metadata.
+            content_type (str)  : Content type of metadata.
+            headers (dict)      : ETag of rewritten body, Last-Modified and Cache-Control of upstream.
+
+        """
+
+        #clients never send their token to the mirror, so github api is requested with token of the mirror itself
+        headers = GithubViewer.get_headers(url) if url.startswith(Endpoints.defaults['api.github']) else None
+        text = RequestsGetter.get_result_by_request(url=url, headers=headers)
+
+        for name, base in DriverMirror.upstreams.items():
+            text = text.replace(base, f'{mirror_url}{name}/')
+
+        cache_entry = HttpCache.get(url)
+        content_type = cache_entry.headers.get('Content-Type', '') if cache_entry else ''
+        content_type = content_type.split(';')[0] or ('application/json' if text.lstrip()[:1] in ('{', '[') else 'text/plain')
+
+        #text was decoded by requests, so it is sent back in utf-8 whatever upstream encoding was
+        body = text.encode('utf-8')
+
+        #body differs from upstream one after links were rewritten, so it gets its own etag
+        headers = dict(ETag='"{}"'.format(hashlib.sha256(body).hexdigest()[:32]))
+        if cache_entry:
+            headers.update({key: value for key, value in cache_entry.headers.items() if key in ('Last-Modified', 'Cache-Control')})
+
+        return body, f'{content_type}; charset=utf-8', headers
+
+    @staticmethod
+    def point_to(mirror_url : str) -> None:
+        """Points all upstreams to mirror, so this process downloads drivers from it
+
+        Args:
+            mirror_url (str) : Base url of mirror, like http://mirror:8788/
+
+        """
+
+        Endpoints.configure(mirror=mirror_url)
+
+class _MirrorHandler(BaseHTTPRequestHandler):
+    """Serves mirrored upstream paths"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        #Requests imports
+        import requests
+
+        mirror = getattr(self.server, 'mirror')
+        name, url = mirror.get_upstream_url(self.path)
+
+        if not url:
+            self._send_error(404, f'Path is not mirrored: {self.path}')
+            return
+
+        try:
+            if re.sub(r'\?.*$', '', url).endswith(DriverMirror.archive_suffixes):
+                self._send_file(mirror.get_archive(name, url))
+            else:
+                host = self.headers.get('Host') or '{}:{}'.format(*self.server.server_address[:2])
+                body, content_type, headers = mirror.get_metadata(url, f'http://{host}/')
+                self._send_body(200, body, content_type, headers)
+
+        except StatusCodeNotEqualException as error:
+            #clients tell missing versions and tags by status code of upstream, like 404
+            find_string = re.findall(r'status_code: (\d+)', str(error))
+            status_code = int(find_string[0]) if find_string else 502
+            self._send_error(status_code if 400 <= status_code < 600 else 502, str(error))
+        except NotAvailableOfflineException as error:
+            logger.warning(f'Mirror could not fetch {url}: {error}')
+            self._send_error(504, f'Upstream is not available offline: {url}')
+        except (requests.exceptions.RequestException, OSError) as error:
+            logger.warning(f'Mirror could not fetch {url}: {error}')
+            self._send_error(502, f'Upstream is not available: {url}')
+        except Exception:
+            #client must get an answer whatever went wrong with upstream
+            logger.error(f'Mirror could not serve {url}: {str(traceback.format_exc())}')
+            self._send_error(502, f'Upstream could not be served: {url}')
+
+    def _send_file(self, file_path : str) -> None:
+        file_stat = os.stat(file_path)
+
+        #mirrored archives are never changed, their paths contain version
+        headers = {
+            'ETag': f'"{file_stat.st_size:x}-{file_stat.st_mtime_ns:x}"',
+            'Last-Modified': formatdate(file_stat.st_mtime, usegmt=True),
+            'Cache-Control': 'public, max-age=31536000, immutable',
+            }
+
+        if self._send_not_modified(headers):
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/octet-stream')
+        self.send_header('Content-Length', str(file_stat.st_size))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+
+        with open(file_path, 'rb') as file:
+            shutil.copyfileobj(file, self.wfile)
+
+    def _send_body(self, status_code : int, body : bytes, content_type : str, headers : Optional[dict] = None) -> None:
+        headers = headers or {}
+
+        if status_code == 200 and self._send_not_modified(headers):
+            return
+
+        self.send_response(status_code)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_not_modified(self, headers : dict) -> bool:
+        """Answers 304 Not Modified if client has the same version of resource"""
+
+        etags = [etag.strip().replace('W/', '', 1) for etag in self.headers.get('If-None-Match', '').split(',')]
+        if not headers.get('ETag') or not ('*' in etags or headers['ETag'] in etags):
+            return False
+
+        self.send_response(304)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+
+        return True
+
+    def _send_error(self, status_code : int, message : str) -> None:
+        self._send_body(status_code, message.encode('utf-8'), 'text/plain; charset=utf-8')
+
+    def log_message(self, *args):
+        pass
@@ -1,9 +1,13 @@
 #Standart library imports
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 import os
-from typing import Any
-import time
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import contextvars
+import functools
 import sys
 import traceback
 from packaging import version
@@ -16,24 +20,39 @@ from selenium_driver_updater.util import ALL_DRIVERS
 from selenium_driver_updater._setting import setting
 
 from selenium_driver_updater.util.requests_getter import RequestsGetter
+from selenium_driver_updater.util.file_lock import FileLock
+from selenium_driver_updater.util.endpoints import Endpoints
+from selenium_driver_updater.util.http_cache import HttpCache
+from selenium_driver_updater.util.tracer import Tracer
+from selenium_driver_updater.util.metrics_exporter import MetricsExporter
 
 from selenium_driver_updater.util.logger import logger
 from selenium_driver_updater.util.logger import levels
+from selenium_driver_updater.util.logger import override_level
 
-@dataclass
+@dataclass(frozen=True)
 class _info():
+    """Parameters of one install call, every call gets its own instance so concurrent calls do not see each other"""
 
     driver_name: Any = ''
 
-    path = ''
-    filename = ''
-    version = ''
+    path: str = ''
+    filename: Any = ''
+    version: Any = ''
     system_name: Any = ''
 
-    info_messages = False
+    info_messages: bool = False
 
-    check_browser = False
-    enable_library_update_check = True
+    check_browser: bool = False
+    enable_library_update_check: bool = True
+
+    max_workers: int = 4
+
+    offline: Optional[bool] = None
+    endpoints: Mapping[str, str] = field(default_factory=dict)
+
+    report_path: str = ''
+    metrics_path: str = ''
 
 class DriverUpdater():
     """Main class for working with all drivers"""
@@ -68,6 +87,11 @@ class DriverUpdater():
 
     arm = 'arm64'
 
+    #parameters of install() which install_matrix() takes too
+    _matrix_parameters = (
+        'info_messages', 'enable_library_update_check', 'max_workers', 'offline', 'endpoints', 'report_path', 'metrics_path',
+    )
+
     @staticmethod
     def install(driver_name, **kwargs):
         """Function for install or update Selenium driver binary
@@ -81,6 +105,11 @@ class DriverUpdater():
             check_browser (bool)                : If true, it will check browser version before specific driver update or upgrade. Defaults to False.
             enable_library_update_check (bool)  : If true, it will enable checking for library update while starting. Defaults to True.
             system_name (Union[str, list[str]]) : Specific OS for driver. Defaults to empty string.
+            max_workers (int)                   : How many drivers from list are installed at the same time. Defaults to 4.
+            offline (bool)                      : If true, drivers are installed only from imported bundle or earlier downloads, nothing is requested from network. Defaults to False.
+            endpoints (dict)                    : Base urls of upstreams like {"mirror": "http://mirror:8788/"} or {"api.github": url}. Defaults to environment variables or setting values.
+            report_path (str)                   : If given, json report with duration, bytes, cache hits and http status of every phase is written to this path. Defaults to empty string.
+            metrics_path (str)                  : If given, metrics of this call are written to this Prometheus textfile, like /var/lib/node_exporter/selenium_driver_updater.prom. Defaults to empty string.
 
         Returns:
             str
@@ -89,35 +118,187 @@ class DriverUpdater():
 
         """
         
-        _info.info_messages = bool(kwargs.get('info_messages', True))
-        DriverUpdater.__set_logging_level()
-        DriverUpdater.__initialize_info(driver_name, **kwargs)
+        #level of messages, endpoints and offline mode are visible only to this call and to threads it starts
+        with override_level(DriverUpdater.__get_logging_level(kwargs.get('info_messages', True))):
+            info = DriverUpdater.__initialize_info(driver_name, **kwargs)
+
+            with Endpoints.override(**info.endpoints), HttpCache.override(offline=info.offline), \
+                 Tracer.collect('install', driver_name=info.driver_name, system_name=info.system_name, path=info.path) as report:
+                driver_path = DriverUpdater.__install(info)
 
+            if info.report_path:
+                Tracer.write(report, info.report_path)
+
+            if info.metrics_path:
+                MetricsExporter.write_textfile(report, info.metrics_path)
+
+        return driver_path
+    
+    @staticmethod
+    def __install(info):
         try:
-            DriverUpdater.__check_enviroment_and_variables()
-            return DriverUpdater.__process_drivers()
-        except KeyboardInterrupt:
-            DriverUpdater.__cleanup_tmp_files()
-        except Exception:
+            DriverUpdater.__check_enviroment_and_variables(info)
+            return DriverUpdater.__process_drivers(info)
+        except KeyboardInterrupt as error:
+            Tracer.fail(error)
+            DriverUpdater.__cleanup_tmp_files(info)
+        except Exception as error:
+            Tracer.fail(error)
             logger.error(f'error: {str(traceback.format_exc())}')
             return ''
-    
+
+    @staticmethod
+    async def ainstall(driver_name, **kwargs):
+        """Coroutine which runs install() in the default executor of the loop, takes the same arguments as install()
+
+        It is not a native asyncio implementation, the whole blocking install() runs in a worker thread,
+        so the event loop is not blocked and many ainstall() calls awaited together are installed at the same time.
+        Level of messages, endpoints and offline mode are set per call and do not leak into other calls.
+
+        Args:
+            driver_name (Union[str, list[str]]) : Specified driver name/names which will be downloaded or updated. Like "DriverUpdater.chromedriver" or etc.
+            **kwargs                            : Parameters of install().
+
+        Returns:
+            str
+
+            driver_path (str)       : Path where Selenium driver binary was downloaded or updated, list of paths for list of names like install() returns.
+
+        """
+
+        loop = asyncio.get_running_loop()
+
+        #the call runs in a copy of the awaiting task context, like asyncio.to_thread does
+        return await loop.run_in_executor(
+            None, functools.partial(contextvars.copy_context().run, DriverUpdater.install, driver_name, **kwargs)
+            )
+
     @staticmethod
-    def __initialize_info(driver_name, **kwargs):
-        """Initialize the _info dataclass with provided parameters."""
+    def install_matrix(driver_name, system_name, path=None, **kwargs) -> dict:
+        """Function for downloading drivers for several OSes at once into folder of each OS, shared metadata is requested once
+
+        Args:
+            driver_name (list[str])             : Specified driver names. Like [DriverUpdater.chromedriver, DriverUpdater.geckodriver].
+            system_name (list[str])             : Specified OSes. Like [DriverUpdater.linux64, DriverUpdater.windows64, DriverUpdater.macos_m1].
+            path (str)                          : Folder where folder of each OS is created, like drivers/linux64/chromedriver. Defaults to current folder.
+            info_messages (bool)                : If false, it will disable all info messages. Defaults to True.
+            enable_library_update_check (bool)  : If true, it will enable checking for library update while starting. Defaults to True.
+            max_workers (int)                   : How many drivers are downloaded at the same time. Defaults to size of matrix.
+            offline (bool)                      : If true, drivers are installed only from imported bundle or earlier downloads. Defaults to False.
+            endpoints (dict)                    : Base urls of upstreams like {"mirror": "http://mirror:8788/"}. Defaults to environment variables or setting values.
+            report_path (str)                   : If given, json report of all drivers of matrix is written to this path. Defaults to empty string.
+            metrics_path (str)                  : If given, metrics of this call are written to this Prometheus textfile. Defaults to empty string.
+
+        Returns:
+            dict
+
+            driver_paths (dict) : Paths like {"linux64": {"chromedriver": "drivers/linux64/chromedriver"}}, empty path means driver was not installed.
+
+        """
+
+        unknown_parameters = [key for key in kwargs if key not in DriverUpdater._matrix_parameters]
+        if unknown_parameters:
+            message = (f'Unknown parameters of install_matrix were specified: {unknown_parameters}, '
+                       f'available parameters are: {list(DriverUpdater._matrix_parameters)}')
+            raise TypeError(message)
+
+        with override_level(DriverUpdater.__get_logging_level(kwargs.get('info_messages', True))):
+            driver_names = list(driver_name) if isinstance(driver_name, (list, tuple)) else [driver_name]
+            system_names = list(system_name) if isinstance(system_name, (list, tuple)) else [system_name]
+
+            for name in driver_names:
+                if name not in ALL_DRIVERS:
+                    DriverUpdater.__handle_invalid_driver_name(name)
+            for os_system in system_names:
+                DriverUpdater.__check_system_name_is_valid(system_name=os_system)
+
+            kwargs.setdefault('max_workers', len(driver_names) * len(system_names))
+            info = DriverUpdater.__initialize_info(driver_names, path=path, system_name=system_names, **kwargs)
+
+            #the same per-call setup as install(), so every cell sees endpoints and offline mode of this call
+            with Endpoints.override(**info.endpoints), HttpCache.override(offline=info.offline), \
+                 Tracer.collect('install_matrix', driver_name=info.driver_name, system_name=info.system_name, path=info.path) as report:
+                driver_paths = DriverUpdater.__install_matrix(info)
+
+            if info.report_path:
+                Tracer.write(report, info.report_path)
+
+            if info.metrics_path:
+                MetricsExporter.write_textfile(report, info.metrics_path)
+
+        return driver_paths
+
+    @staticmethod
+    def __install_matrix(info) -> dict:
+        driver_paths : dict = {os_system: {name: '' for name in info.driver_name} for os_system in info.system_name}
+
+        try:
+            DriverUpdater.__check_enviroment_and_variables(info)
+        except Exception as error:
+            Tracer.fail(error)
+            logger.error(f'error: {str(traceback.format_exc())}')
+            return driver_paths
+
+        cells = [(os_system, name) for os_system in info.system_name for name in info.driver_name]
+
+        with RequestsGetter.shared_responses(), \
+             ThreadPoolExecutor(max_workers=info.max_workers, thread_name_prefix='selenium_driver_updater') as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, DriverUpdater.__install_matrix_cell, info, *cell)
+                for cell in cells
+            ]
+            for (os_system, name), future in zip(cells, futures):
+                driver_paths[os_system][name] = future.result()
+
+        return driver_paths
+
+    @staticmethod
+    def __install_matrix_cell(info, system_name, driver_name) -> str:
+        path = os.path.join(info.path, system_name) + os.path.sep
+
+        try:
+            Path(path).mkdir(parents=True, exist_ok=True)
+
+            driver = ALL_DRIVERS[driver_name](
+                driver_name=driver_name, path=path, filename='', version='', check_browser=False,
+                info_messages=info.info_messages, system_name=system_name, progress_bar=False,
+                )
+
+            #failed cell is recorded in report by its span
+            with Tracer.span('driver', driver_name=driver_name, system_name=system_name, path=path), \
+                 FileLock(FileLock.get_driver_lock_path(path, driver_name), remove_on_release=True):
+                return driver.main()
+
+        except Exception:
+            logger.error(f'Could not install {driver_name} for {system_name}: {str(traceback.format_exc())}')
+            return ''
+
+    @staticmethod
+    def __initialize_info(driver_name, **kwargs) -> _info:
+        """Creates the _info dataclass of this call with provided parameters."""
         
         if any([kwargs.get('chmod') is not None,  kwargs.get('upgrade') is not None, kwargs.get('check_driver_is_up_to_date') is not None]):
             logger.warning('You are using one of the parameters chmod, upgrade, check_driver_is_up_to_date which have been deprecated, please remove it from your code')
         elif kwargs.get('check_browser_is_up_to_date'):
             logger.warning('Parameter check_browser_is_up_to_date is now check_browser, please rename it in your code')
 
-        _info.driver_name = driver_name
-        _info.path = DriverUpdater.__get_path(kwargs.get('path'))
-        _info.filename = DriverUpdater.__sanitize_filename(kwargs.get('filename'))
-        _info.enable_library_update_check = bool(kwargs.get('enable_library_update_check', True))
-        _info.version = DriverUpdater.__sanitize_version(kwargs.get('version'))
-        _info.check_browser = bool(kwargs.get('check_browser', False))
-        _info.system_name = kwargs.get('system_name', '')
+        offline = bool(kwargs['offline']) if kwargs.get('offline') is not None else None
+
+        return _info(
+            driver_name=driver_name,
+            path=DriverUpdater.__get_path(kwargs.get('path')),
+            filename=DriverUpdater.__sanitize_filename(kwargs.get('filename')),
+            version=DriverUpdater.__sanitize_version(kwargs.get('version')),
+            system_name=kwargs.get('system_name', ''),
+            info_messages=bool(kwargs.get('info_messages', True)),
+            check_browser=bool(kwargs.get('check_browser', False)),
+            enable_library_update_check=bool(kwargs.get('enable_library_update_check', True)) and not offline,
+            max_workers=max(int(kwargs.get('max_workers') or 4), 1),
+            offline=offline,
+            endpoints=MappingProxyType(dict(kwargs.get('endpoints') or {})),
+            report_path=str(kwargs.get('report_path') or ''),
+            metrics_path=str(kwargs.get('metrics_path') or ''),
+        )
 
     @staticmethod
     def __get_path(path):
@@ -139,34 +320,44 @@ class DriverUpdater():
         return str(version or '')
 
     @staticmethod
-    def __set_logging_level():
-        if _info.info_messages:
-            logger.setLevel(levels['info'])
-        else:
-            logger.setLevel(levels['error'])
+    def __get_logging_level(info_messages) -> int:
+        return levels['info'] if bool(info_messages) else levels['error']
 
     @staticmethod
-    def __process_drivers():
+    def __process_drivers(info):
         """Process the driver installation or update based on provided driver_name."""
-        if isinstance(_info.driver_name, str):
-            return DriverUpdater.__run_specific_driver()
-        elif isinstance(_info.driver_name, list):
-            return DriverUpdater.__process_multiple_drivers()
-
-    @staticmethod
-    def __process_multiple_drivers():
-        """Process installation or update for multiple drivers."""
-        list_of_paths = []
-        for i, driver in enumerate(_info.driver_name):
-            time.sleep(1)  # small sleep
-            driver_path = DriverUpdater.__run_specific_driver(
+        if isinstance(info.driver_name, str):
+            return DriverUpdater.__run_specific_driver(info)
+        elif isinstance(info.driver_name, list):
+            return DriverUpdater.__process_multiple_drivers(info)
+
+    @staticmethod
+    def __process_multiple_drivers(info):
+        """Process installation or update for multiple drivers concurrently, paths are returned in input order."""
+        parameters = [
+            dict(
                 driver_name=driver,
-                filename=DriverUpdater.__get_item_or_default(_info.filename, i),
-                system_name=DriverUpdater.__get_item_or_default(_info.system_name, i),
-                version=DriverUpdater.__get_item_or_default(_info.version, i),
-                index=i
+                filename=DriverUpdater.__get_item_or_default(info.filename, i),
+                system_name=DriverUpdater.__get_item_or_default(info.system_name, i),
+                version=DriverUpdater.__get_item_or_default(info.version, i),
+                index=i,
+                progress_bar=False,
             )
-            list_of_paths.append(driver_path)
+            for i, driver in enumerate(info.driver_name)
+        ]
+
+        max_workers = min(info.max_workers, len(parameters)) or 1
+        if max_workers == 1:
+            return [DriverUpdater.__run_specific_driver(info, **kwargs) for kwargs in parameters]
+
+        #every worker runs in its own copy of this call's context, so it sees endpoints and offline mode of this call
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='selenium_driver_updater') as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, DriverUpdater.__run_specific_driver, info, **kwargs)
+                for kwargs in parameters
+            ]
+            list_of_paths = [future.result() for future in futures]
+
         return list_of_paths
 
     @staticmethod
@@ -177,9 +368,9 @@ class DriverUpdater():
             return default
 
     @staticmethod
-    def __cleanup_tmp_files():
-        """Locate and remove any .tmp files left over after an interruption."""
-        tmp_files = glob.glob(os.path.join(_info.path, "*.tmp"))
+    def __cleanup_tmp_files(info):
+        """Locate and remove any .tmp files left over after an interruption. Partial .part downloads are kept to be resumed."""
+        tmp_files = glob.glob(os.path.join(info.path, "*.tmp"))
         for tmp_file in tmp_files:
             try:
                 os.remove(tmp_file)
@@ -187,47 +378,45 @@ class DriverUpdater():
                 pass
 
     @staticmethod
-    def __check_all_input_parameteres() -> None:
+    def __check_all_input_parameteres(info) -> None:
         """Private function for checking all input parameters"""
-        DriverUpdater.__check_path_validity()
-        DriverUpdater.__check_driver_name_type()
-        DriverUpdater.__check_filename_type()
-        DriverUpdater.__check_system_name_type()
-        DriverUpdater.__check_version_type()
-        DriverUpdater.__validate_system_names()
+        DriverUpdater.__check_path_validity(info)
+        DriverUpdater.__check_driver_name_type(info)
+        DriverUpdater.__check_filename_type(info)
+        DriverUpdater.__check_system_name_type(info)
+        DriverUpdater.__check_version_type(info)
+        DriverUpdater.__validate_system_names(info)
 
     @staticmethod
-    def __check_path_validity() -> None:
-        if not Path(_info.path).exists() and _info.path.endswith(os.path.sep):
-            message = f"The specified path does not exist. Current path is: {_info.path}. Trying to create this directory."
+    def __check_path_validity(info) -> None:
+        if not Path(info.path).exists() and info.path.endswith(os.path.sep):
+            message = f"The specified path does not exist. Current path is: {info.path}. Trying to create this directory."
             logger.error(message)
-            Path(_info.path).mkdir()
-            logger.info(f'Successfully created new directory at path: {_info.path}')
+            Path(info.path).mkdir()
+            logger.info(f'Successfully created new directory at path: {info.path}')
 
-        if not Path(_info.path).is_dir():
-            message = f"The specified path is not a directory. Current path is: {_info.path}"
+        if not Path(info.path).is_dir():
+            message = f"The specified path is not a directory. Current path is: {info.path}"
             raise NotADirectoryError(message)
 
     @staticmethod
-    def __check_driver_name_type() -> None:
-        if not isinstance(_info.driver_name, (list, str)):
-            message = f'The type of "driver_name" must be a list or str. Current type is: {type(_info.driver_name)}'
+    def __check_driver_name_type(info) -> None:
+        if not isinstance(info.driver_name, (list, str)):
+            message = f'The type of "driver_name" must be a list or str. Current type is: {type(info.driver_name)}'
             raise ValueError(message)
 
     @staticmethod
-    def __check_filename_type() -> None:
-        if _info.filename:
-            if isinstance(_info.driver_name, list) and isinstance(_info.filename, str):
-                _info.filename = [_info.filename]
-            DriverUpdater.__check_parameter_type_is_valid(_info.filename, type(_info.driver_name), 'filename')
+    def __check_filename_type(info) -> None:
+        if info.filename:
+            DriverUpdater.__check_parameter_type_is_valid(info.filename, type(info.driver_name), 'filename')
 
     @staticmethod
-    def __check_system_name_type() -> None:
-        if _info.system_name:
-            DriverUpdater.__check_parameter_type_is_valid(_info.system_name, type(_info.driver_name), 'system_name')
+    def __check_system_name_type(info) -> None:
+        if info.system_name:
+            DriverUpdater.__check_parameter_type_is_valid(info.system_name, type(info.driver_name), 'system_name')
 
     @staticmethod
-    def __check_version_type() -> None:
+    def __check_version_type(info) -> None:
         valid_versions = {
             'chromedriver_beta', 
             'chromedriver_dev', 
@@ -237,17 +426,17 @@ class DriverUpdater():
             'edgedriver_canary'
         }
 
-        if _info.version and _info.version not in valid_versions:
-            message = f"Invalid version specified: {_info.version}. Must be one of {', '.join(valid_versions)}."
+        if info.version and info.version not in valid_versions:
+            message = f"Invalid version specified: {info.version}. Must be one of {', '.join(valid_versions)}."
             raise ValueError(message)
 
     @staticmethod
-    def __validate_system_names() -> None:
-        if _info.system_name:
-            if isinstance(_info.driver_name, str):
-                DriverUpdater.__check_system_name_is_valid(system_name=_info.system_name)
-            elif isinstance(_info.driver_name, list):
-                for os_system in _info.system_name:
+    def __validate_system_names(info) -> None:
+        if info.system_name:
+            if isinstance(info.driver_name, str):
+                DriverUpdater.__check_system_name_is_valid(system_name=info.system_name)
+            elif isinstance(info.driver_name, list):
+                for os_system in info.system_name:
                     DriverUpdater.__check_system_name_is_valid(system_name=os_system)
 
     @staticmethod
@@ -319,57 +508,56 @@ class DriverUpdater():
             logger.warning(message)
 
     @staticmethod
-    def __check_enviroment_and_variables() -> None:
+    def __check_enviroment_and_variables(info) -> None:
         """Private function for checking all input parameters and enviroment"""
 
         DriverUpdater.__check_is_python_version_compatible_for_library()
 
-        if _info.enable_library_update_check:
+        if info.enable_library_update_check:
 
             DriverUpdater.__check_library_is_up_to_date()
 
-        DriverUpdater.__check_all_input_parameteres()
+        DriverUpdater.__check_all_input_parameteres(info)
 
     @staticmethod
-    def __run_specific_driver(**kwargs) -> str:
+    def __run_specific_driver(info, **kwargs) -> str:
         """Private function for running download or update for a specific driver."""
 
-        driver_name, filename, version, system_name = DriverUpdater.__extract_parameters(kwargs)
-        DriverUpdater.__set_driver_file_format(system_name, kwargs.get('index', None))
+        driver_name, filename, version, system_name = DriverUpdater.__extract_parameters(info, kwargs)
+
+        parameters = DriverUpdater.__create_parameters(info, driver_name, filename, version, system_name)
+        if 'progress_bar' in kwargs:
+            parameters.update(progress_bar=kwargs['progress_bar'])
 
         try:
-            driver = ALL_DRIVERS[driver_name](**DriverUpdater.__create_parameters(driver_name, filename, version, system_name))
+            driver = ALL_DRIVERS[driver_name](**parameters)
         except KeyError:
             DriverUpdater.__handle_invalid_driver_name(driver_name, kwargs.get('index', None))
 
-        driver_path = driver.main()
+        #processes installing the same driver into the same path wait here and then find it up to date
+        with Tracer.span('driver', driver_name=driver_name, system_name=system_name, path=parameters['path']), \
+             FileLock(FileLock.get_driver_lock_path(parameters['path'], driver_name), remove_on_release=True):
+            driver_path = driver.main()
+
         return driver_path
 
     @staticmethod
-    def __extract_parameters(kwargs):
-        driver_name = kwargs.get('driver_name', _info.driver_name)
-        filename = kwargs.get('filename', _info.filename)
-        version = kwargs.get('version', _info.version)
-        system_name = kwargs.get('system_name', _info.system_name)
+    def __extract_parameters(info, kwargs):
+        driver_name = kwargs.get('driver_name', info.driver_name)
+        filename = kwargs.get('filename', info.filename)
+        version = kwargs.get('version', info.version)
+        system_name = kwargs.get('system_name', info.system_name)
         return driver_name, filename, version, system_name
 
     @staticmethod
-    def __set_driver_file_format(system_name, index=None):
-        if _info.system_name:
-            if index is not None:
-                setting['Program']['DriversFileFormat'] = '.exe' if 'win' in _info.system_name[index] or 'arm' in _info.system_name[index] else ''
-            else:
-                setting['Program']['DriversFileFormat'] = '.exe' if 'win' in _info.system_name or 'arm' in _info.system_name else ''
-
-    @staticmethod
-    def __create_parameters(driver_name, filename, version, system_name):
+    def __create_parameters(info, driver_name, filename, version, system_name):
         return dict(
             driver_name=driver_name,
-            path=_info.path,
+            path=info.path,
             filename=filename,
             version=version,
-            check_browser=_info.check_browser,
-            info_messages=_info.info_messages,
+            check_browser=info.check_browser,
+            info_messages=info.info_messages,
             system_name=system_name
         )
 
@@ -0,0 +1,203 @@
+#Standart library imports
+import copy
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+
+# Local imports
+from selenium_driver_updater._setting import setting
+from selenium_driver_updater.driverUpdater import DriverUpdater
+from selenium_driver_updater.util.version_cache import DriverVersionCache
+from selenium_driver_updater.util.tracer import Tracer
+from selenium_driver_updater.util.logger import logger
+
+class DriverWatcher():
+    """Long-running service which keeps drivers up to date on a schedule and reports their state over local http"""
+
+    def __init__(self, driver_name, interval : Optional[float] = None, jitter : Optional[float] = None,
+                 status_host : Optional[str] = None, status_port : Optional[int] = None, **kwargs):
+        """Prepares watcher, all other keyword arguments are passed to DriverUpdater.install on every check
+
+        Args:
+            driver_name (Union[str, list[str]]) : Specified driver name/names which will be kept up to date.
+            interval (float)                    : Seconds between checks. Defaults to setting value.
+            jitter (float)                      : Maximum random seconds added to interval, so nodes do not poll at the same moment. Defaults to setting value.
+            status_host (str)                   : Host of local status endpoint. Defaults to setting value.
+            status_port (int)                   : Port of local status endpoint, 0 picks free port and negative disables endpoint. Defaults to setting value.
+
+        """
+
+        self.driver_name = driver_name
+        self.kwargs = kwargs
+
+        self.interval = float(interval if interval is not None else setting["Watch"]["interval"])
+        self.jitter = float(jitter if jitter is not None else setting["Watch"]["jitter"])
+        self.status_host = str(status_host or setting["Watch"]["statusHost"])
+        self.status_port = int(status_port if status_port is not None else setting["Watch"]["statusPort"])
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._server : Any = None
+
+        self.state : dict = dict(
+            started_at=time.time(), interval=self.interval, cycles=0, last_check=None, next_check=None, drivers={}
+            )
+
+    def run(self) -> None:
+        """Checks drivers until stop() is called or process is interrupted"""
+
+        self.start_status_server()
+
+        try:
+            while not self._stop_event.is_set():
+                self.check()
+
+                delay = self.get_delay()
+                with self._lock:
+                    self.state['next_check'] = time.time() + delay
+                logger.info(f'Next check of drivers in {round(delay)} seconds')
+
+                self._stop_event.wait(delay)
+        except KeyboardInterrupt:
+            logger.info('Watching of drivers was interrupted')
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        """Stops checking loop and status endpoint"""
+
+        self._stop_event.set()
+
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def check(self) -> dict:
+        """Installs or updates drivers once, the shared http pool and metadata cache stay warm between checks
+
+        Returns:
+            dict
+
+            status (dict) : Current state of watched drivers.
+
+        """
+
+        kwargs = dict(self.kwargs)
+        if self.state['cycles']:
+            #library update is checked once per process, not on every cycle
+            kwargs.update(enable_library_update_check=False)
+
+        checked_at = time.time()
+        with Tracer.collect('check') as report:
+            result = DriverUpdater.install(self.driver_name, **kwargs)
+
+        driver_names = self.driver_name if isinstance(self.driver_name, list) else [self.driver_name]
+        driver_paths = result if isinstance(result, list) else [result] * len(driver_names)
+
+        #version cache is empty right after new driver was downloaded, so version of installed plan is taken from report
+        versions = {
+            span['attributes'].get('driver_name'): str(span['attributes'].get('version') or '')
+            for span in Tracer._walk(report) if span['name'] == 'driver' and span['status'] == 'ok'
+            }
+
+        with self._lock:
+            self.state['cycles'] += 1
+            self.state['last_check'] = checked_at
+
+            for driver_name, driver_path in zip(driver_names, driver_paths):
+                entry = self.state['drivers'].setdefault(
+                    str(driver_name), dict(path='', version='', modified_at=None, checked_at=None, error='')
+                    )
+
+                if driver_path and os.path.exists(str(driver_path)):
+                    entry.update(
+                        path=str(driver_path), version=versions.get(driver_name) or DriverVersionCache.get(str(driver_path)),
+                        modified_at=os.path.getmtime(str(driver_path)), checked_at=checked_at, error=''
+                        )
+                else:
+                    entry.update(error='Driver was not installed or updated, see log for details')
+
+        return self.get_status()
+
+    def get_status(self) -> dict:
+        """Gets state of watched drivers, driver is fresh when it was successfully checked during last two intervals
+
+        Returns:
+            dict
+
+            status (dict) : Current state of watched drivers.
+
+        """
+
+        now = time.time()
+        max_age = 2 * self.interval + self.jitter
+
+        with self._lock:
+            status = copy.deepcopy(self.state)
+
+        for entry in status['drivers'].values():
+            entry['fresh'] = bool(entry['checked_at'] and not entry['error'] and now - entry['checked_at'] <= max_age)
+
+        status['fresh'] = bool(status['drivers']) and all(entry['fresh'] for entry in status['drivers'].values())
+
+        return status
+
+    def get_delay(self) -> float:
+        """Gets seconds until next check"""
+        return self.interval + random.uniform(0, max(self.jitter, 0))
+
+    def start_status_server(self) -> Optional[tuple]:
+        """Starts local http status endpoint in background thread
+
+        Returns:
+            tuple
+
+            address (tuple) : Host and port of endpoint or None if endpoint is disabled.
+
+        """
+
+        if self.status_port < 0 or self._server is not None:
+            return self._server.server_address if self._server is not None else None
+
+        self._server = ThreadingHTTPServer((self.status_host, self.status_port), _StatusHandler)
+        self._server.daemon_threads = True
+        setattr(self._server, 'watcher', self)
+
+        threading.Thread(target=self._server.serve_forever, name='selenium_driver_updater_status', daemon=True).start()
+
+        host, port = self._server.server_address[:2]
+        logger.info(f'Status of drivers is available at http://{host}:{port}/status')
+
+        return host, port
+
+class _StatusHandler(BaseHTTPRequestHandler):
+    """Serves /status, /status/<driver_name> and /health of watcher as json"""
+
+    def do_GET(self):
+        status = getattr(self.server, 'watcher').get_status()
+        path = self.path.split('?')[0].rstrip('/')
+
+        if path in ('', '/status'):
+            self._send_json(200, status)
+        elif path == '/health':
+            self._send_json(200 if status['fresh'] else 503, dict(fresh=status['fresh']))
+        elif path.startswith('/status/') and path[len('/status/'):] in status['drivers']:
+            self._send_json(200, status['drivers'][path[len('/status/'):]])
+        else:
+            self._send_json(404, dict(error=f'Unknown path: {self.path}'))
+
+    def _send_json(self, status_code : int, data : dict) -> None:
+        body = json.dumps(data, indent=1).encode('utf-8')
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
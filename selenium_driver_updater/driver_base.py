@@ -1,20 +1,26 @@
 #Standart library imports
-from typing import Any, Tuple
+from typing import Any
 from pathlib import Path
 import os
 import stat
 import subprocess
 import re
-import wget
+from urllib.parse import urlsplit
 
 #Local imports
 from selenium_driver_updater._setting import setting
 
 from selenium_driver_updater.util.extractor import Extractor
 from selenium_driver_updater.util.requests_getter import RequestsGetter
+from selenium_driver_updater.util.downloader import Downloader
+from selenium_driver_updater.util.driver_store import DriverStore
+from selenium_driver_updater.util.versions_index import ChromeVersionsIndex
+from selenium_driver_updater.util.version_cache import DriverVersionCache
+from selenium_driver_updater.util.driver_plan import DriverPlan
 from selenium_driver_updater.util.github_viewer import GithubViewer
+from selenium_driver_updater.util.tracer import Tracer
 from selenium_driver_updater.util.logger import logger
-from selenium_driver_updater.util.exceptions import DriverVersionInvalidException
+from selenium_driver_updater.util.exceptions import DriverVersionInvalidException, StatusCodeNotEqualException, GithubApiLimitException
 
 class DriverBase():
     "Base class for all drivers classes in selenium_driver_updater"
@@ -36,21 +42,31 @@ class DriverBase():
         self.version = str(kwargs.get('version'))
 
         self.info_messages = bool(kwargs.get('info_messages'))
+        self.progress_bar = bool(kwargs.get('progress_bar', self.info_messages))
 
         self.extractor = Extractor
         self.requests_getter = RequestsGetter
+        self.downloader = Downloader
         self.github_viewer = GithubViewer
+        self.driver_store = DriverStore
+        self.versions_index = ChromeVersionsIndex
+        self.version_cache = DriverVersionCache
+        self.tracer = Tracer
+
+        specific_system = str(kwargs.get('system_name') or '')
+        if specific_system:
+            self.file_format = '.exe' if 'win' in specific_system or 'arm' in specific_system else ''
+        else:
+            self.file_format = self.setting['Program']['DriversFileFormat']
 
         specific_filename = str(kwargs.get('filename'))
         if specific_filename:
-            self.filename = specific_filename + self.setting['Program']['DriversFileFormat']
+            self.filename = specific_filename + self.file_format
 
         driver_name = 'ms' + self.driver_name if self.driver_name == 'edgedriver' else self.driver_name
-        self.setting[self.driver_name_setting]['LastReleasePlatform'] = driver_name
-
-        self.setting[self.driver_name_setting]['LastReleasePlatform'] += self.setting['Program']['DriversFileFormat']
+        self.last_release_platform = driver_name + self.file_format
 
-        self.driver_path = self.path + self.setting[self.driver_name_setting]['LastReleasePlatform'] if not self.filename else self.path + self.filename
+        self.driver_path = self.path + self.last_release_platform if not self.filename else self.path + self.filename
 
         self.repo_name = str(kwargs.get('repo_name'))
 
@@ -103,21 +119,14 @@ class DriverBase():
 
             logger.info(f'Trying to give {self.driver_name} needed permissions')
 
-            file_st = os.stat(self.driver_path)
-            os.chmod(self.driver_path, file_st.st_mode | stat.S_IEXEC)
+            with self.tracer.span('chmod', path=self.driver_path):
+                file_st = os.stat(self.driver_path)
+                os.chmod(self.driver_path, file_st.st_mode | stat.S_IEXEC)
 
             logger.info(f'Needed rights for {self.driver_name} were successfully issued')
 
-    def _delete_current_driver_for_current_os(self) -> None:
-        """Deletes specific driver from folder if parameter "upgrade" is True"""
-
-        if Path(self.driver_path).exists():
-
-            logger.info(f'Deleted existing {self.driver_name} {self.driver_name}_path: {self.driver_path}')
-            Path(self.driver_path).unlink()
-
     def _get_current_version_driver(self) -> str:
-        """Gets current driver version via command in terminal
+        """Gets current driver version via command in terminal or from cache while driver binary is not changed
 
         Returns:
             str
@@ -137,11 +146,23 @@ class DriverBase():
 
             if Path(self.driver_path).exists():
 
-                with subprocess.Popen([self.driver_path, '--version'], stdout=subprocess.PIPE) as process:
-                    driver_version_terminal = process.communicate()[0].decode('UTF-8')
+                with self.tracer.span('verify', path=self.driver_path, cache='hit'):
+
+                    driver_version = self.version_cache.get(self.driver_path)
+
+                    if not driver_version:
 
-                find_string = re.findall(self.setting["Program"]["wedriverVersionPattern"], driver_version_terminal)
-                driver_version = find_string[0] if len(find_string) > 0 else ''
+                        self.tracer.set(cache='miss')
+
+                        with subprocess.Popen([self.driver_path, '--version'], stdout=subprocess.PIPE) as process:
+                            driver_version_terminal = process.communicate()[0].decode('UTF-8')
+
+                        find_string = re.findall(self.setting["Program"]["wedriverVersionPattern"], driver_version_terminal)
+                        driver_version = find_string[0] if len(find_string) > 0 else ''
+
+                        self.version_cache.store(self.driver_path, driver_version)
+
+                    self.tracer.set(version=driver_version)
 
                 logger.info(f'Current version of {self.driver_name}: {driver_version}')
 
@@ -150,97 +171,237 @@ class DriverBase():
 
         return driver_version
 
-    def _compare_current_version_and_latest_version(self) -> Tuple[bool, str, str]:
-        """Compares current version of driver to latest version
+    def _check_if_version_is_valid(self, url : str) -> None:
+        """Checks the specified version for existence."""
+
+        archive_name : str = url.split("/")[len(url.split("/"))-1]
+
+        find_string = re.findall(self.setting["Program"]["wedriverVersionPattern"], urlsplit(url).path)
+        driver_version = find_string[0] if len(find_string) > 0 else ''
+
+        if 'chromedriver' in archive_name:
+            archive_platform = archive_name.split('-', maxsplit=1)[1].split('.')[0]
+
+            version_valid : str = f"{driver_version}/{archive_platform}/{archive_name}"
+            json_data = self.versions_index.get_download_url(driver_version, archive_platform) if driver_version else ''
+        else:
+            url_test_valid = self.setting[self.driver_name_setting]["LinkCheckVersionIsValid"].format(driver_version)
+            version_valid : str = f"{driver_version}/{archive_name}"
+
+            json_data = self.requests_getter.get_result_by_request(url=url_test_valid)
+
+        if version_valid not in json_data or not driver_version:
+            message = ('Wrong version or system_name was specified.'
+                        f'version_valid: {version_valid} driver_version: {driver_version} url: {url}')
+            raise DriverVersionInvalidException(message)
+
+    def _get_version_from_url(self, url : str) -> str:
+        """Gets driver version from path of download url, host like 127.0.0.1 of a mirror must not be taken for version"""
+
+        find_string = re.findall(self.setting["Program"]["wedriverVersionPattern"], urlsplit(url).path)
+        return find_string[0].strip('.') if len(find_string) > 0 else ''
+
+    def _get_archive_platform(self, archive_name : str, driver_version : str) -> str:
+        """Gets platform of driver archive, like linux64 for chromedriver-linux64.zip"""
+
+        platform = re.sub(r'\.(zip|tar\.gz)$', '', archive_name)
+        platform = platform.replace(f'v{driver_version}-', '').replace(driver_version, '')
+        return re.sub(r'^[a-z]*driver[-_]', '', platform)
+
+    def plan(self) -> DriverPlan:
+        """Computes exact version and url of driver to install before any archive is downloaded
 
         Returns:
-            Tuple of bool, str and str
+            DriverPlan
 
-            is_driver_up_to_date (bool) : It true the driver is up to date. Defaults to False.
-            current_version (str)       : Current version of the driver.
-            latest_version (str)        : Latest version of the driver.
+            plan (DriverPlan) : Resolved installation target. If plan.is_up_to_date is True, nothing needs to be downloaded.
 
         """
 
-        is_driver_up_to_date : bool = False
-        current_version : str = ''
-        latest_version : str = ''
+        if self.version:
+            return self._plan_download(version=self.version)
+
+        plan = self._plan_download()
+
+        if not self.system_name:
 
-        current_version = self._get_current_version_driver()
+            current_version = self._get_current_version_driver()
 
-        if not current_version:
-            return is_driver_up_to_date, current_version, latest_version
+            if current_version and current_version == plan.version:
+                message = (f'Your existing {self.driver_name} is up to date. '
+                            f'current_version: {current_version} latest_version: {plan.version}')
+                logger.info(message)
 
-        latest_version = self._get_latest_version_driver()
+                return plan.up_to_date(current_version)
 
-        if current_version == latest_version:
-            is_driver_up_to_date = True
-            message = (f'Your existing {self.driver_name} is up to date. '
-                        f'current_version: {current_version} latest_version: {latest_version}')
-            logger.info(message)
+        if not plan.is_validated:
 
-        return is_driver_up_to_date, current_version, latest_version
+            import requests
 
-    def _compare_current_version_and_latest_version_github(self) -> Tuple[bool, str, str]:
-        """Compares current version of driver to latest version
+            try:
+                plan = self._validate_plan(plan)
+            except DriverVersionInvalidException as error:
+                logger.error(f'Problem with latest version of {self.driver_name}: {error}')
+                logger.info(f'Trying to download previous latest version of {self.driver_name}')
+
+                plan = self._plan_download(previous_version=True)
+            except (StatusCodeNotEqualException, GithubApiLimitException, requests.exceptions.RequestException) as error:
+                logger.warning(f'Could not check latest version of {self.driver_name} for existence: {error}')
+
+        return plan
+
+    def _make_plan(self, url : str, driver_version : str, validate : bool = False, reason : str = '') -> DriverPlan:
+        """Creates plan of specific download url and checks it for existence if needed
+
+        Args:
+            url (str)               : Download url of driver archive.
+            driver_version (str)    : Resolved version of driver.
+            validate (bool)         : If true, url is checked for existence unless driver is in driver store. Defaults to False.
+            reason (str)            : Why this version was chosen. Defaults to empty string.
 
         Returns:
-            Tuple of bool, str and str
+            DriverPlan
 
-            is_driver_up_to_date (bool) : It true the driver is up to date. Defaults to False.
-            current_version (str)       : Current version of the driver.
-            latest_version (str)        : Latest version of the driver.
+            plan (DriverPlan) : Resolved installation target.
 
         """
 
-        is_driver_up_to_date : bool = False
-        current_version : str = ''
-        latest_version : str = ''
+        archive_version = self._get_version_from_url(url)
+        platform = self._get_archive_platform(url.split("/")[-1], archive_version)
+        is_stored = self.driver_store.lookup(self.driver_name, archive_version, platform) is not None
 
-        current_version = self._get_current_version_driver()
+        plan = DriverPlan(
+            driver_name=self.driver_name, version=driver_version, url=url, driver_path=self.driver_path,
+            platform=platform, is_stored=is_stored, reason=reason
+            )
 
-        if not current_version:
-            return is_driver_up_to_date, current_version, latest_version
+        if validate:
+            plan = self._validate_plan(plan)
 
-        latest_version = self._get_latest_version_driver_github()
+        return plan
 
-        if current_version == latest_version:
-            is_driver_up_to_date = True
-            message = (f'Your existing {self.driver_name} is up to date. '
-                       f'current_version: {current_version} latest_version: {latest_version}')
-            logger.info(message)
+    def _validate_plan(self, plan : DriverPlan) -> DriverPlan:
+        """Checks url of plan for existence, stored drivers are not checked"""
 
-        return is_driver_up_to_date, current_version, latest_version
+        if not plan.is_stored:
+            self._check_if_version_is_valid(url=plan.url)
 
-    def _check_if_version_is_valid(self, url : str) -> None:
-        """Checks the specified version for existence."""
+        return plan.validated()
 
-        archive_name : str = url.split("/")[len(url.split("/"))-1]
+    def _install_plan(self, plan : DriverPlan) -> str:
+        """Downloads or installs from driver store the driver of resolved plan
 
-        find_string = re.findall(self.setting["Program"]["wedriverVersionPattern"], url)
-        driver_version = find_string[0] if len(find_string) > 0 else ''
+        Args:
+            plan (DriverPlan) : Resolved installation target.
 
-        if 'chromedriver' in archive_name:
-            url_test_valid = self.setting[self.driver_name_setting]["LinkCheckVersionIsValid"]
-            archive_platform = archive_name.split('-', maxsplit=1)[1].split('.')[0]
+        Returns:
+            str
+
+            driver_path (str) : Path to unzipped driver.
+
+        """
+
+        self.tracer.set(
+            version=plan.version, reason=plan.reason, is_up_to_date=plan.is_up_to_date, is_stored=plan.is_stored
+            )
+
+        if plan.is_up_to_date:
+            return self.driver_path
+
+        #current driver is not deleted, new one replaces it atomically, so the driver path is never missing
+        return self._download_and_extract_driver(url=plan.url)
+
+    def _download_and_extract_driver(self, url : str) -> str:
+        """Installs driver from driver store or downloads and extracts driver archive and adds it to the store
+
+        Args:
+            url (str) : Download url of driver archive.
+
+        Returns:
+            str
+
+            driver_path (str) : Path to unzipped driver.
+
+        """
+
+        archive_name = url.split("/")[-1]
+        driver_version = self._get_version_from_url(url)
+        platform = self._get_archive_platform(archive_name, driver_version)
+
+        entry = self.driver_store.lookup(self.driver_name, driver_version, platform)
+        if entry:
+
+            logger.info(f'Found {self.driver_name} {driver_version} {platform} in driver store, installing without download')
+            with self.tracer.span('store', sha256=entry['sha256']):
+                self.driver_store.install(entry, self.driver_path)
+
+        elif archive_name.endswith('.tar.gz') and self._stream_and_extract_driver(url):
+
+            self.driver_store.add(self.driver_name, driver_version, platform, self.driver_path)
 
-            version_valid : str = f"{driver_version}/{archive_platform}/{archive_name}"
         else:
-            url_test_valid = self.setting[self.driver_name_setting]["LinkCheckVersionIsValid"].format(driver_version)
-            version_valid : str = f"{driver_version}/{archive_name}"
 
-        json_data = self.requests_getter.get_result_by_request(url=url_test_valid)
+            out_path = self.path + archive_name
 
-        if version_valid not in json_data or not driver_version:
-            message = ('Wrong version or system_name was specified.'
-                        f'version_valid: {version_valid} driver_version: {driver_version} url: {url}')
-            raise DriverVersionInvalidException(message)
-        
-    def _custom_bar(self, current, total, width=80):
-        return wget.bar_adaptive(round(current/1024/1024, 2), round(total/1024/1024, 2), width) + ' MB' + " "
-    
-    def _wget_download_driver(self, url, path):
-        bar = self._custom_bar if self.info_messages else None
-
-        archive_path = wget.download(url=url, out=path, bar=bar)
-        return archive_path
+            if Path(out_path).exists():
+                Path(out_path).unlink()
+
+            logger.info(f'Started download {self.driver_name} by url: {url}')
+            archive_path = self.downloader.download(url, out_path, progress_bar=self.progress_bar)
+
+            logger.info(f'\r\n{self.driver_name.capitalize()} was downloaded to path: {archive_path}')
+
+            parameters = dict(archive_path=archive_path, out_path=self.path)
+
+            if not self.filename:
+
+                self.extractor.extract_and_detect_archive_format(**parameters)
+
+            else:
+
+                parameters.update(dict(filename=self.last_release_platform, filename_replace=self.filename))
+
+                self.extractor.extract_all_zip_archive_with_specific_name(**parameters)
+
+            if Path(archive_path).exists():
+                Path(archive_path).unlink()
+
+            self.driver_store.add(self.driver_name, driver_version, platform, self.driver_path)
+
+        driver_path = self.driver_path
+
+        logger.info(f'{self.driver_name.capitalize()} was successfully unpacked by path: {driver_path}')
+
+        self._chmod_driver()
+
+        return driver_path
+
+    def _stream_and_extract_driver(self, url : str) -> bool:
+        """Extracts driver from tar.gz archive while it is being downloaded, archive is never written to disk
+
+        Args:
+            url (str) : Download url of tar.gz driver archive.
+
+        Returns:
+            bool
+
+            is_extracted (bool) : False if streaming failed and archive has to be downloaded to disk.
+
+        """
+
+        parameters = dict(out_path=self.path)
+        if self.filename:
+            parameters.update(dict(filename=self.last_release_platform, filename_replace=self.filename))
+
+        logger.info(f'Started streaming download and extraction of {self.driver_name} by url: {url}')
+
+        try:
+            with self.downloader.open_stream(url, progress_bar=self.progress_bar) as stream:
+                self.extractor.extract_tar_gz_stream(fileobj=stream, **parameters)
+        except StatusCodeNotEqualException:
+            raise
+        except Exception as error:
+            logger.warning(f'Could not extract {self.driver_name} while downloading: {error}, downloading archive to disk')
+            return False
+
+        return True
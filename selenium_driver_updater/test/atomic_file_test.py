@@ -0,0 +1,20 @@
+import pytest
+
+from selenium_driver_updater.util.atomic_file import AtomicFile
+
+def test_write_and_copy(tmp_path):
+    path = str(tmp_path / 'folder' / 'index.json')
+
+    AtomicFile.write_text(path, '{}')
+    AtomicFile.copy(path, str(tmp_path / 'copy' / 'index.json'))
+
+    assert (tmp_path / 'copy' / 'index.json').read_text(encoding='utf-8') == '{}'
+    assert sorted(file.name for file in (tmp_path / 'folder').iterdir()) == ['index.json']
+
+def test_failed_write_leaves_no_part_file(tmp_path):
+    (tmp_path / 'index.json').mkdir()
+
+    with pytest.raises(OSError):
+        AtomicFile.write_bytes(str(tmp_path / 'index.json'), b'{}')
+
+    assert [file.name for file in tmp_path.iterdir()] == ['index.json']
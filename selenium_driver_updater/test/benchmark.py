@@ -0,0 +1,217 @@
+#Standart library imports
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+#Local imports
+from selenium_driver_updater.driverUpdater import DriverUpdater
+from selenium_driver_updater.util.driver_store import DriverStore
+from selenium_driver_updater.util.endpoints import Endpoints
+from selenium_driver_updater.util.http_cache import HttpCache
+from selenium_driver_updater.util.tracer import Tracer
+from selenium_driver_updater.test.fake_upstream import FakeUpstream
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baseline.json')
+
+#phases of Tracer report which are timed, durations of parallel spans are summed
+PHASES = ('browser', 'resolve', 'fetch', 'github', 'verify', 'download', 'extract', 'store', 'chmod')
+
+def _install_single(path : str) -> list:
+    return [DriverUpdater.install('chromedriver', path=path, info_messages=False)]
+
+def _install_multi(path : str) -> list:
+    return DriverUpdater.install(['chromedriver', 'geckodriver', 'edgedriver', 'operadriver'], path=path, info_messages=False)
+
+def _install_matrix(path : str) -> list:
+    driver_paths = DriverUpdater.install_matrix(
+        ['chromedriver', 'geckodriver', 'operadriver'], ['linux64', 'win64', 'mac64'], path=path, info_messages=False,
+        )
+    return [driver_path for paths in driver_paths.values() for driver_path in paths.values()]
+
+#name: (install function, if true the same install is run once before it is timed, so drivers are up to date)
+WORKLOADS : dict = {
+    'single'            : (_install_single, False),
+    'single_up_to_date' : (_install_single, True),
+    'multi'             : (_install_multi, False),
+    'matrix'            : (_install_matrix, False),
+}
+
+def run_workload(name : str, upstream : FakeUpstream, url : str) -> dict:
+    """Runs install of workload with empty http cache and driver store against fake upstream
+
+    Args:
+        name (str)                  : Name of workload in WORKLOADS.
+        upstream (FakeUpstream)     : Started fake upstream.
+        url (str)                   : Base url of fake upstream.
+
+    Returns:
+        dict
+
+        result (dict) : Duration, durations of phases, requests by upstream and bytes sent by upstream.
+
+    """
+
+    install, prepare = WORKLOADS[name]
+
+    with tempfile.TemporaryDirectory() as folder, Endpoints.override(mirror=url), \
+         HttpCache.override(enabled=True, offline=False, path=os.path.join(folder, 'cache')), \
+         DriverStore.override(enabled=True, path=os.path.join(folder, 'store')):
+
+        path = os.path.join(folder, 'drivers') + os.path.sep
+        Path(path).mkdir()
+
+        if prepare:
+            install(path)
+
+        upstream.reset()
+
+        started = time.perf_counter()
+        with Tracer.collect('benchmark', workload=name) as report:
+            driver_paths = install(path)
+        duration = time.perf_counter() - started
+
+    if not driver_paths or not all(driver_paths):
+        message = f'Workload {name} did not install all drivers: {driver_paths}'
+        raise RuntimeError(message)
+
+    return dict(
+        duration=round(duration, 4),
+        phases={phase: round(report['summary'].get(phase, {}).get('duration', 0.0), 4) for phase in PHASES},
+        requests=dict(sorted(upstream.requests.items())),
+        bytes=upstream.sent_bytes,
+        )
+
+def run_benchmarks(latency : float, bandwidth : int, rounds : int = 1, workloads : Optional[list] = None,
+                   on_result : Optional[Callable] = None) -> dict:
+    """Runs workloads against fake upstream, every workload is run once to warm up before it is timed
+
+    Args:
+        latency (float)         : Seconds before every response of fake upstream.
+        bandwidth (int)         : Bytes per second of every response body of fake upstream.
+        rounds (int)            : How many times workload is timed, the fastest round is kept. Defaults to 1.
+        workloads (list)        : Names of workloads. Defaults to all WORKLOADS.
+        on_result (Callable)    : Called with name and result of every workload. Defaults to None.
+
+    Returns:
+        dict
+
+        results (dict) : Results of workloads like {"single": {"duration": 0.5, ...}}.
+
+    """
+
+    results : dict = {}
+
+    upstream = FakeUpstream(latency=latency, bandwidth=bandwidth)
+    with upstream as url:
+        for name in workloads or list(WORKLOADS):
+
+            run_workload(name, upstream, url)
+
+            timed = [run_workload(name, upstream, url) for _ in range(max(rounds, 1))]
+            results[name] = min(timed, key=lambda result: result['duration'])
+
+            if on_result:
+                on_result(name, results[name])
+
+    return results
+
+def compare(results : dict, baseline : dict, tolerance : float = 2.0, slack : float = 0.25) -> list:
+    """Compares results with baseline, requests must match exactly, sent bytes may differ by 1%,
+    durations may be tolerance times slower plus slack seconds
+
+    Args:
+        results (dict)      : Results of run_benchmarks().
+        baseline (dict)     : Baseline like in benchmark_baseline.json.
+        tolerance (float)   : Allowed factor of slowdown. Defaults to 2.
+        slack (float)       : Allowed seconds of slowdown, so short phases do not fail on noise. Defaults to 0.25.
+
+    Returns:
+        list
+
+        regressions (list) : Messages about every regression, empty list if there are none.
+
+    """
+
+    regressions = []
+
+    for name, expected in baseline['workloads'].items():
+        measured : Any = results.get(name)
+
+        if measured is None:
+            regressions.append(f'{name}: workload was not run')
+            continue
+
+        if measured['requests'] != expected['requests']:
+            regressions.append(f'{name}: requests {measured["requests"]} differ from baseline {expected["requests"]}')
+
+        if abs(measured['bytes'] - expected['bytes']) > expected['bytes'] * 0.01:
+            regressions.append(f'{name}: sent bytes {measured["bytes"]} differ from baseline {expected["bytes"]}')
+
+        durations = [('duration', measured['duration'], expected['duration'])]
+        durations += [(phase, measured['phases'].get(phase, 0.0), duration) for phase, duration in expected['phases'].items()]
+
+        for phase, duration, expected_duration in durations:
+            limit = expected_duration * tolerance + slack
+            if duration > limit:
+                regressions.append(f'{name}: {phase} took {duration:.3f}s, baseline is {expected_duration:.3f}s, limit is {limit:.3f}s')
+
+    return regressions
+
+def read_baseline(baseline_path : str = BASELINE_PATH) -> dict:
+    """Reads baseline json file"""
+
+    return json.loads(Path(baseline_path).read_text(encoding='utf-8'))
+
+def write_baseline(results : dict, latency : float, bandwidth : int, baseline_path : str = BASELINE_PATH) -> None:
+    """Writes results with settings of fake upstream as baseline json file"""
+
+    baseline = dict(latency=latency, bandwidth=bandwidth, workloads=results)
+    Path(baseline_path).write_text(json.dumps(baseline, indent=4) + '\n', encoding='utf-8')
+
+def main(argv : Optional[list] = None) -> int:
+    """Runs benchmarks from command line, like python -m selenium_driver_updater.test.benchmark --rounds 5"""
+
+    baseline = read_baseline() if Path(BASELINE_PATH).exists() else dict(latency=0.02, bandwidth=100_000_000, workloads={})
+
+    parser = argparse.ArgumentParser(description='Times DriverUpdater installs against local fake upstream')
+    parser.add_argument('--workload', action='append', choices=list(WORKLOADS), help='Workload to run, all by default')
+    parser.add_argument('--latency', type=float, default=baseline['latency'], help='Seconds before every response')
+    parser.add_argument('--bandwidth', type=int, default=baseline['bandwidth'], help='Bytes per second of every response')
+    parser.add_argument('--rounds', type=int, default=3, help='How many times workload is timed, the fastest round is kept')
+    parser.add_argument('--tolerance', type=float, default=2.0, help='Allowed factor of slowdown from baseline')
+    parser.add_argument('--update-baseline', action='store_true', help='Write results as new baseline')
+    parser.add_argument('--output', default='', help='Path of json file with results')
+    args = parser.parse_args(argv)
+
+    def print_result(name, result):
+        phases = ' '.join(f'{phase}={duration:.3f}' for phase, duration in result['phases'].items() if duration)
+        print(f'{name:<18} {result["duration"]:>8.3f}s {sum(result["requests"].values()):>3} requests {result["bytes"]:>10} bytes  {phases}')
+
+    results = run_benchmarks(args.latency, args.bandwidth, args.rounds, args.workload, on_result=print_result)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=4) + '\n', encoding='utf-8')
+
+    if args.update_baseline:
+        write_baseline(results, args.latency, args.bandwidth)
+        print(f'Baseline was written to {BASELINE_PATH}')
+        return 0
+
+    if (args.latency, args.bandwidth) != (baseline['latency'], baseline['bandwidth']):
+        print('Latency or bandwidth differ from baseline, results are not compared')
+        return 0
+
+    baseline['workloads'] = {name: result for name, result in baseline['workloads'].items() if name in results}
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f'REGRESSION {regression}')
+
+    return int(bool(regressions))
+
+if __name__ == '__main__':
+    sys.exit(main())
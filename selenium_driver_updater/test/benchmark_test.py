@@ -0,0 +1,61 @@
+import math
+import os
+import time
+
+import pytest
+import requests
+
+from selenium_driver_updater.test import benchmark
+from selenium_driver_updater.test.fake_upstream import FakeUpstream, get_known_good_versions
+
+pytestmark = pytest.mark.skipif(os.name == 'nt', reason='drivers of fake upstream are shell scripts')
+
+def test_fake_upstream_simulates_latency_and_bandwidth():
+    known_good_versions = get_known_good_versions()
+    upstream = FakeUpstream(latency=0.2, bandwidth=20_000_000)
+
+    with upstream as url:
+        started = time.perf_counter()
+        response = requests.get(url + 'chrome-for-testing/LATEST_RELEASE_119', timeout=10)
+        assert response.text == '119.0.6045.299'
+        assert time.perf_counter() - started >= 0.2
+
+        started = time.perf_counter()
+        response = requests.get(url + 'chrome-for-testing/known-good-versions-with-downloads.json', timeout=10)
+        assert response.content == known_good_versions
+        assert time.perf_counter() - started >= 0.2 + len(known_good_versions) / 20_000_000 * 0.9
+
+        assert requests.get(url + 'chrome-for-testing/missing.json', timeout=10).status_code == 404
+
+    assert len(known_good_versions) > 5_000_000
+    assert upstream.requests == {'chrome-for-testing': 3}
+
+def test_compare_with_baseline():
+    baseline = dict(workloads=dict(single=dict(duration=1.0, phases=dict(download=0.5), requests={'pypi': 1}, bytes=1000)))
+
+    assert not benchmark.compare(dict(single=dict(duration=2.2, phases=dict(download=1.2), requests={'pypi': 1}, bytes=1005)), baseline)
+
+    regressions = benchmark.compare(dict(single=dict(duration=2.3, phases=dict(download=1.3), requests={'pypi': 2}, bytes=1100)), baseline)
+    assert [regression.split(':')[1].split()[0] for regression in regressions] == ['requests', 'sent', 'duration', 'download']
+
+    assert benchmark.compare({}, baseline) == ['single: workload was not run']
+
+def test_benchmarks_do_not_regress_from_baseline():
+    baseline = benchmark.read_baseline()
+
+    #wall clock depends on load of the machine, so durations are compared only on request, requests and bytes always
+    if os.environ.get('SELENIUM_DRIVER_UPDATER_BENCHMARK') == '1':
+        tolerance = float(os.environ.get('SELENIUM_DRIVER_UPDATER_BENCHMARK_TOLERANCE', 2.0))
+    else:
+        tolerance = math.inf
+
+    results = benchmark.run_benchmarks(baseline['latency'], baseline['bandwidth'])
+
+    assert set(results) == set(baseline['workloads'])
+    assert not benchmark.compare(results, baseline, tolerance), 'run python -m selenium_driver_updater.test.benchmark --update-baseline after intended changes'
+
+def test_compare_without_durations():
+    baseline = dict(workloads=dict(single=dict(duration=1.0, phases=dict(download=0.5), requests={'pypi': 1}, bytes=1000)))
+
+    assert not benchmark.compare(dict(single=dict(duration=60.0, phases=dict(download=30.0), requests={'pypi': 1}, bytes=1000)), baseline, math.inf)
+    assert benchmark.compare(dict(single=dict(duration=60.0, phases=dict(download=30.0), requests={'pypi': 2}, bytes=1000)), baseline, math.inf)
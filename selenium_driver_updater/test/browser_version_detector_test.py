@@ -0,0 +1,90 @@
+import os
+import platform
+from pathlib import Path
+
+import pytest
+
+from selenium_driver_updater.browsers._browserVersionDetector import BrowserVersionDetector
+from selenium_driver_updater.browsers._firefoxBrowser import FirefoxBrowser
+
+pytestmark = pytest.mark.skipif(platform.system() != 'Linux', reason='On-disk artifacts are only detected on Linux')
+
+DPKG_STATUS = """Package: google-chrome-stable
+Status: install ok installed
+Version: 120.0.6099.109-1
+
+Package: microsoft-edge-stable
+Status: deinstall ok config-files
+Version: 119.0.2151.97-1
+
+Package: firefox
+Status: install ok installed
+Version: 1:1snap1-0ubuntu5
+"""
+
+@pytest.fixture()
+def detector(tmp_path, monkeypatch):
+    dpkg_status_path = tmp_path / 'status'
+    dpkg_status_path.write_text(DPKG_STATUS)
+
+    browsers = {name: dict(sources, binaries=[], directories=[str(tmp_path / name)]) for name, sources in BrowserVersionDetector.browsers.items()}
+
+    monkeypatch.setattr(BrowserVersionDetector, 'dpkg_status_path', str(dpkg_status_path))
+    monkeypatch.setattr(BrowserVersionDetector, 'config_path', str(tmp_path / 'config'))
+    monkeypatch.setattr(BrowserVersionDetector, 'browsers', browsers)
+
+    BrowserVersionDetector.clear()
+    yield BrowserVersionDetector, tmp_path
+    BrowserVersionDetector.clear()
+
+def test_version_from_dpkg(detector):
+    version_detector, _ = detector
+    assert version_detector.get_version('chrome') == '120.0.6099.109'
+
+def test_version_from_application_ini(detector):
+    version_detector, tmp_path = detector
+
+    Path(tmp_path / 'firefox').mkdir()
+    Path(tmp_path / 'firefox' / 'application.ini').write_text('[App]\nVendor=Mozilla\nName=Firefox\nVersion=128.0.3\n')
+
+    assert version_detector.get_version('firefox') == '128.0.3'
+
+def test_version_from_version_directory_and_last_version(detector):
+    version_detector, tmp_path = detector
+
+    assert version_detector.get_version('edge') == ''
+
+    Path(tmp_path / 'config' / 'microsoft-edge').mkdir(parents=True)
+    Path(tmp_path / 'config' / 'microsoft-edge' / 'Last Version').write_text('118.0.2088.76')
+    assert version_detector.get_version('edge') == '118.0.2088.76'
+
+    for version in ('119.0.2151.97', '119.0.2151.100', 'locales'):
+        Path(tmp_path / 'edge' / version).mkdir(parents=True)
+    assert version_detector.get_version('edge') == '119.0.2151.100'
+
+def test_cached_artifact_is_invalidated(detector):
+    version_detector, tmp_path = detector
+
+    status_path = tmp_path / 'status'
+    assert version_detector.get_version('chrome') == '120.0.6099.109'
+
+    status_path.write_text(DPKG_STATUS.replace('120.0.6099.109', '121.0.6167.85'))
+    os.utime(status_path, ns=(0, 1))
+
+    assert version_detector.get_version('chrome') == '121.0.6167.85'
+
+def test_browser_does_not_launch_webdriver(detector, monkeypatch):
+    _, tmp_path = detector
+
+    Path(tmp_path / 'firefox').mkdir()
+    Path(tmp_path / 'firefox' / 'application.ini').write_text('[App]\nVersion=128.0.3\n')
+
+    firefox_browser = FirefoxBrowser(path=str(tmp_path / 'geckodriver'), check_browser=True)
+    Path(firefox_browser.geckodriver_path).write_text('')
+
+    def webdriver_launch(*args, **kwargs):
+        raise AssertionError('WebDriver must not be launched')
+
+    monkeypatch.setattr('selenium.webdriver.Firefox', webdriver_launch)
+
+    assert firefox_browser._get_current_version_firefox_browser_selenium() == '128.0.3'
@@ -55,14 +55,6 @@ def test_get_current_version_chrome_selenium_failure(chrome_driver_setup):
     current_version = chrome_driver_failure._get_current_version_driver()
     assert len(current_version) == 0
 
-def test_compare_current_version_and_latest_version_failure(chrome_driver_setup):
-    """Test comparing current and latest versions with failure."""
-    _, chrome_driver_failure = chrome_driver_setup
-    is_driver_is_up_to_date, current_version, latest_version = chrome_driver_failure._compare_current_version_and_latest_version()
-    assert not is_driver_is_up_to_date
-    assert len(current_version) == 0
-    assert len(latest_version) == 0
-
 def test_if_version_is_valid_failure(chrome_driver_setup):
     """Test if a specific version is valid with failure."""
     _, chrome_driver_failure = chrome_driver_setup
@@ -92,10 +84,11 @@ def test_get_latest_version_driver(chrome_driver_setup):
 def test_download_driver_specific_version(setup_paths):
     """Test downloading a specific version of ChromeDriver."""
     chrome_driver, chromedriver_path = setup_paths
-    chrome_driver._delete_current_driver_for_current_os()
+    if Path(chrome_driver.driver_path).exists():
+        Path(chrome_driver.driver_path).unlink()
     assert not Path(chromedriver_path).exists()
 
-    file_name = chrome_driver._download_driver(version='chromedriver_beta')
+    file_name = chrome_driver._install_plan(chrome_driver._plan_download(version='chromedriver_beta'))
     assert file_name is not None
     assert len(file_name) > 0
     assert Path(chromedriver_path).exists()
@@ -109,10 +102,11 @@ def test_download_driver_specific_version(setup_paths):
 def test_download_driver_latest_previous_version(setup_paths):
     """Test downloading the latest previous version of ChromeDriver."""
     chrome_driver, chromedriver_path = setup_paths
-    chrome_driver._delete_current_driver_for_current_os()
+    if Path(chrome_driver.driver_path).exists():
+        Path(chrome_driver.driver_path).unlink()
     assert not Path(chromedriver_path).exists()
 
-    file_name = chrome_driver._download_driver(previous_version=True)
+    file_name = chrome_driver._install_plan(chrome_driver._plan_download(previous_version=True))
     assert file_name is not None
     assert len(file_name) > 0
     assert Path(chromedriver_path).exists()
@@ -130,22 +124,22 @@ def test_download_driver(setup_paths):
     assert latest_version is not None
     assert len(latest_version) > 0
 
-    file_name = chrome_driver._download_driver()
+    file_name = chrome_driver._install_plan(chrome_driver._plan_download())
     assert file_name is not None
     assert len(file_name) > 0
     assert Path(chromedriver_path).exists()
 
     chrome_driver._chmod_driver()
 
-def test_compare_current_version_and_latest_version(chrome_driver_setup):
-    """Test comparing current and latest versions."""
+def test_plan_is_up_to_date(chrome_driver_setup):
+    """Test plan of driver which is up to date."""
     chrome_driver, _ = chrome_driver_setup
-    is_driver_is_up_to_date, current_version, latest_version = chrome_driver._compare_current_version_and_latest_version()
-    assert is_driver_is_up_to_date
-    assert current_version is not None
-    assert len(current_version) > 0
-    assert latest_version is not None
-    assert len(latest_version) > 0
+    plan = chrome_driver.plan()
+    assert plan.is_up_to_date
+    assert plan.current_version is not None
+    assert len(plan.current_version) > 0
+    assert plan.version is not None
+    assert len(plan.version) > 0
 
 def test_chromedriver_is_up_to_date(chrome_driver_setup):
     """Test if ChromeDriver is up to date."""
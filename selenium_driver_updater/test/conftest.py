@@ -0,0 +1,21 @@
+import os
+
+import pytest
+
+from selenium_driver_updater._setting import setting
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path_factory, monkeypatch):
+    """Keeps http cache, driver store, indexes and lock files of every test out of cache directory of the developer"""
+
+    cache_dir = str(tmp_path_factory.mktemp('cache')) + os.path.sep
+
+    #subprocesses of tests read cache directory from environment
+    monkeypatch.setenv('SELENIUM_DRIVER_UPDATER_CACHE_DIR', cache_dir)
+    monkeypatch.delenv('SELENIUM_DRIVER_UPDATER_STORE_DIR', raising=False)
+
+    monkeypatch.setitem(setting['Cache'], 'path', cache_dir)
+    monkeypatch.setitem(setting['Cache'], 'storePath', cache_dir + 'store' + os.path.sep)
+    monkeypatch.setitem(setting['Mirror'], 'path', cache_dir + 'mirror' + os.path.sep)
+
+    return cache_dir
@@ -0,0 +1,195 @@
+import gzip
+import io
+import os
+import sys
+import tarfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from selenium_driver_updater._geckoDriver import GeckoDriver
+from selenium_driver_updater.util.downloader import Downloader
+from selenium_driver_updater.util.exceptions import StatusCodeNotEqualException
+
+BODY = bytes(range(256)) * 1024
+ETAG = '"archive-v1"'
+
+class _RangeHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    ranges = []
+    interrupt = True
+    support_range = True
+    wrong_range = False
+    gzip = False
+    accept_encodings = []
+
+    def do_GET(self):
+        _RangeHandler.accept_encodings.append(self.headers.get('Accept-Encoding'))
+
+        if self.path == '/archive.zip' and _RangeHandler.gzip:
+            body = gzip.compress(BODY)
+            self.send_response(200)
+            self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        if self.path != '/archive.zip':
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        requested_range = self.headers.get('Range')
+        _RangeHandler.ranges.append(requested_range)
+
+        offset = 0
+        if requested_range and _RangeHandler.wrong_range:
+            _RangeHandler.wrong_range = False
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes 0-{len(BODY) - 1}/{len(BODY)}')
+        elif requested_range and _RangeHandler.support_range and self.headers.get('If-Range') == ETAG:
+            offset = int(requested_range.split('=')[1].rstrip('-'))
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {offset}-{len(BODY) - 1}/{len(BODY)}')
+        else:
+            self.send_response(200)
+
+        self.send_header('ETag', ETAG)
+        self.send_header('Content-Length', str(len(BODY) - offset))
+        self.end_headers()
+
+        if _RangeHandler.interrupt:
+            _RangeHandler.interrupt = False
+            self.wfile.write(BODY[offset:offset + len(BODY) // 3])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+
+        self.wfile.write(BODY[offset:])
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture()
+def local_server():
+    _RangeHandler.ranges = []
+    _RangeHandler.interrupt = True
+    _RangeHandler.support_range = True
+    _RangeHandler.wrong_range = False
+    _RangeHandler.gzip = False
+    _RangeHandler.accept_encodings = []
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _RangeHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}/'
+    server.shutdown()
+    server.server_close()
+
+def test_resume_interrupted_download(local_server, tmp_path):
+    path = str(tmp_path / 'archive.zip')
+
+    assert Downloader.download(local_server + 'archive.zip', path) == path
+
+    assert Path(path).read_bytes() == BODY
+    assert len(_RangeHandler.ranges) == 2 and _RangeHandler.ranges[0] is None
+    assert 0 < int(_RangeHandler.ranges[1][len('bytes='):-1]) <= len(BODY) // 3
+    assert [file.name for file in tmp_path.iterdir()] == ['archive.zip']
+
+def test_restart_if_range_is_not_supported(local_server, tmp_path):
+    _RangeHandler.support_range = False
+    path = str(tmp_path / 'archive.zip')
+
+    Downloader.download(local_server + 'archive.zip', path)
+
+    assert Path(path).read_bytes() == BODY
+    assert len(_RangeHandler.ranges) == 2
+
+def test_restart_if_range_does_not_match(local_server, tmp_path):
+    _RangeHandler.wrong_range = True
+    path = str(tmp_path / 'archive.zip')
+
+    Downloader.download(local_server + 'archive.zip', path, attempts=2)
+
+    assert Path(path).read_bytes() == BODY
+    assert len(_RangeHandler.ranges) == 3 and _RangeHandler.ranges[2] is None
+    assert [file.name for file in tmp_path.iterdir()] == ['archive.zip']
+
+def test_remove_stale_parts(local_server, tmp_path):
+    _RangeHandler.interrupt = False
+    path = str(tmp_path / 'archive.zip')
+
+    for name in ('archive.zip.0123456789abcdef.part', 'archive.zip.0123456789abcdef.part.json',
+                 'old.zip.0123456789abcdef.part', 'fresh.zip.0123456789abcdef.part', 'notes.part'):
+        (tmp_path / name).write_bytes(b'part')
+
+    stale_time = time.time() - Downloader.stale_part_age - 60
+    os.utime(tmp_path / 'old.zip.0123456789abcdef.part', (stale_time, stale_time))
+    os.utime(tmp_path / 'notes.part', (stale_time, stale_time))
+
+    Downloader.download(local_server + 'archive.zip', path)
+
+    assert sorted(file.name for file in tmp_path.iterdir()) == ['archive.zip', 'fresh.zip.0123456789abcdef.part', 'notes.part']
+
+def test_encoded_download_is_not_truncated(local_server, tmp_path):
+    _RangeHandler.interrupt = False
+    _RangeHandler.gzip = True
+    path = str(tmp_path / 'archive.zip')
+
+    assert Downloader.download(url=local_server + 'archive.zip', path=path) == path
+    assert Path(path).read_bytes() == BODY
+    assert _RangeHandler.accept_encodings == ['identity']
+
+def test_download_failure(local_server, tmp_path):
+    path = str(tmp_path / 'missing.zip')
+
+    with pytest.raises(StatusCodeNotEqualException):
+        Downloader.download(local_server + 'missing.zip', path)
+
+    assert not list(tmp_path.iterdir())
+
+def test_progress_bar():
+    progress_bar = Downloader.get_progress_bar(512 * 1024, 1024 * 1024, width=40)
+
+    assert len(progress_bar) == 40
+    assert progress_bar.endswith(' 0.5 / 1.0 MB ')
+
+def _make_tar_gz(data):
+    fileobj = io.BytesIO()
+    with tarfile.open(fileobj=fileobj, mode='w:gz') as tar_ref:
+        member = tarfile.TarInfo('geckodriver')
+        member.size = len(data)
+        member.mode = 0o755
+        tar_ref.addfile(member, io.BytesIO(data))
+    return fileobj.getvalue()
+
+def test_stream_and_extract_tar_gz(local_server, tmp_path, monkeypatch):
+    monkeypatch.setattr(sys.modules[__name__], 'BODY', _make_tar_gz(b'#!/bin/sh\necho "geckodriver 0.34.0"\n'))
+    _RangeHandler.interrupt = False
+
+    path = str(tmp_path) + os.path.sep
+    gecko_driver = GeckoDriver(driver_name='geckodriver', path=path, filename='', version='', system_name='linux64')
+    monkeypatch.setattr(gecko_driver.driver_store, 'is_enabled', lambda: False)
+
+    def download(*args, **kwargs):
+        raise AssertionError('Archive must not be written to disk')
+
+    monkeypatch.setattr(gecko_driver.downloader, 'download', download)
+
+    assert gecko_driver._stream_and_extract_driver(local_server + 'archive.zip')
+    assert sorted(os.listdir(path)) == ['geckodriver']
+    assert Path(path + 'geckodriver').read_bytes().startswith(b'#!/bin/sh')
+
+def test_stream_and_extract_tar_gz_fallback(local_server, tmp_path, monkeypatch):
+    monkeypatch.setattr(sys.modules[__name__], 'BODY', os.urandom(64 * 1024))
+    _RangeHandler.interrupt = False
+
+    gecko_driver = GeckoDriver(driver_name='geckodriver', path=str(tmp_path) + os.path.sep, filename='', version='')
+
+    assert not gecko_driver._stream_and_extract_driver(local_server + 'archive.zip')
+    assert not list(tmp_path.iterdir())
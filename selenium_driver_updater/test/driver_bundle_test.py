@@ -0,0 +1,116 @@
+import io
+import json
+import os
+import tarfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from selenium_driver_updater.driverUpdater import DriverUpdater
+from selenium_driver_updater.util.driver_bundle import DriverBundle
+from selenium_driver_updater.util.driver_store import DriverStore
+from selenium_driver_updater.util.endpoints import Endpoints
+from selenium_driver_updater.util.http_cache import HttpCache
+from selenium_driver_updater.util.requests_getter import RequestsGetter
+from selenium_driver_updater.util.exceptions import NotAvailableOfflineException
+
+BINARY = b'#!/bin/sh\necho "geckodriver 0.34.0"\n'
+
+def _make_tar_gz():
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w:gz') as tar:
+        info = tarfile.TarInfo('geckodriver')
+        info.size, info.mode = len(BINARY), 0o755
+        tar.addfile(info, io.BytesIO(BINARY))
+    return buffer.getvalue()
+
+class _GithubHandler(BaseHTTPRequestHandler):
+    archive = _make_tar_gz()
+
+    def do_GET(self):
+        assets = [dict(name=f'geckodriver-v0.34.0-{platform}.tar.gz') for platform in ('linux64', 'linux-aarch64', 'macos', 'macos-aarch64')]
+
+        if self.path == '/api.github/repos/mozilla/geckodriver/releases/latest':
+            body = json.dumps(dict(name='0.34.0')).encode('utf-8')
+        elif self.path == '/api.github/repos/mozilla/geckodriver/releases/tags/v0.34.0':
+            body = json.dumps(dict(name='0.34.0', tag_name='v0.34.0', assets=assets)).encode('utf-8')
+        elif self.path.startswith('/api.github/repos/mozilla/geckodriver/releases?'):
+            body = json.dumps([dict(name='0.34.0', tag_name='v0.34.0', assets=assets)]).encode('utf-8')
+        elif self.path.startswith('/github/mozilla/geckodriver/releases/download/v0.34.0/') and self.path.endswith('.tar.gz'):
+            body = _GithubHandler.archive
+        else:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture()
+def fake_github(tmp_path):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _GithubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    Endpoints.configure(mirror=f'http://127.0.0.1:{server.server_address[1]}/')
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+    Endpoints.clear()
+    HttpCache._options.clear()
+    DriverStore._options.clear()
+
+@pytest.mark.skipif(os.name != 'posix', reason='fake driver is shell script')
+def test_export_import_and_install_offline(fake_github, tmp_path):
+    bundle_path = str(tmp_path / 'drivers.tar.gz')
+
+    manifest = DriverBundle.export_bundle(bundle_path, ['geckodriver'], system_names=['', 'mac64_m1'])
+
+    assert len(manifest['drivers']) == 2
+    assert 'macos-aarch64' in [entry['platform'] for entry in manifest['drivers']]
+    assert all(entry['version'] == '0.34.0' for entry in manifest['drivers'])
+
+    fake_github.shutdown()
+
+    HttpCache.configure(path=str(tmp_path / 'image_cache'))
+    DriverStore.configure(path=str(tmp_path / 'image_cache' / 'store'))
+    DriverBundle.import_bundle(bundle_path)
+
+    drivers_path = tmp_path / 'drivers'
+    drivers_path.mkdir()
+    driver_path = DriverUpdater.install('geckodriver', path=str(drivers_path), offline=True, info_messages=False)
+
+    assert Path(driver_path).read_bytes() == BINARY
+
+def test_offline_request_not_in_bundle(fake_github, tmp_path):
+    HttpCache.configure(path=str(tmp_path / 'cache'), offline=True)
+
+    with pytest.raises(NotAvailableOfflineException):
+        RequestsGetter.get_result_by_request(url='https://api.github.com/repos/mozilla/geckodriver/releases/latest')
+
+def test_import_damaged_bundle(tmp_path):
+    bundle_path = tmp_path / 'drivers.tar.gz'
+    manifest = json.dumps(dict(format_version=1, drivers=[dict(sha256='0' * 64, driver_name='geckodriver', version='0.34.0', platform='linux64')]))
+
+    with tarfile.open(bundle_path, 'w:gz') as tar:
+        info = tarfile.TarInfo('manifest.json')
+        info.size = len(manifest)
+        tar.addfile(info, io.BytesIO(manifest.encode('utf-8')))
+        info = tarfile.TarInfo('store/objects/00/' + '0' * 64)
+        info.size = len(BINARY)
+        tar.addfile(info, io.BytesIO(BINARY))
+
+    DriverStore.configure(path=str(tmp_path / 'store'))
+    try:
+        with pytest.raises(ValueError):
+            DriverBundle.import_bundle(str(bundle_path))
+    finally:
+        DriverStore._options.clear()
@@ -0,0 +1,179 @@
+import json
+import logging
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from selenium_driver_updater._setting import setting
+from selenium_driver_updater.driverMirror import DriverMirror
+from selenium_driver_updater.util.http_cache import HttpCache
+from selenium_driver_updater.util.endpoints import Endpoints
+from selenium_driver_updater.util.logger import logger
+from selenium_driver_updater.util.requests_getter import RequestsGetter
+from selenium_driver_updater.util.github_viewer import GithubViewer
+from selenium_driver_updater.util.exceptions import NotAvailableOfflineException
+
+ARCHIVE = b'PK' + b'\0' * 1000
+
+class _UpstreamHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    hits = Counter()
+
+    def do_GET(self):
+        _UpstreamHandler.hits[self.path] += 1
+        base = f'http://{self.headers["Host"]}'
+
+        if self.path == '/cft/last-known-good-versions.json':
+            body = json.dumps(dict(url=f'{base}/storage/120.0.1/linux64/chromedriver-linux64.zip')).encode('utf-8')
+            status_code, content_type = 200, 'application/json'
+        elif self.path == '/storage/120.0.1/linux64/chromedriver-linux64.zip':
+            body, status_code, content_type = ARCHIVE, 200, 'application/zip'
+        else:
+            body, status_code, content_type = b'not found', 404, 'text/plain'
+
+        self.send_response(status_code)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Cache-Control', 'max-age=60')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture()
+def mirror_url(tmp_path, monkeypatch):
+    _UpstreamHandler.hits = Counter()
+    HttpCache.configure(path=str(tmp_path / 'cache'), enabled=True)
+
+    upstream = ThreadingHTTPServer(('127.0.0.1', 0), _UpstreamHandler)
+    threading.Thread(target=upstream.serve_forever, daemon=True).start()
+    upstream_url = f'http://127.0.0.1:{upstream.server_address[1]}'
+
+    monkeypatch.setattr(DriverMirror, 'upstreams', {
+        'chrome-for-testing': f'{upstream_url}/cft/',
+        'chrome-for-testing-public': f'{upstream_url}/storage/',
+    })
+
+    mirror = DriverMirror(host='127.0.0.1', port=0, path=str(tmp_path / 'mirror'))
+    host, port = mirror.start()
+
+    yield f'http://{host}:{port}/'
+
+    mirror.stop()
+    upstream.shutdown()
+    upstream.server_close()
+    HttpCache._options.clear()
+
+def test_metadata_links_point_to_mirror(mirror_url):
+    for _ in range(3):
+        response = requests.get(f'{mirror_url}chrome-for-testing/last-known-good-versions.json', timeout=5)
+
+        assert response.status_code == 200
+        assert response.json()['url'] == f'{mirror_url}chrome-for-testing-public/120.0.1/linux64/chromedriver-linux64.zip'
+
+    assert _UpstreamHandler.hits['/cft/last-known-good-versions.json'] == 1
+
+def test_archive_is_fetched_once(mirror_url):
+    url = f'{mirror_url}chrome-for-testing-public/120.0.1/linux64/chromedriver-linux64.zip'
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(requests.get(url, timeout=5).content)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [ARCHIVE] * 4
+    assert _UpstreamHandler.hits['/storage/120.0.1/linux64/chromedriver-linux64.zip'] == 1
+
+def test_not_mirrored_paths(mirror_url):
+    assert requests.get(f'{mirror_url}unknown/file.json', timeout=5).status_code == 404
+    assert requests.get(f'{mirror_url}chrome-for-testing-public/../secret.zip', timeout=5).status_code == 404
+    assert requests.get(f'{mirror_url}chrome-for-testing/missing.json', timeout=5).status_code == 404
+    assert requests.get(f'{mirror_url}chrome-for-testing-public/1.0.0/linux64/chromedriver-linux64.zip', timeout=5).status_code == 404
+
+def test_unavailable_upstream(mirror_url, monkeypatch):
+    monkeypatch.setitem(DriverMirror.upstreams, 'chrome-for-testing', 'http://127.0.0.1:1/')
+
+    assert requests.get(f'{mirror_url}chrome-for-testing/last-known-good-versions.json', timeout=30).status_code == 502
+
+def test_upstream_failures_are_answered(mirror_url, monkeypatch):
+    url = f'{mirror_url}chrome-for-testing/last-known-good-versions.json'
+
+    def get_metadata(*args):
+        raise NotAvailableOfflineException('not in cache')
+    monkeypatch.setattr(DriverMirror, 'get_metadata', get_metadata)
+    assert requests.get(url, timeout=5).status_code == 504
+
+    def get_metadata(*args):
+        raise ValueError('broken upstream answer')
+    monkeypatch.setattr(DriverMirror, 'get_metadata', get_metadata)
+    assert requests.get(url, timeout=5).status_code == 502
+
+def test_github_api_is_requested_with_token_of_mirror(tmp_path, monkeypatch):
+    requests_headers = []
+    monkeypatch.setattr(RequestsGetter, 'get_result_by_request', lambda url, headers=None: requests_headers.append(headers) or '{}')
+    monkeypatch.setattr(GithubViewer, '_options', {})
+    monkeypatch.setenv(GithubViewer.token_environ, 'mirror-token')
+    mirror = DriverMirror(host='127.0.0.1', port=0, path=str(tmp_path / 'mirror'))
+
+    mirror.get_metadata(setting["Github"]["linkLatestReleaseBySpecificRepoName"].format('mozilla/geckodriver'), 'http://mirror/')
+    mirror.get_metadata(setting["ChromeDriver"]["LinkLastRelease"], 'http://mirror/')
+
+    assert requests_headers[0]['Authorization'] == 'Bearer mirror-token'
+    assert requests_headers[1] is None
+
+def test_conditional_requests(mirror_url):
+    url = f'{mirror_url}chrome-for-testing/last-known-good-versions.json'
+
+    response = requests.get(url, timeout=5)
+    assert response.headers['Cache-Control'] == 'max-age=60'
+
+    response = requests.get(url, headers={'If-None-Match': response.headers['ETag']}, timeout=5)
+    assert response.status_code == 304 and not response.content
+
+    url = f'{mirror_url}chrome-for-testing-public/120.0.1/linux64/chromedriver-linux64.zip'
+
+    response = requests.get(url, timeout=5)
+    assert response.content == ARCHIVE and response.headers['Last-Modified']
+
+    response = requests.get(url, headers={'If-None-Match': response.headers['ETag']}, timeout=5)
+    assert response.status_code == 304 and not response.content
+
+    response = requests.get(url, headers={'If-None-Match': '"other"'}, timeout=5)
+    assert response.status_code == 200 and response.content == ARCHIVE
+
+def test_point_to():
+    DriverMirror.point_to('http://127.0.0.1:8788')
+
+    try:
+        assert Endpoints.resolve(setting["ChromeDriver"]["LinkLastRelease"]) == 'http://127.0.0.1:8788/chrome-for-testing/last-known-good-versions.json'
+        assert Endpoints.resolve(setting["Github"]["linkAllReleases"]).startswith('http://127.0.0.1:8788/api.github/repos/')
+        assert setting["ChromeDriver"]["LinkLastRelease"].startswith('https://googlechromelabs.github.io/')
+    finally:
+        Endpoints.clear()
+
+def test_query_of_upstream_base_is_mirrored(tmp_path):
+    url = setting["EdgeDriver"]["LinkCheckVersionIsValid"].format('120.0.2210.77')
+    mirror = DriverMirror(host='127.0.0.1', port=0, path=str(tmp_path / 'mirror'))
+
+    assert mirror.get_upstream_url('/edgewebdriver/?' + url.split('?', 1)[1]) == ('edgewebdriver', url)
+
+def test_mirror_address_is_logged(tmp_path):
+    messages = []
+    handler = logging.Handler()
+    handler.emit = lambda record: messages.append(record.getMessage())
+    logger.addHandler(handler)
+
+    mirror = DriverMirror(host='127.0.0.1', port=0, path=str(tmp_path / 'mirror'))
+    try:
+        host, port = mirror.start()
+    finally:
+        mirror.stop()
+        logger.removeHandler(handler)
+
+    assert f'Mirror of driver upstreams is available at http://{host}:{port}/' in messages
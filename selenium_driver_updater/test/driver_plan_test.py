@@ -0,0 +1,105 @@
+import os
+
+import pytest
+
+from selenium_driver_updater._chromeDriver import ChromeDriver
+from selenium_driver_updater.util.driver_store import DriverStore
+from selenium_driver_updater.util.exceptions import DriverVersionInvalidException, StatusCodeNotEqualException
+
+LATEST_VERSION = '121.0.6167.85'
+PREVIOUS_VERSION = '120.0.6099.109'
+
+@pytest.fixture()
+def chrome_driver(tmp_path, monkeypatch):
+    DriverStore.configure(path=str(tmp_path / 'store'), enabled=True)
+
+    driver = ChromeDriver(driver_name='chromedriver', path=str(tmp_path) + os.path.sep, filename='', version='')
+    downloads = []
+
+    monkeypatch.setattr(driver, '_get_latest_version_driver', lambda no_messages=False: LATEST_VERSION)
+    monkeypatch.setattr(driver, '_get_latest_previous_version_chromedriver_via_requests', lambda: PREVIOUS_VERSION)
+    monkeypatch.setattr(driver.chromebrowser, '_get_latest_version_chrome_browser', lambda no_messages=False: LATEST_VERSION)
+    monkeypatch.setattr(driver, '_get_current_version_driver', lambda: '')
+    monkeypatch.setattr(driver, '_check_if_version_is_valid', lambda url: None)
+    monkeypatch.setattr(driver, '_download_and_extract_driver', lambda url: downloads.append(url) or driver.driver_path)
+
+    yield driver, downloads
+    DriverStore._options.clear()
+
+def test_plan_latest_version(chrome_driver):
+    driver, downloads = chrome_driver
+
+    plan = driver.plan()
+
+    assert plan.version == LATEST_VERSION
+    assert plan.reason == 'latest_version'
+    assert plan.is_validated and not plan.is_up_to_date
+    assert LATEST_VERSION in plan.url
+    assert not downloads
+
+    driver._install_plan(plan)
+    assert downloads == [plan.url]
+
+def test_plan_up_to_date(chrome_driver, monkeypatch):
+    driver, downloads = chrome_driver
+    monkeypatch.setattr(driver, '_get_current_version_driver', lambda: LATEST_VERSION)
+
+    plan = driver.plan()
+
+    assert plan.is_up_to_date
+    assert plan.current_version == LATEST_VERSION
+    assert driver._install_plan(plan) == driver.driver_path
+    assert not downloads
+
+def test_plan_invalid_latest_version(chrome_driver, monkeypatch):
+    driver, downloads = chrome_driver
+
+    def check_if_version_is_valid(url):
+        if LATEST_VERSION in url:
+            raise DriverVersionInvalidException(url)
+
+    monkeypatch.setattr(driver, '_check_if_version_is_valid', check_if_version_is_valid)
+
+    plan = driver.plan()
+
+    assert plan.version == PREVIOUS_VERSION
+    assert plan.reason == 'previous_version'
+
+    driver._install_plan(plan)
+    assert downloads == [plan.url]
+
+def test_plan_browser_is_older(chrome_driver, monkeypatch):
+    driver, downloads = chrome_driver
+    monkeypatch.setattr(driver.chromebrowser, '_get_latest_version_chrome_browser', lambda no_messages=False: PREVIOUS_VERSION)
+
+    plan = driver.plan()
+
+    assert plan.version == PREVIOUS_VERSION
+    assert plan.archive_name == 'chromedriver-' + plan.platform + '.zip'
+    assert not downloads
+
+def test_plan_unchecked_when_status_code_fails(chrome_driver, monkeypatch):
+    driver, _ = chrome_driver
+
+    def check_if_version_is_valid(url):
+        raise StatusCodeNotEqualException(url)
+
+    monkeypatch.setattr(driver, '_check_if_version_is_valid', check_if_version_is_valid)
+
+    plan = driver.plan()
+
+    assert plan.version == LATEST_VERSION
+    assert not plan.is_validated
+
+def test_plan_unexpected_error_is_raised(chrome_driver, monkeypatch):
+    driver, downloads = chrome_driver
+
+    def check_if_version_is_valid(url):
+        raise KeyError('downloads')
+
+    monkeypatch.setattr(driver, '_check_if_version_is_valid', check_if_version_is_valid)
+
+    with pytest.raises(KeyError):
+        driver.plan()
+
+    assert not downloads
@@ -0,0 +1,108 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from selenium_driver_updater._setting import setting
+from selenium_driver_updater._chromeDriver import ChromeDriver
+from selenium_driver_updater._geckoDriver import GeckoDriver
+from selenium_driver_updater.util.driver_store import DriverStore
+
+VERSION = '120.0.6099.109'
+
+@pytest.fixture()
+def store(tmp_path):
+    DriverStore.configure(path=str(tmp_path / 'store'), enabled=True)
+    binary_path = tmp_path / 'chromedriver'
+    binary_path.write_bytes(b'#!/bin/sh\necho "ChromeDriver 120.0.6099.109"\n')
+    yield DriverStore, str(binary_path), tmp_path
+    DriverStore._options.clear()
+
+def test_lookup_not_stored(store):
+    driver_store, _, _ = store
+    assert driver_store.lookup('chromedriver', VERSION, 'linux64') is None
+
+def test_add_and_install(store):
+    driver_store, binary_path, tmp_path = store
+
+    entry = driver_store.add('chromedriver', VERSION, 'linux64', binary_path)
+    assert entry['sha256'] == driver_store.get_sha256(binary_path)
+    assert driver_store.lookup('chromedriver', VERSION, 'linux64') == entry
+
+    out_path = str(tmp_path / 'project' / 'chromedriver')
+    Path(out_path).parent.mkdir()
+    driver_store.install(entry, out_path)
+
+    assert Path(out_path).read_bytes() == Path(binary_path).read_bytes()
+    assert not list(Path(out_path).parent.glob('*.tmp'))
+
+def test_install_corrupted_failure(store):
+    driver_store, binary_path, tmp_path = store
+
+    entry = driver_store.add('chromedriver', VERSION, 'linux64', binary_path)
+    object_path = driver_store.get_object_path(entry['sha256'])
+    os.chmod(object_path, 0o644)
+    Path(object_path).write_bytes(b'#!/bin/sh\necho "ChromeDriver 666.0.0000.000"\n')
+
+    with pytest.raises(OSError):
+        driver_store.install(entry, str(tmp_path / 'chromedriver_copy'))
+
+def test_disabled_store(store):
+    driver_store, binary_path, _ = store
+    driver_store.configure(enabled=False)
+
+    assert driver_store.add('chromedriver', VERSION, 'linux64', binary_path) is None
+    assert driver_store.lookup('chromedriver', VERSION, 'linux64') is None
+
+def test_get_archive_platform(store):
+    _, _, tmp_path = store
+    chrome_driver = ChromeDriver(driver_name='chromedriver', path=str(tmp_path) + os.path.sep, filename='', version='')
+    gecko_driver = GeckoDriver(driver_name='geckodriver', path=str(tmp_path) + os.path.sep, filename='', version='')
+
+    assert chrome_driver._get_archive_platform('chromedriver-mac-arm64.zip', VERSION) == 'mac-arm64'
+    assert gecko_driver._get_archive_platform('geckodriver-v0.34.0-linux64.tar.gz', '0.34.0') == 'linux64'
+    assert gecko_driver._get_archive_platform('edgedriver_win64.zip', VERSION) == 'win64'
+
+def test_download_driver_from_store(store):
+    driver_store, binary_path, tmp_path = store
+    driver_store.add('chromedriver', VERSION, 'linux64', binary_path)
+
+    path = str(tmp_path / 'drivers') + os.path.sep
+    Path(path).mkdir()
+    chrome_driver = ChromeDriver(driver_name='chromedriver', path=path, filename='', version='', system_name='linux64')
+
+    url = str(setting["ChromeDriver"]["LinkLastReleaseFile"]).format(VERSION)
+    url = url.replace(url.split("/")[-1], chrome_driver.system_name).replace(url.split("/")[-2], 'linux64')
+
+    plan = chrome_driver._make_plan(url=url, driver_version=VERSION, validate=True)
+    assert plan.is_stored and plan.is_validated and plan.platform == 'linux64'
+
+    driver_path = chrome_driver._install_plan(plan)
+
+    assert driver_path == path + 'chromedriver'
+    assert Path(driver_path).read_bytes() == Path(binary_path).read_bytes()
+
+def test_lookup_corrupted_same_size(store):
+    driver_store, binary_path, _ = store
+
+    entry = driver_store.add('chromedriver', VERSION, 'linux64', binary_path)
+    object_path = driver_store.get_object_path(entry['sha256'])
+    os.chmod(object_path, 0o644)
+    Path(object_path).write_bytes(b'#!/bin/sh\necho "ChromeDriver 666.0.6099.109"\n')
+
+    assert driver_store.lookup('chromedriver', VERSION, 'linux64') is None
+
+def test_lookup_reads_index_once(store, monkeypatch):
+    driver_store, binary_path, _ = store
+    entry = driver_store.add('chromedriver', VERSION, 'linux64', binary_path)
+
+    reads = []
+    read_index = DriverStore._read_index
+    monkeypatch.setattr(DriverStore, '_read_index', staticmethod(lambda: reads.append(1) or read_index()))
+
+    assert driver_store.lookup('chromedriver', VERSION, 'linux64') == entry
+    assert driver_store.lookup('chromedriver', VERSION, 'linux64') == entry
+    assert len(reads) == 1
+
+    driver_store.add('chromedriver', VERSION, 'win64', binary_path)
+    assert driver_store.lookup('chromedriver', VERSION, 'win64')['platform'] == 'win64'
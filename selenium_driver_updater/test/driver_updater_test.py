@@ -1,10 +1,21 @@
+import asyncio
+import json
 import os.path
+import dataclasses
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import pytest
 
 # Local imports
 from selenium_driver_updater.driverUpdater import DriverUpdater, _info
 from selenium_driver_updater._setting import setting
 from selenium_driver_updater.util.requests_getter import RequestsGetter
+from selenium_driver_updater.util.endpoints import Endpoints
+from selenium_driver_updater.util.http_cache import HttpCache
+from selenium_driver_updater.util import ALL_DRIVERS
+from selenium_driver_updater.util.logger import logger
 
 base_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -16,31 +27,39 @@ def driver_updater_setup():
 @pytest.fixture()
 def setup_info():
     """Setup fixture for _info."""
-    _info.path = base_dir
-    _info.driver_name = 'chromedriver'
-    _info.system_name = 'linux64'
-    _info.filename = ''
-    _info.version = ''
-    _info.check_browser = False
-    _info.enable_library_update_check = True
-    yield _info
+    yield _info(
+        path=base_dir, driver_name='chromedriver', system_name='linux64', filename='', version='',
+        check_browser=False, enable_library_update_check=True,
+    )
 
 def test_check_all_input_parameteres_failure(driver_updater_setup, setup_info):
     # Set incorrect values in the _info object to simulate failure
-    setup_info.driver_name = 123  # Invalid type, should be str or list
-    setup_info.filename = 67890  # Invalid type, should be str
-    setup_info.system_name = 'invalid_system_name'  # Invalid system name
+    setup_info = dataclasses.replace(
+        setup_info,
+        driver_name=123,  # Invalid type, should be str or list
+        filename=67890,  # Invalid type, should be str
+        system_name='invalid_system_name',  # Invalid system name
+    )
 
     with pytest.raises(ValueError):
-        driver_updater_setup._DriverUpdater__check_all_input_parameteres()
+        driver_updater_setup._DriverUpdater__check_all_input_parameteres(setup_info)
 
 def test_check_enviroment_and_variables_failure(driver_updater_setup, setup_info):
     # Set incorrect values in the _info object to simulate failure
-    setup_info.driver_name = 123  # Invalid type, should be str or list
-    setup_info.filename = 67890  # Invalid type, should be str
-    setup_info.system_name = 'invalid_system_name'  # Invalid system name
+    setup_info = dataclasses.replace(
+        setup_info,
+        driver_name=123,  # Invalid type, should be str or list
+        filename=67890,  # Invalid type, should be str
+        system_name='invalid_system_name',  # Invalid system name
+    )
     with pytest.raises(ValueError):
-        driver_updater_setup._DriverUpdater__check_enviroment_and_variables()
+        driver_updater_setup._DriverUpdater__check_enviroment_and_variables(setup_info)
+
+def test_check_filename_of_list_of_drivers_failure(driver_updater_setup, setup_info):
+    setup_info = dataclasses.replace(setup_info, driver_name=['chromedriver', 'geckodriver'], filename='driver')
+
+    with pytest.raises(TypeError):
+        driver_updater_setup._DriverUpdater__check_all_input_parameteres(setup_info)
 
 def test_check_system_name_is_valid_failure(driver_updater_setup, setup_info):
     invalid_system_name = 'linux6412312'
@@ -63,16 +82,16 @@ def test_check_is_python_version_compatible_for_library(driver_updater_setup, se
     driver_updater_setup._DriverUpdater__check_is_python_version_compatible_for_library()
 
 def test_check_all_input_parameteres(driver_updater_setup, setup_info):
-    driver_updater_setup._DriverUpdater__check_all_input_parameteres()
+    driver_updater_setup._DriverUpdater__check_all_input_parameteres(setup_info)
 
 def test_check_enviroment_and_variables(driver_updater_setup, setup_info):
-    driver_updater_setup._DriverUpdater__check_enviroment_and_variables()
+    driver_updater_setup._DriverUpdater__check_enviroment_and_variables(setup_info)
 
 def test_check_system_name_is_valid(driver_updater_setup, setup_info):
-    driver_updater_setup._DriverUpdater__check_system_name_is_valid(system_name=_info.system_name)
+    driver_updater_setup._DriverUpdater__check_system_name_is_valid(system_name=setup_info.system_name)
 
 def test_check_parameter_type_is_valid(driver_updater_setup, setup_info):
-    driver_updater_setup._DriverUpdater__check_parameter_type_is_valid(parameter=_info.driver_name, needed_type=str, parameter_name='driver_name')
+    driver_updater_setup._DriverUpdater__check_parameter_type_is_valid(parameter=setup_info.driver_name, needed_type=str, parameter_name='driver_name')
 
 def test_install_driver(driver_updater_setup, setup_info):
     driver_path = driver_updater_setup.install('chromedriver', path=base_dir, system_name='linux64')
@@ -90,4 +109,229 @@ def test_install_multiple_drivers(driver_updater_setup, setup_info):
     for driver_path in driver_paths:
         if os.path.exists(driver_path):
             os.remove(driver_path)
-            assert not os.path.exists(driver_path)  # Ensure the file was deleted
\ No newline at end of file
+            assert not os.path.exists(driver_path)  # Ensure the file was deleted
+
+class _SlowDriver():
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+    def main(self):
+        with _SlowDriver.lock:
+            _SlowDriver.active += 1
+            _SlowDriver.max_active = max(_SlowDriver.max_active, _SlowDriver.active)
+        time.sleep(0.2 if self.kwargs['driver_name'] == 'chromedriver' else 0.05)
+        with _SlowDriver.lock:
+            _SlowDriver.active -= 1
+        return self.kwargs['path'] + self.kwargs['driver_name'] + self.kwargs['system_name']
+
+def test_install_multiple_drivers_in_parallel(monkeypatch):
+    for driver_name in ('chromedriver', 'geckodriver', 'edgedriver'):
+        monkeypatch.setitem(ALL_DRIVERS, driver_name, _SlowDriver)
+
+    driver_names = ['chromedriver', 'geckodriver', 'edgedriver']
+    system_names = ['win64', 'linux64', 'mac64']
+    driver_paths = DriverUpdater.install(driver_names, path=base_dir, system_name=system_names, enable_library_update_check=False)
+
+    assert driver_paths == [os.path.join(base_dir, name + system) for name, system in zip(driver_names, system_names)]
+    assert _SlowDriver.max_active == 3
+    assert setting['Program']['DriversFileFormat'] == ('.exe' if os.name == 'nt' else '')
+
+class _CountingHandler(BaseHTTPRequestHandler):
+    hits = 0
+
+    def do_GET(self):
+        _CountingHandler.hits += 1
+        time.sleep(0.1)
+        body = b'120.0.6099.109'
+        self.send_response(200)
+        self.send_header('Cache-Control', 'no-store')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class _MatrixDriver(_SlowDriver):
+    url = ''
+
+    def main(self):
+        latest_version = RequestsGetter.get_result_by_request(url=_MatrixDriver.url)
+        super().main()
+        driver_path = self.kwargs['path'] + self.kwargs['driver_name']
+        with open(driver_path, 'w') as file:
+            file.write(latest_version)
+        return driver_path
+
+def test_install_matrix(monkeypatch, tmp_path):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _CountingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    _MatrixDriver.url = f'http://127.0.0.1:{server.server_address[1]}/LATEST_RELEASE'
+    _CountingHandler.hits, _SlowDriver.max_active = 0, 0
+
+    for driver_name in ('chromedriver', 'edgedriver'):
+        monkeypatch.setitem(ALL_DRIVERS, driver_name, _MatrixDriver)
+
+    system_names = ['win64', 'linux64', 'mac64', 'mac64_m1']
+    try:
+        driver_paths = DriverUpdater.install_matrix(
+            ['chromedriver', 'edgedriver'], system_names, path=str(tmp_path), enable_library_update_check=False, info_messages=False,
+            )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert list(driver_paths) == system_names
+    assert driver_paths['mac64_m1']['edgedriver'] == os.path.join(str(tmp_path), 'mac64_m1', 'edgedriver')
+    assert all(open(path).read() == '120.0.6099.109' for paths in driver_paths.values() for path in paths.values())
+    assert _CountingHandler.hits == 1
+    assert _SlowDriver.max_active >= 4
+
+def test_install_matrix_unknown_system_name(tmp_path):
+    with pytest.raises(ValueError):
+        DriverUpdater.install_matrix(['chromedriver'], ['win64', 'amiga'], path=str(tmp_path))
+
+def test_install_matrix_unknown_parameter(tmp_path):
+    with pytest.raises(TypeError):
+        DriverUpdater.install_matrix(['chromedriver'], ['win64'], path=str(tmp_path), filename='chrome')
+
+class _FailingDriver(_SlowDriver):
+
+    def main(self):
+        message = f'{self.kwargs["system_name"]} is not available'
+        raise OSError(message)
+
+def test_install_matrix_uses_parameters_of_call(monkeypatch, tmp_path):
+    monkeypatch.setitem(ALL_DRIVERS, 'chromedriver', _ContextDriver)
+    monkeypatch.setitem(ALL_DRIVERS, 'geckodriver', _FailingDriver)
+    report_path = tmp_path / 'report.json'
+
+    driver_paths = DriverUpdater.install_matrix(
+        ['chromedriver', 'geckodriver'], ['win64', 'linux64'], path=str(tmp_path / 'drivers'),
+        endpoints={'github': 'http://127.0.0.1:1/'}, offline=True, report_path=str(report_path),
+        enable_library_update_check=False, info_messages=False,
+        )
+
+    path = os.path.join(str(tmp_path), 'drivers') + os.path.sep
+    assert driver_paths == {
+        system_name: {
+            'chromedriver': f'{path}{system_name}{os.path.sep}|chromedriver|{system_name}|http://127.0.0.1:1/|True',
+            'geckodriver': '',
+        }
+        for system_name in ('win64', 'linux64')
+    }
+    assert Endpoints.get_base('github') == Endpoints.defaults['github']
+
+    report = json.loads(report_path.read_text())
+    assert report['name'] == 'install_matrix'
+    assert report['summary']['driver'] == dict(report['summary']['driver'], count=4, errors=2)
+
+class _ContextDriver(_SlowDriver):
+
+    def main(self):
+        super().main()
+        return '|'.join([
+            self.kwargs['path'], self.kwargs['driver_name'], self.kwargs['system_name'],
+            Endpoints.get_base('github'), str(HttpCache.is_offline()),
+            ])
+
+def test_install_concurrent_calls_do_not_share_parameters(monkeypatch, tmp_path):
+    for driver_name in ('chromedriver', 'geckodriver'):
+        monkeypatch.setitem(ALL_DRIVERS, driver_name, _ContextDriver)
+
+    def install(index):
+        path = str(tmp_path / str(index))
+        os.makedirs(path)
+        return DriverUpdater.install(
+            ['chromedriver', 'geckodriver'], path=path, system_name=['win64', 'linux64'] if index % 2 else ['mac64', 'mac64_m1'],
+            endpoints={'github': f'http://127.0.0.1:{index}/'}, offline=bool(index % 2),
+            enable_library_update_check=False, info_messages=False,
+            )
+
+    results = [None] * 8
+    threads = [threading.Thread(target=lambda index=index: results.__setitem__(index, install(index))) for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for index, driver_paths in enumerate(results):
+        path = os.path.join(str(tmp_path), str(index)) + os.path.sep
+        system_names = ['win64', 'linux64'] if index % 2 else ['mac64', 'mac64_m1']
+        assert driver_paths == [
+            f'{path}|{driver_name}|{system_name}|http://127.0.0.1:{index}/|{bool(index % 2)}'
+            for driver_name, system_name in zip(['chromedriver', 'geckodriver'], system_names)
+            ]
+
+    assert Endpoints.get_base('github') == Endpoints.defaults['github']
+    assert not HttpCache.is_offline()
+
+def test_ainstall_runs_installs_concurrently(monkeypatch, tmp_path):
+    for driver_name in ('chromedriver', 'geckodriver'):
+        monkeypatch.setitem(ALL_DRIVERS, driver_name, _ContextDriver)
+    for system_name in ('win64', 'linux64', 'mac64'):
+        (tmp_path / system_name).mkdir()
+    _SlowDriver.max_active = 0
+
+    async def install_all():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.ensure_future(tick())
+        results = await asyncio.gather(*[
+            DriverUpdater.ainstall(
+                'chromedriver', path=str(tmp_path / system_name), system_name=system_name, endpoints={'github': f'http://127.0.0.1:{index}/'},
+                enable_library_update_check=False, info_messages=False,
+                )
+            for index, system_name in enumerate(['win64', 'linux64', 'mac64'])
+            ], DriverUpdater.ainstall(['chromedriver', 'geckodriver'], path=str(tmp_path), enable_library_update_check=False, info_messages=False))
+        ticker.cancel()
+        return results, ticks
+
+    results, ticks = asyncio.run(install_all())
+
+    path = str(tmp_path) + os.path.sep
+    assert results[:3] == [
+        f'{path}{system_name}{os.path.sep}|chromedriver|{system_name}|http://127.0.0.1:{index}/|False'
+        for index, system_name in enumerate(['win64', 'linux64', 'mac64'])
+        ]
+    assert results[3] == [f'{path}|chromedriver||{Endpoints.defaults["github"]}|False', f'{path}|geckodriver||{Endpoints.defaults["github"]}|False']
+    assert _SlowDriver.max_active >= 4
+    assert ticks >= 5
+
+class _LoggingDriver(_SlowDriver):
+
+    def main(self):
+        logger.info(f'installing {self.kwargs["system_name"]}')
+        return super().main()
+
+def test_ainstall_info_messages_are_set_per_call(monkeypatch, tmp_path):
+    monkeypatch.setitem(ALL_DRIVERS, 'chromedriver', _LoggingDriver)
+    messages = []
+    handler = logging.Handler()
+    handler.emit = lambda record: messages.append(record.getMessage())
+    logger.addHandler(handler)
+
+    async def install_all():
+        return await asyncio.gather(*[
+            DriverUpdater.ainstall(
+                'chromedriver', path=str(tmp_path), system_name=system_name, enable_library_update_check=False, info_messages=system_name == 'win64',
+                )
+            for system_name in ['win64', 'linux64', 'mac64']
+            ])
+
+    try:
+        asyncio.run(install_all())
+    finally:
+        logger.removeHandler(handler)
+
+    assert [message for message in messages if message.startswith('installing')] == ['installing win64']
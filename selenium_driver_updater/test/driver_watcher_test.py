@@ -0,0 +1,122 @@
+import json
+import logging
+import sys
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from selenium_driver_updater.consoleUpdater import ConsoleUpdater
+from selenium_driver_updater.driverUpdater import DriverUpdater
+from selenium_driver_updater.driverWatcher import DriverWatcher
+from selenium_driver_updater.util.logger import logger
+from selenium_driver_updater.util.tracer import Tracer
+
+@pytest.fixture()
+def fake_install(tmp_path, monkeypatch):
+    calls = []
+
+    def install(driver_name, **kwargs):
+        calls.append(kwargs)
+        if kwargs.get('fail'):
+            return ''
+        driver_path = tmp_path / driver_name
+        driver_path.write_text('driver')
+        return str(driver_path)
+
+    monkeypatch.setattr(DriverUpdater, 'install', install)
+    return calls
+
+def _get_json(address, path):
+    try:
+        with urllib.request.urlopen(f'http://{address[0]}:{address[1]}{path}', timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        return error.code, json.loads(error.read())
+
+def test_watch_checks_on_schedule(fake_install):
+    watcher = DriverWatcher('chromedriver', interval=0.05, jitter=0.01, status_port=-1, path='/tmp')
+
+    thread = threading.Thread(target=watcher.run)
+    thread.start()
+    for _ in range(500):
+        if len(fake_install) >= 3:
+            break
+        thread.join(0.01)
+    watcher.stop()
+    thread.join(5)
+
+    assert not thread.is_alive()
+    assert fake_install[0].get('enable_library_update_check') is None
+    assert all(kwargs['enable_library_update_check'] is False for kwargs in fake_install[1:])
+    assert watcher.get_status()['drivers']['chromedriver']['fresh']
+
+def test_status_endpoint(fake_install):
+    watcher = DriverWatcher('chromedriver', interval=60, jitter=0, status_port=0)
+    address = watcher.start_status_server()
+
+    try:
+        assert _get_json(address, '/health') == (503, dict(fresh=False))
+
+        watcher.check()
+
+        status_code, status = _get_json(address, '/status')
+        assert status_code == 200
+        assert status['cycles'] == 1
+        assert status['drivers']['chromedriver']['fresh']
+
+        status_code, entry = _get_json(address, '/status/chromedriver')
+        assert status_code == 200 and entry['path'].endswith('chromedriver')
+
+        assert _get_json(address, '/health') == (200, dict(fresh=True))
+        assert _get_json(address, '/status/geckodriver')[0] == 404
+    finally:
+        watcher.stop()
+
+def test_status_server_address_is_logged(fake_install):
+    messages = []
+    handler = logging.Handler()
+    handler.emit = lambda record: messages.append(record.getMessage())
+    logger.addHandler(handler)
+
+    watcher = DriverWatcher('chromedriver', interval=60, jitter=0, status_port=0)
+    try:
+        host, port = watcher.start_status_server()
+    finally:
+        watcher.stop()
+        logger.removeHandler(handler)
+
+    assert f'Status of drivers is available at http://{host}:{port}/status' in messages
+
+def test_status_has_version_of_downloaded_driver(tmp_path, monkeypatch):
+    def install(driver_name, **kwargs):
+        driver_path = tmp_path / driver_name
+        with Tracer.span('driver', driver_name=driver_name):
+            driver_path.write_text('driver')
+            Tracer.set(version='120.0.6099.109', is_up_to_date=False)
+        return str(driver_path)
+
+    monkeypatch.setattr(DriverUpdater, 'install', install)
+    watcher = DriverWatcher('chromedriver', interval=60, jitter=0, status_port=-1)
+
+    status = watcher.check()
+
+    assert status['drivers']['chromedriver']['version'] == '120.0.6099.109'
+
+def test_failed_check_is_not_fresh(fake_install):
+    watcher = DriverWatcher(['chromedriver', 'geckodriver'], interval=60, jitter=0, status_port=-1, fail=True)
+
+    status = watcher.check()
+
+    assert not status['fresh']
+    assert status['drivers']['geckodriver']['error']
+
+def test_console_watch_arguments(monkeypatch):
+    monkeypatch.setattr(sys, 'argv', ['selupd', '-d', 'chromedriver', '--watch', '--interval', '10', '--status_port', '-1'])
+    args = ConsoleUpdater.parse_command_line()
+    assert args.watch and args.interval == 10 and args.status_port == -1
+
+    monkeypatch.setattr(sys, 'argv', ['selupd', '--watch'])
+    with pytest.raises(SystemExit):
+        ConsoleUpdater.parse_command_line()
@@ -47,14 +47,6 @@ def test_check_get_current_version_edge_selenium_failure(setup_edgedriver):
     assert len(current_version) == 0, f"Unexpected current version: {current_version}"
 
 
-def test_compare_current_version_and_latest_version_failure(setup_edgedriver):
-    _, edgedriver_failure, _ = setup_edgedriver
-    is_driver_up_to_date, current_version, latest_version = edgedriver_failure._compare_current_version_and_latest_version()
-    assert not is_driver_up_to_date
-    assert len(current_version) == 0
-    assert len(latest_version) == 0
-
-
 def test_check_if_version_is_valid_failure(setup_edgedriver):
     _, edgedriver_failure, _ = setup_edgedriver
     with pytest.raises(DriverVersionInvalidException):
@@ -70,12 +62,13 @@ def test_check_get_result_by_request(setup_edgedriver):
 
 def test_check_download_driver_specific_version(setup_edgedriver):
     edgedriver, _, _ = setup_edgedriver
-    edgedriver._delete_current_driver_for_current_os()
+    if Path(edgedriver.driver_path).exists():
+        Path(edgedriver.driver_path).unlink()
     edgedriver_path = edgedriver.driver_path
     assert not Path(edgedriver_path).exists()
 
     specific_version = 'edgedriver_beta'
-    file_name = edgedriver._download_driver(version=specific_version)
+    file_name = edgedriver._install_plan(edgedriver._plan_download(version=specific_version))
     assert file_name is not None
     assert len(file_name) > 0
     assert Path(edgedriver_path).exists()
@@ -89,11 +82,12 @@ def test_check_download_driver_specific_version(setup_edgedriver):
 
 def test_download_driver_latest_previous_version(setup_edgedriver):
     edgedriver, _, _ = setup_edgedriver
-    edgedriver._delete_current_driver_for_current_os()
+    if Path(edgedriver.driver_path).exists():
+        Path(edgedriver.driver_path).unlink()
     edgedriver_path = edgedriver.driver_path
     assert not Path(edgedriver_path).exists()
 
-    file_name = edgedriver._download_driver(previous_version=True)
+    file_name = edgedriver._install_plan(edgedriver._plan_download(previous_version=True))
     assert file_name is not None
     assert len(file_name) > 0
     assert Path(edgedriver_path).exists()
@@ -112,20 +106,13 @@ def test_get_latest_version_edge_driver(setup_edgedriver):
     assert len(latest_version) > 0
 
 
-def test_delete_current_edgedriver_for_current_os(setup_edgedriver):
-    edgedriver, _, _ = setup_edgedriver
-    edgedriver._delete_current_driver_for_current_os()
-    edgedriver_path = edgedriver.driver_path
-    assert not Path(edgedriver_path).exists()
-
-
 def test_download_driver(setup_edgedriver):
     edgedriver, _, _ = setup_edgedriver
     latest_version = edgedriver._get_latest_version_driver()
     assert latest_version is not None
     assert len(latest_version) > 0
 
-    file_name = edgedriver._download_driver()
+    file_name = edgedriver._install_plan(edgedriver._plan_download())
     assert file_name is not None
     assert len(file_name) > 0
     assert Path(edgedriver.driver_path).exists()
@@ -133,15 +120,15 @@ def test_download_driver(setup_edgedriver):
     edgedriver._chmod_driver()
 
 
-def test_compare_current_version_and_latest_version(setup_edgedriver):
+def test_plan_is_up_to_date(setup_edgedriver):
     edgedriver, _, _ = setup_edgedriver
-    is_driver_is_up_to_date, current_version, latest_version = edgedriver._compare_current_version_and_latest_version()
-    assert is_driver_is_up_to_date is not None
-    assert current_version is not None
-    assert latest_version is not None
-    assert is_driver_is_up_to_date
-    assert len(current_version) > 0
-    assert len(latest_version) > 0
+    plan = edgedriver.plan()
+    assert plan.is_up_to_date is not None
+    assert plan.current_version is not None
+    assert plan.version is not None
+    assert plan.is_up_to_date
+    assert len(plan.current_version) > 0
+    assert len(plan.version) > 0
 
 
 def test_check_if_edgedriver_is_up_to_date(setup_edgedriver):
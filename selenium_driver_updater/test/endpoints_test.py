@@ -0,0 +1,89 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from selenium_driver_updater._setting import setting
+from selenium_driver_updater.util.endpoints import Endpoints
+from selenium_driver_updater.util.downloader import Downloader
+from selenium_driver_updater.util.requests_getter import RequestsGetter
+
+class _FakeUpstreamHandler(BaseHTTPRequestHandler):
+    paths = []
+
+    def do_GET(self):
+        _FakeUpstreamHandler.paths.append(self.path)
+        body = json.dumps(dict(path=self.path)).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture()
+def fake_upstream():
+    _FakeUpstreamHandler.paths = []
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _FakeUpstreamHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture(autouse=True)
+def clear_endpoints(monkeypatch):
+    for name in (Endpoints.environ_file, Endpoints.environ_mirror):
+        monkeypatch.delenv(name, raising=False)
+    Endpoints.clear()
+    yield
+    Endpoints.clear()
+
+def test_default_urls_are_not_changed():
+    url = setting["ChromeDriver"]["LinkLastRelease"]
+    assert Endpoints.resolve(url) == url
+
+def test_precedence(tmp_path, monkeypatch):
+    file_path = tmp_path / 'endpoints.json'
+    file_path.write_text(json.dumps({'mirror': 'http://file-mirror', 'pypi': 'http://file-pypi/'}))
+    monkeypatch.setenv(Endpoints.environ_file, str(file_path))
+
+    assert Endpoints.get_base('pypi') == 'http://file-pypi/'
+    assert Endpoints.get_base('github') == 'http://file-mirror/github/'
+
+    monkeypatch.setenv(Endpoints.environ_prefix + 'API_GITHUB', 'http://env-github')
+    assert Endpoints.get_base('api.github') == 'http://env-github/'
+
+    Endpoints.configure(**{'api.github': 'http://kwarg-github/'})
+    assert Endpoints.resolve(setting["Github"]["linkAllReleases"].format('mozilla/geckodriver')).startswith('http://kwarg-github/repos/mozilla/geckodriver/')
+
+    with pytest.raises(ValueError):
+        Endpoints.configure(unknown='http://localhost/')
+
+def test_requests_are_routed_to_base(fake_upstream, tmp_path):
+    Endpoints.configure(mirror=fake_upstream)
+
+    json_data = RequestsGetter.get_result_by_request(url=setting["ChromeDriver"]["LinkLastRelease"], is_json=True, use_cache=False)
+    assert json_data['path'] == '/chrome-for-testing/last-known-good-versions.json'
+
+    url = setting["ChromeDriver"]["LinkLastReleaseFile"].format('120.0.6099.109')
+    Downloader.download(url=url, path=str(tmp_path / 'chromedriver.zip'))
+    assert _FakeUpstreamHandler.paths[-1].startswith('/chrome-for-testing-public/120.0.6099.109/')
+
+def test_query_of_base_is_routed():
+    Endpoints.configure(mirror='http://127.0.0.1:8788/')
+    url = setting["EdgeDriver"]["LinkCheckVersionIsValid"].format('120.0.2210.77')
+
+    assert Endpoints.resolve(url) == 'http://127.0.0.1:8788/edgewebdriver/?' + url.split('?', 1)[1]
+
+def test_every_upstream_of_setting_is_routed():
+    Endpoints.configure(mirror='http://127.0.0.1:8788/')
+
+    urls = [
+        value for section in setting.values() if isinstance(section, dict)
+        for value in section.values() if isinstance(value, str) and value.startswith(('http://', 'https://'))
+        ]
+
+    assert urls
+    assert [url for url in urls if not Endpoints.resolve(url).startswith('http://127.0.0.1:8788/')] == []
@@ -1,4 +1,7 @@
 import os
+import io
+import tarfile
+import zipfile
 import pytest
 import time
 from pathlib import Path
@@ -111,4 +114,66 @@ def test_extract_all_tar_archive_with_specific_name(setup_paths):
     print(f"Checking existence of {geckodriver_path}")
     assert Path(geckodriver_path).exists(), f"Expected file not found: {geckodriver_path}"
     Path(geckodriver_path).unlink()
-    assert not Path(geckodriver_path).exists()
\ No newline at end of file
+    assert not Path(geckodriver_path).exists()
+def _make_chromedriver_zip(tmp_path):
+    archive_path = tmp_path / 'chromedriver-linux64.zip'
+    with zipfile.ZipFile(archive_path, 'w') as zip_ref:
+        zip_ref.writestr('chromedriver-linux64/LICENSE.chromedriver', 'license')
+        member = zipfile.ZipInfo('chromedriver-linux64/chromedriver')
+        member.external_attr = 0o755 << 16
+        zip_ref.writestr(member, b'#!/bin/sh\necho "ChromeDriver 120.0.6099.109"\n')
+    return str(archive_path)
+
+def test_extract_zip_member_without_scratch_directories(tmp_path):
+    archive_path = _make_chromedriver_zip(tmp_path)
+    out_path = str(tmp_path / 'drivers') + os.path.sep
+
+    Extractor.extract_all_zip_archive(archive_path=archive_path, out_path=out_path)
+
+    assert sorted(os.listdir(out_path)) == ['chromedriver']
+    assert os.stat(out_path + 'chromedriver').st_mode & 0o777 == 0o755
+    assert not Path(archive_path).exists()
+
+def test_extract_zip_member_with_specific_name(tmp_path):
+    archive_path = _make_chromedriver_zip(tmp_path)
+    out_path = str(tmp_path) + os.path.sep
+
+    Extractor.extract_all_zip_archive_with_specific_name(
+        archive_path=archive_path, out_path=out_path, filename='chromedriver', filename_replace='chromedriver_120'
+    )
+
+    assert Path(out_path + 'chromedriver_120').read_bytes().startswith(b'#!/bin/sh')
+    assert sorted(os.listdir(out_path)) == ['chromedriver_120']
+
+def _make_geckodriver_tar_gz(tmp_path, members):
+    archive_path = tmp_path / 'geckodriver-v0.34.0-linux64.tar.gz'
+    with tarfile.open(archive_path, 'w:gz') as tar_ref:
+        for name, data in members:
+            member = tarfile.TarInfo(name)
+            member.size = len(data)
+            member.mode = 0o755
+            tar_ref.addfile(member, io.BytesIO(data))
+    return str(archive_path)
+
+def test_extract_tar_gz_member_stops_after_driver(tmp_path):
+    archive_path = _make_geckodriver_tar_gz(tmp_path, [('geckodriver', b'driver'), ('extra', os.urandom(1024 * 1024))])
+
+    #truncated tail must never be read, because driver member comes first
+    Path(archive_path).write_bytes(Path(archive_path).read_bytes()[:-4096])
+
+    Extractor.extract_all_zip_archive_with_specific_name(
+        archive_path=archive_path, out_path=str(tmp_path) + os.path.sep, filename='geckodriver', filename_replace='geckodriver_0.34'
+    )
+
+    assert (tmp_path / 'geckodriver_0.34').read_bytes() == b'driver'
+    assert os.stat(tmp_path / 'geckodriver_0.34').st_mode & 0o777 == 0o755
+    assert sorted(os.listdir(tmp_path)) == ['geckodriver_0.34']
+
+def test_extract_tar_gz_path_traversal_failure(tmp_path):
+    archive_path = _make_geckodriver_tar_gz(tmp_path, [('../evil', b'evil'), ('geckodriver', b'driver')])
+    out_path = str(tmp_path / 'drivers') + os.path.sep
+
+    with pytest.raises(tarfile.ExtractError):
+        Extractor.extract_all_tar_gz_archive(archive_path=archive_path, out_path=out_path, delete_archive=False)
+
+    assert not (tmp_path / 'evil').exists()
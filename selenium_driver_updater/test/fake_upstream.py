@@ -0,0 +1,418 @@
+#Standart library imports
+import functools
+import hashlib
+import io
+import json
+import random
+import re
+import tarfile
+import threading
+import time
+import zipfile
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+#Local imports
+from selenium_driver_updater._setting import setting
+
+CHROME_VERSION = '120.0.6099.109'
+EDGE_VERSION = '120.0.2210.77'
+EDGE_PLATFORMS = ('arm64', 'linux64', 'mac64', 'mac64_m1', 'win32', 'win64')
+
+#first build of every chrome milestone in known good versions
+CHROME_BUILDS = {113: 5672, 114: 5735, 115: 5790, 116: 5845, 117: 5938, 118: 5993, 119: 6045, 120: 6099}
+CHROME_PATCHES = 300
+CHROME_PLATFORMS = ('linux64', 'mac-arm64', 'mac-x64', 'win32', 'win64')
+
+GITHUB_RELEASES = {
+    'mozilla/geckodriver': [
+        dict(name='0.34.0', tag_name='v0.34.0', archive='geckodriver-v0.34.0-{}',
+             platforms=('linux-aarch64.tar.gz', 'linux32.tar.gz', 'linux64.tar.gz', 'macos-aarch64.tar.gz',
+                        'macos.tar.gz', 'win-aarch64.zip', 'win32.zip', 'win64.zip')),
+        dict(name='0.33.0', tag_name='v0.33.0', archive='geckodriver-v0.33.0-{}',
+             platforms=('linux-aarch64.tar.gz', 'linux32.tar.gz', 'linux64.tar.gz', 'macos-aarch64.tar.gz',
+                        'macos.tar.gz', 'win-aarch64.zip', 'win32.zip', 'win64.zip')),
+    ],
+    'operasoftware/operachromiumdriver': [
+        dict(name='120.0.6099.200', tag_name='v.120.0.6099.200', archive='operadriver_{}',
+             platforms=('linux64.zip', 'mac64.zip', 'win32.zip', 'win64.zip')),
+        dict(name='119.0.6045.124', tag_name='v.119.0.6045.124', archive='operadriver_{}',
+             platforms=('linux64.zip', 'mac64.zip', 'win32.zip', 'win64.zip')),
+    ],
+}
+
+#approximate sizes of real archives, padding of binaries is incompressible so it is stored in zip archives like zip tools do
+ARCHIVE_SIZES = {'chromedriver': 8_600_000, 'geckodriver': 2_900_000, 'msedgedriver': 8_500_000, 'operadriver': 8_100_000}
+
+class FakeUpstream():
+    """Local http server which serves metadata and driver archives of all upstreams like DriverMirror does,
+    so DriverUpdater runs offline against it with Endpoints.override(mirror=url)
+
+    Metadata has the shape and size of recorded upstream responses, archives contain a shell script
+    which prints version of driver padded with random bytes to realistic size.
+    """
+
+    def __init__(self, latency : float = 0.0, bandwidth : int = 0, max_age : int = 300):
+        """Prepares server
+
+        Args:
+            latency (float)     : Seconds before every response is sent. Defaults to 0.
+            bandwidth (int)     : Bytes per second of every response body, 0 is not limited. Defaults to 0.
+            max_age (int)       : Seconds while clients may use response without revalidation. Defaults to 300.
+
+        """
+
+        self.latency = float(latency)
+        self.bandwidth = int(bandwidth)
+        self.max_age = int(max_age)
+
+        self.requests : Counter = Counter()
+        self.sent_bytes : int = 0
+        self.log : list = []
+
+        self._lock = threading.Lock()
+        self._server : Any = None
+
+    def __enter__(self) -> str:
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def start(self) -> str:
+        """Starts server in background thread
+
+        Returns:
+            str
+
+            url (str) : Base url of server, like http://127.0.0.1:8788/
+
+        """
+
+        if self._server is None:
+            self._server = ThreadingHTTPServer(('127.0.0.1', 0), _FakeUpstreamHandler)
+            self._server.daemon_threads = True
+            setattr(self._server, 'upstream', self)
+
+            threading.Thread(target=self._server.serve_forever, name='fake_upstream', daemon=True).start()
+
+        return f'http://127.0.0.1:{self._server.server_address[1]}/'
+
+    def stop(self) -> None:
+        """Stops server"""
+
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def reset(self) -> None:
+        """Forgets counted requests and bytes"""
+
+        with self._lock:
+            self.requests.clear()
+            self.sent_bytes = 0
+            self.log.clear()
+
+    def get_resource(self, name : str, rest : str) -> Optional[Tuple[bytes, str]]:
+        """Gets body and content type of resource of specific upstream
+
+        Args:
+            name (str) : Name of upstream like in Endpoints.defaults, like api.github.
+            rest (str) : Path and query after base url of upstream, like repos/mozilla/geckodriver/releases?per_page=100.
+
+        Returns:
+            tuple
+
+            resource (tuple) : Body and content type or None if upstream does not have such resource.
+
+        """
+
+        resource : Any = None
+        query = parse_qs(urlsplit(rest).query)
+        rest = urlsplit(rest).path
+
+        if name == 'chrome-for-testing':
+            resource = _get_chrome_for_testing_resource(rest)
+
+        elif name == 'chrome-for-testing-public':
+            find = re.fullmatch(r'([0-9.]+)/([\w-]+)/chromedriver-\2\.zip', rest)
+            if find and find.group(1) in _get_chrome_versions() and find.group(2) in CHROME_PLATFORMS:
+                resource = (get_archive('chromedriver', find.group(1), find.group(2)), 'application/zip')
+
+        elif name == 'chromereleases' and rest.startswith('search/label/'):
+            resource = (_get_chrome_releases_page(), 'text/html')
+
+        elif name == 'edgewebdriver' and rest.startswith('LATEST_'):
+            resource = (EDGE_VERSION.encode('utf-8'), 'text/plain')
+
+        elif name == 'edgewebdriver' and not rest and query.get('comp') == ['list']:
+            resource = (_get_edge_listing(query.get('prefix', [''])[0]), 'application/xml')
+
+        elif name == 'edgedriver':
+            find = re.fullmatch(r'([0-9.]+)/edgedriver_(\w+)\.zip', rest)
+            if find and find.group(1) == EDGE_VERSION:
+                resource = (get_archive('msedgedriver', find.group(1), find.group(2)), 'application/zip')
+
+        elif name == 'api.github':
+            resource = _get_github_api_resource(rest, query)
+
+        elif name == 'github':
+            find = re.fullmatch(r'([\w-]+/[\w-]+)/releases/download/([\w.-]+)/([\w.-]+)', rest)
+            if find:
+                resource = _get_github_asset(*find.groups())
+
+        elif name == 'pypi' and rest == 'selenium-driver-updater/json':
+            body = json.dumps(dict(info=dict(name='selenium-driver-updater', version=str(setting["Program"]["version"]))))
+            resource = (body.encode('utf-8'), 'application/json')
+
+        return resource
+
+    def _count(self, name : str, path : str, status_code : int, sent_bytes : int) -> None:
+        with self._lock:
+            self.requests[name] += 1
+            self.sent_bytes += sent_bytes
+            self.log.append((path, status_code))
+
+class _FakeUpstreamHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        upstream : FakeUpstream = getattr(self.server, 'upstream')
+
+        name, _, rest = self.path.lstrip('/').partition('/')
+        resource = upstream.get_resource(name, rest)
+
+        if upstream.latency:
+            time.sleep(upstream.latency)
+
+        if resource is None:
+            body, status_code, content_type, etag = b'Not Found', 404, 'text/plain', ''
+        else:
+            body, content_type = resource
+            etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+            status_code = 304 if self.headers.get('If-None-Match') == etag else 200
+
+        if status_code == 304:
+            body = b''
+
+        self.send_response(status_code)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        if etag:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', f'max-age={upstream.max_age}')
+        if name == 'api.github':
+            self.send_header('X-RateLimit-Remaining', '59')
+        self.end_headers()
+
+        self._write_body(body, upstream.bandwidth)
+        upstream._count(name, self.path, status_code, len(body))
+
+    def _write_body(self, body : bytes, bandwidth : int) -> None:
+        started = time.perf_counter()
+        chunk_size = 64 * 1024
+
+        for offset in range(0, len(body), chunk_size):
+            self.wfile.write(body[offset:offset + chunk_size])
+
+            if bandwidth:
+                delay = (offset + chunk_size) / bandwidth - (time.perf_counter() - started)
+                if delay > 0:
+                    time.sleep(delay)
+
+    def log_message(self, *args):
+        pass
+
+@functools.lru_cache(maxsize=None)
+def _get_chrome_versions() -> tuple:
+    return tuple(
+        f'{milestone}.0.{build}.{patch}'
+        for milestone, build in CHROME_BUILDS.items() for patch in range(CHROME_PATCHES)
+        )
+
+def _get_chrome_url(product : str, version : str, platform : str) -> str:
+    return f'https://storage.googleapis.com/chrome-for-testing-public/{version}/{platform}/{product}-{platform}.zip'
+
+@functools.lru_cache(maxsize=None)
+def get_known_good_versions() -> bytes:
+    """Gets known-good-versions-with-downloads.json of about 5 MB with the layout of the real one"""
+
+    versions = []
+    for revision, version in enumerate(_get_chrome_versions(), start=1150000):
+        downloads = {
+            product: [dict(platform=platform, url=_get_chrome_url(product, version, platform)) for platform in CHROME_PLATFORMS]
+            for product in ('chrome', 'chromedriver', 'chrome-headless-shell')
+            }
+        versions.append(dict(version=version, revision=str(revision), downloads=downloads))
+
+    document = dict(timestamp='2023-12-13T08:09:32.153Z', versions=versions)
+    return json.dumps(document, separators=(',', ':')).encode('utf-8')
+
+def _get_chrome_for_testing_resource(rest : str) -> Any:
+    if rest == 'known-good-versions-with-downloads.json':
+        return (get_known_good_versions(), 'application/json')
+
+    if rest == 'last-known-good-versions.json':
+        channels = dict(Stable=CHROME_VERSION, Beta='121.0.6167.57', Dev='122.0.6226.2', Canary='122.0.6236.0')
+        document = dict(
+            timestamp='2023-12-13T08:09:32.153Z',
+            channels={channel: dict(channel=channel, version=version, revision='1217362') for channel, version in channels.items()},
+            )
+        return (json.dumps(document, indent=2).encode('utf-8'), 'application/json')
+
+    find = re.fullmatch(r'LATEST_RELEASE_(\d+)', rest)
+    if find:
+        versions = [version for version in _get_chrome_versions() if version.split('.')[0] == find.group(1)]
+        if versions:
+            return (versions[-1].encode('utf-8'), 'text/plain')
+
+    return None
+
+@functools.lru_cache(maxsize=None)
+def _get_chrome_releases_page() -> bytes:
+    posts = [
+        ('Stable Channel Update for Desktop', 'Tuesday, December 12, 2023',
+         f'The Stable channel has been updated to {CHROME_VERSION} for Mac and Linux and {CHROME_VERSION}/110 for Windows, '
+         'which will roll out over the coming days/weeks.'),
+        ('Extended Stable Updates for Desktop', 'Tuesday, December 12, 2023',
+         'The Extended Stable channel has been updated to 120.0.6099.110 for Windows and Mac.'),
+        ('Stable Channel Update for Desktop', 'Wednesday, December 6, 2023',
+         'The Stable channel has been updated to 120.0.6099.71 for Mac and Linux and 120.0.6099.71/72 for Windows.'),
+    ]
+
+    body = ''.join(
+        f"<div class='post' itemscope='itemscope'><h2 class='title'><a href='#'>{title}</a></h2>"
+        f"<div class='post-header'><span class='publishdate'>{date}</span></div>"
+        f"<div class='post-body'><p>{text}</p>{'<p>Security fixes and rewards.</p>' * 40}</div></div>"
+        for title, date, text in posts
+        )
+    return f'<!DOCTYPE html><html><head><title>Chrome Releases</title></head><body>{body}</body></html>'.encode('utf-8')
+
+def _get_edge_listing(prefix : str) -> bytes:
+    base = 'https://msedgewebdriverstorage.blob.core.windows.net/edgewebdriver'
+    names = [f'{EDGE_VERSION}/edgedriver_{platform}.zip' for platform in EDGE_PLATFORMS] if prefix == f'{EDGE_VERSION}/' else []
+
+    blobs = ''.join(
+        f'<Blob><Name>{name}</Name><Url>{base}/{name}</Url><Properties><Last-Modified>Tue, 12 Dec 2023 05:31:12 GMT</Last-Modified>'
+        f'<Content-Type>application/octet-stream</Content-Type><BlobType>BlockBlob</BlobType></Properties></Blob>'
+        for name in names
+        )
+    return (f'<?xml version="1.0" encoding="utf-8"?><EnumerationResults ContainerName="{base}"><Prefix>{prefix}</Prefix>'
+            f'<Delimiter>/</Delimiter><MaxResults>100</MaxResults><Blobs>{blobs}</Blobs><NextMarker /></EnumerationResults>').encode('utf-8')
+
+def _get_github_releases(repo_name : str) -> list:
+    releases = []
+    for release in GITHUB_RELEASES.get(repo_name, []):
+        assets = [
+            dict(
+                name=release['archive'].format(platform),
+                browser_download_url=f'https://github.com/{repo_name}/releases/download/{release["tag_name"]}/{release["archive"].format(platform)}',
+                content_type='application/zip' if platform.endswith('.zip') else 'application/gzip',
+                )
+            for platform in release['platforms']
+            ]
+        releases.append(dict(
+            name=release['name'], tag_name=release['tag_name'], draft=False, prerelease=False,
+            html_url=f'https://github.com/{repo_name}/releases/tag/{release["tag_name"]}', assets=assets,
+            ))
+    return releases
+
+def _get_github_api_resource(rest : str, query : dict) -> Any:
+    find = re.fullmatch(r'repos/([\w-]+/[\w-]+)/(releases/latest|releases|releases/tags/[\w.-]+|git/refs/tags)', rest)
+    if not find or find.group(1) not in GITHUB_RELEASES:
+        return None
+
+    repo_name, resource = find.groups()
+    releases = _get_github_releases(repo_name)
+
+    if resource == 'releases/latest':
+        document : Any = releases[0]
+    elif resource == 'releases':
+        #github returns at most 100 releases per page
+        per_page = min(int(query.get('per_page', ['30'])[0]), 100)
+        page = int(query.get('page', ['1'])[0])
+        document = releases[(page - 1) * per_page:page * per_page]
+    elif resource.startswith('releases/tags/'):
+        document = next((release for release in releases if release['tag_name'] == resource.split('/')[-1]), None)
+        if document is None:
+            return None
+    else:
+        document = [dict(ref=f'refs/tags/{release["tag_name"]}') for release in reversed(releases)]
+
+    return (json.dumps(document, indent=2).encode('utf-8'), 'application/json')
+
+def _get_github_asset(repo_name : str, tag_name : str, asset_name : str) -> Any:
+    for release in GITHUB_RELEASES.get(repo_name, []):
+        if release['tag_name'] != tag_name:
+            continue
+
+        for platform in release['platforms']:
+            if release['archive'].format(platform) != asset_name:
+                continue
+
+            driver_name = repo_name.split('/')[-1].replace('operachromiumdriver', 'operadriver')
+            platform = platform.replace('.tar.gz', '').replace('.zip', '')
+            content_type = 'application/zip' if asset_name.endswith('.zip') else 'application/gzip'
+
+            return (get_archive(driver_name, release['name'], platform, tar=asset_name.endswith('.tar.gz')), content_type)
+
+    return None
+
+@functools.lru_cache(maxsize=None)
+def get_archive(driver_name : str, version : str, platform : str, tar : bool = False) -> bytes:
+    """Gets archive of driver laid out like the real one, driver prints its version and is padded to realistic size
+
+    Args:
+        driver_name (str)   : Name of driver binary, like chromedriver or msedgedriver.
+        version (str)       : Version which driver prints.
+        platform (str)      : Platform of archive, like linux64.
+        tar (bool)          : If true, tar.gz archive is created instead of zip. Defaults to False.
+
+    Returns:
+        bytes
+
+        archive (bytes) : Content of archive.
+
+    """
+
+    filename = driver_name + ('.exe' if platform.startswith('win') else '')
+    names = dict(
+        chromedriver=f'ChromeDriver {version} (3f1f8e9d2c4c4ff8e5b7f0b1f0c3b4a9e1f2d3c4-refs/branch-heads/6099@{{#1}})',
+        geckodriver=f'geckodriver {version} (c44f0d09630a 2024-01-02 15:36 +0000)',
+        msedgedriver=f'Microsoft Edge WebDriver {version} (e6b5b5ca6b4a5f4e1b6a2dd1d8e0c3e2f9a1b2c3)',
+        operadriver=f'OperaDriver {version} (0e4a8b2c3d5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b-refs/branch-heads/6099@{{#1}})',
+        )
+    members = dict(
+        chromedriver={f'chromedriver-{platform}/{filename}': None, f'chromedriver-{platform}/LICENSE.chromedriver': b'license'},
+        geckodriver={filename: None},
+        msedgedriver={filename: None, 'Driver_Notes/credits.html': b'<html>credits</html>'},
+        operadriver={f'operadriver_{platform}/{filename}': None, f'operadriver_{platform}/sha512_sum': b'sum'},
+        )[driver_name]
+
+    #shell stops reading at exit, so random padding after it is never executed
+    script = f"#!/bin/sh\necho '{names[driver_name]}'\nexit 0\n".encode('utf-8')
+    size = ARCHIVE_SIZES[driver_name]
+    padding = random.Random(f'{driver_name}-{version}-{platform}').getrandbits(size * 8).to_bytes(size, 'little')
+    binary = script + padding
+
+    buffer = io.BytesIO()
+    if tar:
+        with tarfile.open(fileobj=buffer, mode='w:gz', compresslevel=1) as archive:
+            for name, content in members.items():
+                content = binary if content is None else content
+                member = tarfile.TarInfo(name)
+                member.size = len(content)
+                member.mode = 0o755
+                archive.addfile(member, io.BytesIO(content))
+    else:
+        with zipfile.ZipFile(buffer, 'w') as archive:
+            for name, content in members.items():
+                member = zipfile.ZipInfo(name, date_time=(2023, 12, 12, 0, 0, 0))
+                member.external_attr = 0o755 << 16
+                member.compress_type = zipfile.ZIP_STORED if content is None else zipfile.ZIP_DEFLATED
+                archive.writestr(member, binary if content is None else content)
+
+    return buffer.getvalue()
@@ -0,0 +1,94 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from selenium_driver_updater.util.file_lock import FileLock
+from selenium_driver_updater.util.http_cache import HttpCache
+
+LOCKED_CODE = """
+import sys, time
+from selenium_driver_updater.util.file_lock import FileLock
+
+with FileLock(sys.argv[1]):
+    with open(sys.argv[2], 'a') as file:
+        file.write('start\\n')
+    time.sleep(0.2)
+    with open(sys.argv[2], 'a') as file:
+        file.write('end\\n')
+"""
+
+def test_lock_between_processes(tmp_path):
+    lock_path = str(tmp_path / '.chromedriver.lock')
+    log_path = tmp_path / 'log'
+
+    processes = [subprocess.Popen([sys.executable, '-c', LOCKED_CODE, lock_path, str(log_path)]) for _ in range(3)]
+    for process in processes:
+        assert process.wait(timeout=30) == 0
+
+    assert log_path.read_text().split() == ['start', 'end'] * 3
+
+def test_waiters_reuse_result(tmp_path):
+    lock_path = FileLock.get_driver_lock_path(str(tmp_path), 'chromedriver')
+    driver_path = tmp_path / 'chromedriver'
+    downloads = []
+
+    def install():
+        with FileLock(lock_path, remove_on_release=True):
+            if not driver_path.exists():
+                downloads.append(threading.get_ident())
+                time.sleep(0.1)
+                driver_path.write_text('driver')
+
+    threads = [threading.Thread(target=install) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(downloads) == 1
+    assert not os.path.exists(lock_path)
+
+def test_removed_lock_file_is_not_shared(tmp_path):
+    lock_path = str(tmp_path / 'locks' / 'chromedriver.lock')
+    active = []
+    max_active = []
+
+    def install():
+        for _ in range(20):
+            with FileLock(lock_path, poll_interval=0.001, remove_on_release=True):
+                active.append(1)
+                max_active.append(len(active))
+                time.sleep(0.001)
+                active.pop()
+
+    threads = [threading.Thread(target=install) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max(max_active) == 1
+    assert not os.listdir(tmp_path / 'locks')
+
+def test_lock_timeout_failure(tmp_path):
+    lock_path = str(tmp_path / '.geckodriver.lock')
+
+    with FileLock(lock_path):
+        with pytest.raises(TimeoutError):
+            FileLock(lock_path, timeout=0.2).acquire()
+
+    with FileLock(lock_path, timeout=0.2):
+        pass
+
+def test_driver_lock_path_is_in_cache(tmp_path):
+    with HttpCache.override(path=str(tmp_path / 'cache')):
+        lock_path = FileLock.get_driver_lock_path(str(tmp_path / 'drivers') + os.path.sep, 'chromedriver')
+
+        assert lock_path.startswith(HttpCache.get_root_path())
+        assert lock_path == FileLock.get_driver_lock_path(str(tmp_path / 'drivers'), 'chromedriver')
+        assert lock_path != FileLock.get_driver_lock_path(str(tmp_path / 'other'), 'chromedriver')
+        assert lock_path != FileLock.get_driver_lock_path(str(tmp_path / 'drivers'), 'geckodriver')
@@ -59,15 +59,7 @@ def test_download_driver_failure(gecko_driver_setup):
     """Test downloading driver with failure."""
     _, gecko_driver_failure = gecko_driver_setup
     with pytest.raises(DriverVersionInvalidException):
-        gecko_driver_failure._download_driver(version='blablablanotversion')
-
-def test_compare_current_version_and_latest_version_failure(gecko_driver_setup):
-    """Test comparing current and latest versions with failure."""
-    _, gecko_driver_failure = gecko_driver_setup
-    is_driver_is_up_to_date, current_version, latest_version = gecko_driver_failure._compare_current_version_and_latest_version_github()
-    assert not is_driver_is_up_to_date
-    assert len(current_version) == 0
-    assert len(latest_version) == 0
+        gecko_driver_failure._install_plan(gecko_driver_failure._plan_download(version='blablablanotversion'))
 
 def test_geckodriver_is_up_to_date_failure(gecko_driver_setup):
     """Test if GeckoDriver is up to date with failure."""
@@ -84,10 +76,11 @@ def test_if_version_is_valid_failure(gecko_driver_setup):
 def test_download_driver_specific_version(setup_paths):
     """Test downloading a specific version of GeckoDriver."""
     gecko_driver, geckodriver_path = setup_paths
-    gecko_driver._delete_current_driver_for_current_os()
+    if Path(gecko_driver.driver_path).exists():
+        Path(gecko_driver.driver_path).unlink()
     assert not Path(geckodriver_path).exists()
 
-    file_name = gecko_driver._download_driver(version='0.29.1')
+    file_name = gecko_driver._install_plan(gecko_driver._plan_download(version='0.29.1'))
     assert file_name is not None
     assert len(file_name) > 0
     assert Path(geckodriver_path).exists()
@@ -102,10 +95,11 @@ def test_download_driver_specific_version(setup_paths):
 def test_download_driver_latest_previous_version(setup_paths):
     """Test downloading the latest previous version of GeckoDriver."""
     gecko_driver, geckodriver_path = setup_paths
-    gecko_driver._delete_current_driver_for_current_os()
+    if Path(gecko_driver.driver_path).exists():
+        Path(gecko_driver.driver_path).unlink()
     assert not Path(geckodriver_path).exists()
 
-    file_name = gecko_driver._download_driver(previous_version=True)
+    file_name = gecko_driver._install_plan(gecko_driver._plan_download(previous_version=True))
     assert file_name is not None
     assert len(file_name) > 0
     assert Path(geckodriver_path).exists()
@@ -123,31 +117,25 @@ def test_get_latest_version_gecko_driver(gecko_driver_setup):
     assert latest_version is not None
     assert len(latest_version) > 0
 
-def test_delete_current_geckodriver_for_current_os(setup_paths):
-    """Test deleting the current GeckoDriver for the current OS."""
-    gecko_driver, geckodriver_path = setup_paths
-    gecko_driver._delete_current_driver_for_current_os()
-    assert not Path(geckodriver_path).exists()
-
 def test_download_driver(setup_paths):
     """Test downloading the latest version of GeckoDriver."""
     gecko_driver, geckodriver_path = setup_paths
-    file_name = gecko_driver._download_driver()
+    file_name = gecko_driver._install_plan(gecko_driver._plan_download())
     assert file_name is not None
     assert len(file_name) > 0
     assert Path(geckodriver_path).exists()
 
     gecko_driver._chmod_driver()
 
-def test_compare_current_version_and_latest_version(gecko_driver_setup):
-    """Test comparing current and latest versions."""
+def test_plan_is_up_to_date(gecko_driver_setup):
+    """Test plan of driver which is up to date."""
     gecko_driver, _ = gecko_driver_setup
-    is_driver_is_up_to_date, current_version, latest_version = gecko_driver._compare_current_version_and_latest_version_github()
-    assert is_driver_is_up_to_date
-    assert current_version is not None
-    assert len(current_version) > 0
-    assert latest_version is not None
-    assert len(latest_version) > 0
+    plan = gecko_driver.plan()
+    assert plan.is_up_to_date
+    assert plan.current_version is not None
+    assert len(plan.current_version) > 0
+    assert plan.version is not None
+    assert len(plan.version) > 0
 
 def test_get_current_version_firefox_selenium(gecko_driver_setup):
     """Test getting the current version of Firefox used by Selenium."""
@@ -3,7 +3,12 @@ import jsonschema
 import json
 from pathlib import Path
 from selenium_driver_updater.util.github_viewer import GithubViewer
-from selenium_driver_updater.util.exceptions import StatusCodeNotEqualException
+from selenium_driver_updater.util.github_releases_index import GithubReleasesIndex
+from selenium_driver_updater.util.endpoints import Endpoints
+from selenium_driver_updater.util.http_cache import HttpCache
+from selenium_driver_updater.util.tracer import Tracer
+from selenium_driver_updater.util.exceptions import StatusCodeNotEqualException, ReleaseNotFoundException
+from selenium_driver_updater.test.fake_upstream import FakeUpstream
 from selenium_driver_updater._setting import setting
 
 INVALID_REPO_NAME = 'mazilla/geckadruver'
@@ -58,4 +63,66 @@ def test_get_release_version_by_repo_name(setup):
     version_site = setup["github_viewer"].get_release_version_by_repo_name_via_site(repo_name=setup["repo_name"])
     assert len(version_site) > 0, "Expected non-empty version from website"
 
-    assert version_api == version_site, f'API version: {version_api} does not match site version: {version_site}'
\ No newline at end of file
+    assert version_api == version_site, f'API version: {version_api} does not match site version: {version_site}'
+
+@pytest.fixture()
+def upstream(tmp_path):
+    fake_upstream = FakeUpstream(max_age=0)
+    with fake_upstream as url, Endpoints.override(mirror=url), HttpCache.override(enabled=True, path=str(tmp_path / 'cache')):
+        yield fake_upstream
+
+def test_previous_release_is_requested_by_page(upstream):
+    assert GithubViewer.get_release_version_by_repo_name(repo_name='mozilla/geckodriver', index=1) == '0.33.0'
+
+    assert upstream.log == [('/api.github/repos/mozilla/geckodriver/releases?per_page=10&page=1', 200)]
+    assert GithubReleasesIndex.get('mozilla/geckodriver', 'v0.33.0')['name'] == '0.33.0'
+
+def test_release_index_beyond_last_page_failure(upstream):
+    with pytest.raises(ReleaseNotFoundException, match='has no release with index 9'):
+        GithubViewer.get_release_version_by_repo_name(repo_name='mozilla/geckodriver', index=9)
+
+    assert upstream.log == [('/api.github/repos/mozilla/geckodriver/releases?per_page=10&page=1', 200)]
+
+def test_assets_are_checked_in_index(upstream):
+    assert GithubViewer.get_release_version_by_repo_name(repo_name='mozilla/geckodriver') == '0.34.0'
+    upstream.reset()
+
+    assert GithubViewer.is_asset_released('mozilla/geckodriver', 'v0.34.0', 'geckodriver-v0.34.0-linux64.tar.gz')
+    assert not upstream.log
+
+    assert not GithubViewer.is_asset_released('mozilla/geckodriver', 'v0.34.0', 'geckodriver-v0.34.0-solaris.tar.gz')
+    assert not GithubViewer.is_asset_released('mozilla/geckodriver', 'v0.30.0', 'geckodriver-v0.30.0-linux64.tar.gz')
+    assert [status_code for _, status_code in upstream.log] == [200, 404]
+    assert upstream.log[0][0] == '/api.github/repos/mozilla/geckodriver/releases/tags/v0.34.0'
+
+def test_unchanged_release_is_revalidated_with_etag(upstream):
+    with Tracer.collect() as report:
+        GithubViewer.get_release_by_tag('operasoftware/operachromiumdriver', 'v.120.0.6099.200', use_index=False)
+        release = GithubViewer.get_release_by_tag('operasoftware/operachromiumdriver', 'v.120.0.6099.200', use_index=False)
+
+    assert release['name'] == '120.0.6099.200'
+    assert 'operadriver_linux64.zip' in release['assets']
+    assert [status_code for _, status_code in upstream.log] == [200, 304]
+    assert report['summary']['fetch']['cache'] == {'miss': 1, 'revalidated': 1}
+
+def test_token_is_sent_only_to_github_api(monkeypatch):
+    url = setting["Github"]["linkLatestReleaseBySpecificRepoName"].format('mozilla/geckodriver')
+    monkeypatch.setattr(GithubViewer, '_options', {})
+    monkeypatch.setenv(GithubViewer.token_environ, 'environ-token')
+
+    assert GithubViewer.get_headers(url)['Authorization'] == 'Bearer environ-token'
+
+    GithubViewer.configure(token='configured-token')
+    assert GithubViewer.get_headers(url)['Authorization'] == 'Bearer configured-token'
+
+    with Endpoints.override(mirror='http://127.0.0.1:8788/'):
+        assert 'Authorization' not in GithubViewer.get_headers(url)
+
+    with Endpoints.override(mirror='https://mirror.example.com/'):
+        assert 'Authorization' not in GithubViewer.get_headers(url)
+
+    with Endpoints.override(**{'api.github': 'https://github-api.example.com/'}):
+        assert 'Authorization' not in GithubViewer.get_headers(url)
+
+    monkeypatch.setenv('SELENIUM_DRIVER_UPDATER_ENDPOINT_API_GITHUB', 'https://github-api.example.com/')
+    assert 'Authorization' not in GithubViewer.get_headers(url)
@@ -0,0 +1,86 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from selenium_driver_updater.util.http_cache import HttpCache
+from selenium_driver_updater.util.requests_getter import RequestsGetter
+
+ETAG = '"v1"'
+
+class _EtagHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    statuses = []
+    cache_control = 'max-age=0'
+
+    def do_GET(self):
+        if self.headers.get('If-None-Match') == ETAG:
+            _EtagHandler.statuses.append(304)
+            self.send_response(304)
+            self.send_header('ETag', ETAG)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        body = b'{"version": "1.0.0"}'
+        _EtagHandler.statuses.append(200)
+        self.send_response(200)
+        self.send_header('ETag', ETAG)
+        self.send_header('Cache-Control', _EtagHandler.cache_control)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture()
+def local_server(tmp_path):
+    _EtagHandler.statuses = []
+    _EtagHandler.cache_control = 'max-age=0'
+    HttpCache.configure(path=str(tmp_path), enabled=True)
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _EtagHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}/versions.json'
+    server.shutdown()
+    server.server_close()
+    HttpCache._options.clear()
+
+def test_get_not_cached_url(local_server):
+    assert HttpCache.get(local_server) is None
+
+def test_revalidation_with_etag(local_server):
+    first = RequestsGetter.get_result_by_request(url=local_server, is_json=True)
+    second = RequestsGetter.get_result_by_request(url=local_server, is_json=True)
+
+    assert first == second == {'version': '1.0.0'}
+    assert _EtagHandler.statuses == [200, 304]
+
+def test_fresh_entry_skips_request(local_server):
+    _EtagHandler.cache_control = 'max-age=600'
+
+    RequestsGetter.get_result_by_request(url=local_server)
+    RequestsGetter.get_result_by_request(url=local_server)
+
+    assert _EtagHandler.statuses == [200]
+    assert HttpCache.get(local_server).is_fresh()
+
+def test_no_store_is_not_cached(local_server):
+    _EtagHandler.cache_control = 'no-store'
+
+    RequestsGetter.get_result_by_request(url=local_server)
+    RequestsGetter.get_result_by_request(url=local_server)
+
+    assert _EtagHandler.statuses == [200, 200]
+    assert HttpCache.get(local_server) is None
+
+def test_use_cache_disabled(local_server):
+    RequestsGetter.get_result_by_request(url=local_server, use_cache=False)
+    assert HttpCache.get(local_server) is None
+
+def test_clear(local_server):
+    RequestsGetter.get_result_by_request(url=local_server)
+    HttpCache.clear()
+    assert HttpCache.get(local_server) is None
@@ -0,0 +1,65 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from selenium_driver_updater.util.http_session import HttpSession
+from selenium_driver_updater.util.requests_getter import RequestsGetter
+
+class _CountingHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    connections = set()
+
+    def do_GET(self):
+        _CountingHandler.connections.add(self.client_address)
+        body = b'ok'
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture()
+def local_server():
+    _CountingHandler.connections = set()
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _CountingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}/'
+    server.shutdown()
+    server.server_close()
+
+def test_configure_failure():
+    with pytest.raises(ValueError):
+        HttpSession.configure(blablabla=1)
+
+def test_get_session_is_reused_in_thread():
+    assert HttpSession.get_session() is HttpSession.get_session()
+
+def test_get_session_shares_adapter_between_threads():
+    sessions = []
+    thread = threading.Thread(target=lambda: sessions.append(HttpSession.get_session()))
+    thread.start()
+    thread.join()
+
+    assert sessions[0] is not HttpSession.get_session()
+    assert sessions[0].adapters['https://'] is HttpSession.get_session().adapters['https://']
+
+def test_requests_reuse_connection(local_server):
+    for _ in range(5):
+        assert RequestsGetter.get_result_by_request(url=local_server) == 'ok'
+
+    assert len(_CountingHandler.connections) == 1
+
+def test_configure_recreates_pool(local_server):
+    session = HttpSession.get_session()
+    HttpSession.configure(pool_maxsize=2, timeout=(5, 5))
+    try:
+        assert HttpSession.get_session() is not session
+        assert HttpSession.get_timeout() == (5, 5)
+        assert RequestsGetter.get_result_by_request(url=local_server) == 'ok'
+    finally:
+        HttpSession._options.clear()
+        HttpSession.close()
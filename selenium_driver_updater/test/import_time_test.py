@@ -0,0 +1,36 @@
+import subprocess
+import sys
+
+from selenium_driver_updater.util import ALL_DRIVERS
+
+IMPORT_TIME_BUDGET = 0.5
+
+HEAVY_MODULES = ('selenium', 'bs4', 'requests', 'selenium_driver_updater.driver_base')
+
+def _run_python(code):
+    process = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return process.stdout.strip()
+
+def test_import_does_not_load_heavy_modules():
+    code = (
+        'import sys\n'
+        'import selenium_driver_updater.consoleUpdater\n'
+        f'print(",".join(name for name in {HEAVY_MODULES!r} if name in sys.modules))'
+    )
+    assert _run_python(code) == ''
+
+def test_import_time_budget():
+    code = (
+        'import time\n'
+        'started = time.perf_counter()\n'
+        'import selenium_driver_updater\n'
+        'print(time.perf_counter() - started)'
+    )
+    assert min(float(_run_python(code)) for _ in range(3)) < IMPORT_TIME_BUDGET
+
+def test_lazy_driver_registry():
+    from selenium_driver_updater._chromeDriver import ChromeDriver
+
+    assert 'chromedriver' in ALL_DRIVERS
+    assert ALL_DRIVERS['chromedriver'] is ChromeDriver
+    assert sorted(ALL_DRIVERS) == ['chromedriver', 'edgedriver', 'geckodriver', 'operadriver', 'safaridriver']
@@ -0,0 +1,29 @@
+import threading
+
+import pytest
+
+from selenium_driver_updater.util.json_index import JsonIndex
+
+def test_concurrent_updates_are_kept(tmp_path):
+    path = str(tmp_path / 'index.json')
+
+    def update(index):
+        JsonIndex.update(path, lambda entries: entries.update({str(index): index}))
+
+    threads = [threading.Thread(target=update, args=(index,)) for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert JsonIndex.read(path) == {str(index): index for index in range(8)}
+
+def test_update_failure(tmp_path):
+    path = str(tmp_path / 'file' / 'index.json')
+    (tmp_path / 'file').write_text('not a folder')
+
+    assert JsonIndex.read(path) == {}
+    assert not JsonIndex.update(path, lambda index: index.update(key='value'), ignore_errors=True)
+
+    with pytest.raises(OSError):
+        JsonIndex.update(path, lambda index: index.update(key='value'))
@@ -0,0 +1,154 @@
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from selenium_driver_updater.driverUpdater import DriverUpdater
+from selenium_driver_updater.util import ALL_DRIVERS
+from selenium_driver_updater.util.http_cache import HttpCache
+from selenium_driver_updater.util.metrics_exporter import MetricsExporter
+from selenium_driver_updater.util.requests_getter import RequestsGetter
+from selenium_driver_updater.util.tracer import Tracer
+
+prefix = MetricsExporter.prefix
+
+def _get_samples(text):
+    return dict(line.rsplit(' ', 1) for line in text.splitlines() if not line.startswith('#'))
+
+def _get_report():
+    with Tracer.collect('install') as report:
+        with Tracer.span('driver', driver_name='chromedriver', system_name='linux64', path='/drivers/'):
+            with Tracer.span('resolve'), Tracer.span('verify', version='119.0.6045.105'):
+                pass
+            with Tracer.span('fetch', url='https://googlechromelabs.github.io/chrome-for-testing/LATEST_RELEASE_STABLE', cache='hit'):
+                pass
+            with Tracer.span('download', url='https://storage.googleapis.com/chrome-for-testing-public/120.0.6099.109/linux64/chromedriver-linux64.zip', bytes=1000):
+                pass
+            Tracer.set(version='120.0.6099.109')
+
+        with pytest.raises(OSError):
+            with Tracer.span('driver', driver_name='geckodriver', system_name='linux64', path='/drivers/'):
+                with Tracer.span('verify', version='0.33.0'):
+                    pass
+                with Tracer.span('fetch', url='https://api.github.com/repos/mozilla/geckodriver/releases/latest', cache='miss', rate_limit_remaining=42):
+                    pass
+                raise OSError('connection reset')
+
+        with Tracer.span('driver', driver_name='edgedriver', system_name='win64', path='/drivers/'):
+            with Tracer.span('verify', version='120.0.2210.91'):
+                pass
+            Tracer.set(version='120.0.2210.91', is_up_to_date=True)
+
+    return report
+
+def test_render_metrics_of_report():
+    report = _get_report()
+    text = MetricsExporter.render(report)
+    samples = _get_samples(text)
+
+    assert f'# TYPE {prefix}driver_up_to_date gauge' in text
+    assert samples[f'{prefix}last_run_success'] == '0'
+    assert float(samples[f'{prefix}last_run_timestamp_seconds']) == report['started_at'] + report['duration']
+    chrome_labels = 'driver="chromedriver",system_name="linux64",path="/drivers/"'
+    gecko_labels = 'driver="geckodriver",system_name="linux64",path="/drivers/"'
+    edge_labels = 'driver="edgedriver",system_name="win64",path="/drivers/"'
+    assert samples[f'{prefix}driver_up_to_date{{{chrome_labels}}}'] == '1'
+    assert samples[f'{prefix}driver_up_to_date{{{gecko_labels}}}'] == '0'
+    assert samples[f'{prefix}driver_up_to_date{{{edge_labels}}}'] == '1'
+    assert samples[f'{prefix}driver_info{{{chrome_labels},installed_version="120.0.6099.109",latest_version="120.0.6099.109"}}'] == '1'
+    assert samples[f'{prefix}driver_info{{{gecko_labels},installed_version="0.33.0",latest_version=""}}'] == '1'
+    assert samples[f'{prefix}driver_info{{{edge_labels},installed_version="120.0.2210.91",latest_version="120.0.2210.91"}}'] == '1'
+    assert f'{prefix}driver_last_success_timestamp_seconds{{{chrome_labels}}}' in samples
+    assert f'{prefix}driver_last_success_timestamp_seconds{{{gecko_labels}}}' not in samples
+    assert samples[f'{prefix}driver_download_bytes{{{chrome_labels}}}'] == '1000'
+    assert samples[f'{prefix}http_requests{{upstream="chrome-for-testing",cache="hit"}}'] == '1'
+    assert samples[f'{prefix}http_requests{{upstream="chrome-for-testing-public",cache="miss"}}'] == '1'
+    assert samples[f'{prefix}http_requests{{upstream="api.github",cache="miss"}}'] == '1'
+    assert samples[f'{prefix}http_cache_hit_ratio'] == '0.5'
+    assert samples[f'{prefix}github_rate_limit_remaining'] == '42'
+
+def test_up_to_date_when_installed_version_is_latest():
+    with Tracer.collect('install') as report:
+        with Tracer.span('driver', driver_name='chromedriver', system_name='linux64', path='/drivers/'):
+            with Tracer.span('verify', version='119.0.6045.105'):
+                pass
+            Tracer.set(version='120.0.6099.109', is_up_to_date=True)
+
+    samples = _get_samples(MetricsExporter.render(report))
+    labels = 'driver="chromedriver",system_name="linux64",path="/drivers/"'
+
+    assert samples[f'{prefix}driver_up_to_date{{{labels}}}'] == '0'
+    assert samples[f'{prefix}driver_info{{{labels},installed_version="119.0.6045.105",latest_version="120.0.6099.109"}}'] == '1'
+
+def test_last_success_of_drivers_is_kept_from_previous_textfile(tmp_path):
+    textfile_path = str(tmp_path / 'textfile' / 'selenium_driver_updater.prom')
+    report = _get_report()
+    gecko_labels = 'driver="geckodriver",system_name="linux64",path="/drivers/"'
+    chrome_labels = 'driver="chromedriver",system_name="linux64",path="/drivers/"'
+
+    with open(tmp_path / 'previous.prom', 'w', encoding='utf-8') as file:
+        file.write(f'{prefix}driver_last_success_timestamp_seconds{{{gecko_labels}}} 1700000000.0\n'
+                   f'{prefix}driver_last_success_timestamp_seconds{{{chrome_labels}}} 1600000000.0\n')
+    (tmp_path / 'textfile').mkdir()
+    (tmp_path / 'previous.prom').replace(textfile_path)
+
+    MetricsExporter.write_textfile(report, textfile_path)
+
+    with open(textfile_path, encoding='utf-8') as file:
+        samples = _get_samples(file.read())
+
+    assert samples[f'{prefix}driver_last_success_timestamp_seconds{{{gecko_labels}}}'] == '1700000000.0'
+    assert float(samples[f'{prefix}driver_last_success_timestamp_seconds{{{chrome_labels}}}']) > 1600000000.0
+    assert [path.name for path in (tmp_path / 'textfile').iterdir()] == ['selenium_driver_updater.prom']
+
+def test_labels_are_escaped():
+    assert MetricsExporter._format_labels((('driver', 'a"b\\c\nd'),)) == '{driver="a\\"b\\\\c\\nd"}'
+
+class _RateLimitHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        body = b'{"name": "0.34.0"}'
+        self.send_response(200)
+        self.send_header('X-RateLimit-Remaining', '57')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class _MetricsDriver():
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+    def main(self):
+        RequestsGetter.get_result_by_request(url=_MetricsDriver.url, use_cache=False)
+        Tracer.set(version='0.34.0')
+        return self.kwargs['path'] + self.kwargs['driver_name']
+
+def test_install_writes_metrics_textfile(monkeypatch, tmp_path):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _RateLimitHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    _MetricsDriver.url = f'http://127.0.0.1:{server.server_address[1]}/repos/mozilla/geckodriver/releases/latest'
+    monkeypatch.setitem(ALL_DRIVERS, 'geckodriver', _MetricsDriver)
+    textfile_path = str(tmp_path / 'selenium_driver_updater.prom')
+
+    try:
+        with HttpCache.override(enabled=False), Tracer.collect() as report:
+            DriverUpdater.install('geckodriver', path=str(tmp_path), metrics_path=textfile_path,
+                                  enable_library_update_check=False, info_messages=False)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    with open(textfile_path, encoding='utf-8') as file:
+        samples = _get_samples(file.read())
+
+    assert samples[f'{prefix}last_run_success'] == '1'
+    path = str(tmp_path) + os.path.sep
+    assert samples[f'{prefix}driver_up_to_date{{driver="geckodriver",system_name="",path="{path}"}}'] == '1'
+    assert samples[f'{prefix}http_requests{{upstream="127.0.0.1:{server.server_address[1]}",cache="miss"}}'] == '1'
+    assert f'{prefix}github_rate_limit_remaining' not in samples
+    assert [span['attributes']['rate_limit_remaining'] for span in Tracer._walk(report) if span['name'] == 'fetch'] == [57]
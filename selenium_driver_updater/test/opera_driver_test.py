@@ -48,15 +48,7 @@ def test_get_current_version_operadriver_selenium_failure(setup_operadriver):
 def test_download_driver_failure(setup_operadriver):
     _, operadriver_failure = setup_operadriver
     with pytest.raises(DriverVersionInvalidException):
-        operadriver_failure._download_driver(version="blablablanotversion")
-
-
-def test_compare_current_version_and_latest_version_failure(setup_operadriver):
-    _, operadriver_failure = setup_operadriver
-    is_driver_is_up_to_date, current_version, latest_version = operadriver_failure._compare_current_version_and_latest_version_github()
-    assert not is_driver_is_up_to_date
-    assert len(current_version) == 0
-    assert len(latest_version) == 0
+        operadriver_failure._install_plan(operadriver_failure._plan_download(version="blablablanotversion"))
 
 
 def test_check_if_operadriver_is_up_to_date_failure(setup_operadriver):
@@ -73,12 +65,13 @@ def test_check_if_version_is_valid_failure(setup_operadriver):
 
 def test_download_driver_specific_version(setup_operadriver):
     operadriver, _ = setup_operadriver
-    operadriver._delete_current_driver_for_current_os()
+    if Path(operadriver.driver_path).exists():
+        Path(operadriver.driver_path).unlink()
     operadriver_path = operadriver.driver_path
     assert not Path(operadriver_path).exists()
 
     specific_version = '89.0.4389.82'
-    file_name = operadriver._download_driver(version=specific_version)
+    file_name = operadriver._install_plan(operadriver._plan_download(version=specific_version))
     assert file_name is not None
     assert len(file_name) > 0
     assert Path(operadriver_path).exists()
@@ -93,11 +86,12 @@ def test_download_driver_specific_version(setup_operadriver):
 
 def test_download_driver_latest_previous_version(setup_operadriver):
     operadriver, _ = setup_operadriver
-    operadriver._delete_current_driver_for_current_os()
+    if Path(operadriver.driver_path).exists():
+        Path(operadriver.driver_path).unlink()
     operadriver_path = operadriver.driver_path
     assert not Path(operadriver_path).exists()
 
-    file_name = operadriver._download_driver(previous_version=True)
+    file_name = operadriver._install_plan(operadriver._plan_download(previous_version=True))
     assert file_name is not None
     assert len(file_name) > 0
     assert Path(operadriver_path).exists()
@@ -116,16 +110,9 @@ def test_get_latest_version_operadriver(setup_operadriver):
     assert len(latest_version) > 0
 
 
-def test_delete_current_operadriver_for_current_os(setup_operadriver):
-    operadriver, _ = setup_operadriver
-    operadriver._delete_current_driver_for_current_os()
-    operadriver_path = operadriver.driver_path
-    assert not Path(operadriver_path).exists()
-
-
 def test_download_driver(setup_operadriver):
     operadriver, _ = setup_operadriver
-    file_name = operadriver._download_driver()
+    file_name = operadriver._install_plan(operadriver._plan_download())
     assert file_name is not None
     assert len(file_name) > 0
     assert Path(operadriver.driver_path).exists()
@@ -133,15 +120,15 @@ def test_download_driver(setup_operadriver):
     operadriver._chmod_driver()
 
 
-def test_compare_current_version_and_latest_version(setup_operadriver):
+def test_plan_is_up_to_date(setup_operadriver):
     operadriver, _ = setup_operadriver
-    is_driver_is_up_to_date, current_version, latest_version = operadriver._compare_current_version_and_latest_version_github()
-    assert is_driver_is_up_to_date is not None
-    assert current_version is not None
-    assert latest_version is not None
-    assert is_driver_is_up_to_date
-    assert len(current_version) > 0
-    assert len(latest_version) > 0
+    plan = operadriver.plan()
+    assert plan.is_up_to_date is not None
+    assert plan.current_version is not None
+    assert plan.version is not None
+    assert plan.is_up_to_date
+    assert len(plan.current_version) > 0
+    assert len(plan.version) > 0
 
 
 def test_get_current_version_operadriver_selenium(setup_operadriver):
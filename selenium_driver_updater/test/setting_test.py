@@ -86,10 +86,14 @@ def settings():
     return setting
 
 def test_check_count_main_param(settings):
-    assert len(settings) == 13
+    assert len(settings) == 17
 
 def test_check_count_params(settings):
     assert len(settings["Program"]) == 5
+    assert len(settings["Http"]) == 4
+    assert len(settings["Cache"]) == 4
+    assert len(settings["Watch"]) == 4
+    assert len(settings["Mirror"]) == 3
     assert len(settings["ChromeDriver"]) == 5
     assert len(settings["GeckoDriver"]) == 2
     assert len(settings["OperaDriver"]) == 2
@@ -102,7 +106,7 @@ def test_check_count_params(settings):
     assert len(settings["OperaBrowser"]) == 2
 
     assert len(settings["JsonSchema"]) == 3
-    assert len(settings["Github"]) == 3
+    assert len(settings["Github"]) == 6
     assert len(settings["PyPi"]) == 1
 
 def test_check_values_params(settings):
@@ -139,5 +143,8 @@ def test_check_values_params(settings):
     assert settings["Github"]["linkLatestReleaseBySpecificRepoName"] == 'https://api.github.com/repos/{}/releases/latest'
     assert settings["Github"]["linkAllReleasesTags"] == 'https://api.github.com/repos/{}/git/refs/tags'
     assert settings["Github"]["linkAllReleases"] == 'https://api.github.com/repos/{}/releases?per_page=100000'
+    assert settings["Github"]["linkReleasesPage"] == 'https://api.github.com/repos/{}/releases?per_page={}&page={}'
+    assert settings["Github"]["linkReleaseByTag"] == 'https://api.github.com/repos/{}/releases/tags/{}'
+    assert settings["Github"]["releasesPerPage"] == 10
 
     assert settings["PyPi"]["urlProjectJson"] == 'https://pypi.python.org/pypi/selenium-driver-updater/json'
\ No newline at end of file
@@ -0,0 +1,154 @@
+import contextvars
+import io
+import json
+import os
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from selenium_driver_updater.driverUpdater import DriverUpdater
+from selenium_driver_updater.util import ALL_DRIVERS
+from selenium_driver_updater.util.downloader import Downloader
+from selenium_driver_updater.util.extractor import Extractor
+from selenium_driver_updater.util.http_cache import HttpCache
+from selenium_driver_updater.util.requests_getter import RequestsGetter
+from selenium_driver_updater.util.tracer import Tracer
+
+def _get_archive():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr('chromedriver-linux64/chromedriver', b'#!/bin/sh\necho 120.0.6099.109\n')
+    return buffer.getvalue()
+
+class _UpstreamHandler(BaseHTTPRequestHandler):
+    archive = _get_archive()
+
+    def do_GET(self):
+        if self.path.endswith('.zip'):
+            body = _UpstreamHandler.archive
+        else:
+            body = b'120.0.6099.109'
+        self.send_response(200)
+        self.send_header('Cache-Control', 'max-age=60')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture()
+def upstream(tmp_path):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _UpstreamHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    with HttpCache.override(enabled=True, path=str(tmp_path / 'cache')):
+        yield f'http://127.0.0.1:{server.server_address[1]}/'
+    server.shutdown()
+    server.server_close()
+
+def test_span_outside_of_report_is_not_recorded():
+    with Tracer.span('fetch', url='http://example.com/') as span:
+        Tracer.set(status_code=200)
+
+    assert span['attributes'] == {'url': 'http://example.com/'}
+    assert not span['children']
+
+def test_spans_are_nested_and_summarized():
+    with Tracer.collect('install', driver_name='chromedriver') as report:
+        with Tracer.span('resolve'):
+            with Tracer.span('fetch', cache='miss'):
+                Tracer.add(bytes=10)
+                Tracer.add(bytes=5)
+            with Tracer.span('fetch', cache='hit'):
+                Tracer.set(bytes=7)
+
+        with pytest.raises(ValueError):
+            with Tracer.span('download'):
+                raise ValueError('broken archive')
+
+    assert report['attributes'] == {'driver_name': 'chromedriver'}
+    assert [span['name'] for span in report['children']] == ['resolve', 'download']
+    assert report['children'][1]['status'] == 'error'
+    assert report['children'][1]['error'] == 'ValueError: broken archive'
+    assert report['summary']['fetch'] == dict(count=2, duration=report['summary']['fetch']['duration'], errors=0, bytes=22, cache={'miss': 1, 'hit': 1})
+    assert report['summary']['download']['errors'] == 1
+    assert report['duration'] >= report['children'][0]['duration']
+
+def test_spans_of_threads_with_copied_context():
+    with Tracer.collect() as report:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(contextvars.copy_context().run, _record_driver, index) for index in range(8)]
+            for future in futures:
+                future.result()
+
+    assert sorted(span['attributes']['index'] for span in report['children']) == list(range(8))
+    assert report['summary']['driver']['count'] == 8
+    assert report['summary']['extract']['count'] == 8
+
+def _record_driver(index):
+    with Tracer.span('driver', index=index), Tracer.span('extract'):
+        pass
+
+def test_phases_of_real_requests_downloads_and_extraction(upstream, tmp_path):
+    with Tracer.collect() as report:
+        RequestsGetter.get_result_by_request(url=upstream + 'LATEST_RELEASE')
+        RequestsGetter.get_result_by_request(url=upstream + 'LATEST_RELEASE')
+
+        archive_path = Downloader.download(upstream + 'chromedriver-linux64.zip', str(tmp_path / 'chromedriver-linux64.zip'))
+        Extractor.extract_and_detect_archive_format(archive_path=archive_path, out_path=str(tmp_path) + os.path.sep)
+
+    fetch_miss, fetch_hit, download, extract = report['children']
+
+    assert fetch_miss['attributes'] == dict(url=upstream + 'LATEST_RELEASE', cache='miss', status_code=200, bytes=14)
+    assert fetch_hit['attributes']['cache'] == 'hit'
+    assert download['attributes']['status_code'] == 200
+    assert download['attributes']['bytes'] == len(_UpstreamHandler.archive)
+    assert extract['attributes']['bytes'] == os.path.getsize(tmp_path / 'chromedriver')
+    assert report['summary']['fetch']['cache'] == {'miss': 1, 'hit': 1}
+
+class _TracedDriver():
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+    def main(self):
+        with Tracer.span('resolve'):
+            RequestsGetter.get_result_by_request(url=_TracedDriver.url)
+        return self.kwargs['path'] + self.kwargs['driver_name']
+
+def test_install_writes_report(monkeypatch, upstream, tmp_path):
+    monkeypatch.setitem(ALL_DRIVERS, 'chromedriver', _TracedDriver)
+    monkeypatch.setitem(ALL_DRIVERS, 'geckodriver', _TracedDriver)
+    _TracedDriver.url = upstream + 'LATEST_RELEASE'
+    report_path = str(tmp_path / 'reports' / 'install.json')
+
+    driver_paths = DriverUpdater.install(
+        ['chromedriver', 'geckodriver'], path=str(tmp_path), report_path=report_path,
+        enable_library_update_check=False, info_messages=False,
+        )
+
+    with open(report_path, encoding='utf-8') as file:
+        report = json.load(file)
+
+    assert driver_paths == [str(tmp_path / 'chromedriver'), str(tmp_path / 'geckodriver')]
+    assert report['name'] == 'install'
+    assert report['status'] == 'ok'
+    assert report['format_version'] == Tracer.format_version
+    assert sorted(span['attributes']['driver_name'] for span in report['children']) == ['chromedriver', 'geckodriver']
+    assert report['summary']['driver']['count'] == 2
+    assert report['summary']['fetch']['count'] == 2
+
+def test_install_report_of_failed_install(tmp_path):
+    report_path = str(tmp_path / 'install.json')
+
+    assert DriverUpdater.install('chromedriver', path=str(tmp_path), version='chromedriver_nightly', report_path=report_path,
+                                 enable_library_update_check=False, info_messages=False) == ''
+
+    with open(report_path, encoding='utf-8') as file:
+        report = json.load(file)
+
+    assert report['status'] == 'error'
+    assert report['error'].startswith('ValueError: Invalid version specified')
@@ -0,0 +1,58 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from selenium_driver_updater._chromeDriver import ChromeDriver
+from selenium_driver_updater.util.http_cache import HttpCache
+from selenium_driver_updater.util.version_cache import DriverVersionCache
+
+VERSION = '120.0.6099.109'
+
+@pytest.fixture()
+def chrome_driver(tmp_path):
+    HttpCache.configure(path=str(tmp_path / 'cache'), enabled=True)
+
+    path = str(tmp_path / 'drivers') + os.path.sep
+    Path(path).mkdir()
+    driver = ChromeDriver(driver_name='chromedriver', path=path, filename='', version='')
+
+    calls_path = tmp_path / 'calls'
+    Path(driver.driver_path).write_text(f'#!/bin/sh\necho called >> {calls_path}\necho "ChromeDriver {VERSION}"\n')
+    os.chmod(driver.driver_path, 0o755)
+
+    yield driver, calls_path
+    HttpCache._options.clear()
+
+def test_version_is_cached(chrome_driver):
+    driver, calls_path = chrome_driver
+
+    assert driver._get_current_version_driver() == VERSION
+    assert driver._get_current_version_driver() == VERSION
+    assert DriverVersionCache.get(driver.driver_path) == VERSION
+
+    assert len(calls_path.read_text().splitlines()) == 1
+
+def test_version_cache_invalidated_by_new_binary(chrome_driver):
+    driver, calls_path = chrome_driver
+
+    assert driver._get_current_version_driver() == VERSION
+
+    new_binary_path = driver.driver_path + '.new'
+    Path(new_binary_path).write_text(f'#!/bin/sh\necho called >> {calls_path}\necho "ChromeDriver 121.0.6167.85"\n')
+    os.chmod(new_binary_path, 0o755)
+    os.replace(new_binary_path, driver.driver_path)
+
+    assert DriverVersionCache.get(driver.driver_path) == ''
+    assert driver._get_current_version_driver() == '121.0.6167.85'
+    assert len(calls_path.read_text().splitlines()) == 2
+
+def test_version_cache_disabled(chrome_driver):
+    driver, calls_path = chrome_driver
+    HttpCache.configure(enabled=False)
+
+    driver._get_current_version_driver()
+    driver._get_current_version_driver()
+
+    assert not Path(DriverVersionCache.get_path()).exists()
+    assert len(calls_path.read_text().splitlines()) == 2
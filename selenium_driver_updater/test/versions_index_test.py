@@ -0,0 +1,88 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from selenium_driver_updater._setting import setting
+from selenium_driver_updater.util.http_cache import HttpCache
+from selenium_driver_updater.util.versions_index import ChromeVersionsIndex
+
+DOWNLOAD_URL = 'https://storage.googleapis.com/chrome-for-testing-public/{0}/{1}/chromedriver-{1}.zip'
+
+def _get_known_good_versions(versions):
+    return {
+        "timestamp": "2024-01-01T00:00:00.000Z",
+        "versions": [
+            {
+                "version": version,
+                "revision": "1",
+                "downloads": {
+                    "chromedriver": [
+                        {"platform": platform, "url": DOWNLOAD_URL.format(version, platform)}
+                        for platform in ('linux64', 'mac-arm64', 'win64')
+                    ]
+                }
+            }
+            for version in versions
+        ]
+    }
+
+class _VersionsHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    versions = []
+    requests = 0
+
+    def do_GET(self):
+        _VersionsHandler.requests += 1
+        body = json.dumps(_get_known_good_versions(_VersionsHandler.versions)).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture()
+def versions_index(tmp_path, monkeypatch):
+    _VersionsHandler.versions = ['119.0.6045.105', '120.0.6099.71', '120.0.6099.109', '121.0.6167.85']
+    _VersionsHandler.requests = 0
+    HttpCache.configure(path=str(tmp_path), ttl=600, enabled=True)
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _VersionsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f'http://127.0.0.1:{server.server_address[1]}/known-good-versions-with-downloads.json'
+    monkeypatch.setitem(setting["ChromeDriver"], "LinkCheckVersionIsValid", url)
+
+    yield ChromeVersionsIndex
+
+    server.shutdown()
+    server.server_close()
+    HttpCache._options.clear()
+
+def test_get_download_url(versions_index):
+    url = versions_index.get_download_url('120.0.6099.109', 'linux64')
+    assert url == DOWNLOAD_URL.format('120.0.6099.109', 'linux64')
+
+    assert versions_index.get_download_url('120.0.6099.109', 'mac-x64') == ''
+
+def test_get_latest_version_for_milestone(versions_index):
+    assert versions_index.get_latest_version_for_milestone(120) == '120.0.6099.109'
+    assert versions_index.get_latest_version_for_milestone(120, 'win64') == '120.0.6099.109'
+    assert versions_index.get_latest_version_for_milestone(118) == ''
+
+def test_index_is_reused_between_lookups(versions_index):
+    versions_index.get_download_url('120.0.6099.109', 'linux64')
+    versions_index.get_latest_version_for_milestone(119)
+
+    assert _VersionsHandler.requests == 1
+
+def test_missing_version_forces_refresh(versions_index):
+    assert versions_index.get_latest_version_for_milestone(122) == ''
+
+    _VersionsHandler.versions.append('122.0.6261.57')
+    HttpCache.clear()
+
+    assert versions_index.get_download_url('122.0.6261.57', 'linux64') == DOWNLOAD_URL.format('122.0.6261.57', 'linux64')
@@ -1,13 +1,39 @@
-from selenium_driver_updater._chromeDriver import ChromeDriver
-from selenium_driver_updater._geckoDriver import GeckoDriver
-from selenium_driver_updater._operaDriver import OperaDriver
-from selenium_driver_updater._edgeDriver import EdgeDriver
-from selenium_driver_updater._safari_driver import SafariDriver
-
-ALL_DRIVERS= {
-    "chromedriver" : ChromeDriver,
-    "geckodriver" : GeckoDriver,
-    "operadriver" : OperaDriver,
-    "edgedriver" : EdgeDriver,
-    "safaridriver" : SafariDriver,
-}
+#Standart library imports
+import importlib
+from collections.abc import MutableMapping
+from typing import Any, Iterator
+
+class DriverRegistry(MutableMapping):
+    """Mapping of driver names to driver classes, module of driver is imported on first access"""
+
+    def __init__(self, drivers : dict):
+        self._drivers : dict = dict(drivers)
+        self._loaded : dict = {}
+
+    def __getitem__(self, driver_name : str) -> Any:
+        if driver_name not in self._loaded:
+            module_name, class_name = self._drivers[driver_name]
+            self._loaded[driver_name] = getattr(importlib.import_module(module_name), class_name)
+        return self._loaded[driver_name]
+
+    def __setitem__(self, driver_name : str, driver_class : Any) -> None:
+        self._drivers[driver_name] = (driver_class.__module__, driver_class.__name__)
+        self._loaded[driver_name] = driver_class
+
+    def __delitem__(self, driver_name : str) -> None:
+        del self._drivers[driver_name]
+        self._loaded.pop(driver_name, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._drivers)
+
+    def __len__(self) -> int:
+        return len(self._drivers)
+
+ALL_DRIVERS = DriverRegistry({
+    "chromedriver" : ("selenium_driver_updater._chromeDriver", "ChromeDriver"),
+    "geckodriver" : ("selenium_driver_updater._geckoDriver", "GeckoDriver"),
+    "operadriver" : ("selenium_driver_updater._operaDriver", "OperaDriver"),
+    "edgedriver" : ("selenium_driver_updater._edgeDriver", "EdgeDriver"),
+    "safaridriver" : ("selenium_driver_updater._safari_driver", "SafariDriver"),
+})
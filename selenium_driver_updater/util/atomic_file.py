@@ -0,0 +1,60 @@
+#Standart library imports
+import os
+import shutil
+import threading
+from pathlib import Path
+
+class AtomicFile():
+    """Class for writing files which readers in other threads and processes never see half written"""
+
+    @staticmethod
+    def get_tmp_path(path : str) -> str:
+        """Gets path of temporary file next to path, it is unique for process and thread"""
+        return f'{path}.{os.getpid()}.{threading.get_ident()}.part'
+
+    @staticmethod
+    def write_bytes(path : str, data : bytes) -> None:
+        """Writes data to temporary file and replaces path with it
+
+        Args:
+            path (str)      : Path of file.
+            data (bytes)    : Content of file.
+
+        """
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = AtomicFile.get_tmp_path(path)
+
+        try:
+            with open(tmp_path, 'wb') as file:
+                file.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            AtomicFile._remove(tmp_path)
+            raise
+
+    @staticmethod
+    def write_text(path : str, text : str) -> None:
+        """Writes text in utf-8 to temporary file and replaces path with it"""
+        AtomicFile.write_bytes(path, text.encode('utf-8'))
+
+    @staticmethod
+    def copy(source : str, destination : str) -> None:
+        """Copies file with its metadata to temporary file and replaces destination with it"""
+
+        Path(destination).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = AtomicFile.get_tmp_path(destination)
+
+        try:
+            shutil.copy2(source, tmp_path)
+            os.replace(tmp_path, destination)
+        except BaseException:
+            AtomicFile._remove(tmp_path)
+            raise
+
+    @staticmethod
+    def _remove(path : str) -> None:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
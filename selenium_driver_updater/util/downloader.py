@@ -0,0 +1,275 @@
+#Standart library imports
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+#Local imports
+from selenium_driver_updater._setting import setting
+from selenium_driver_updater.util.http_session import HttpSession
+from selenium_driver_updater.util.requests_getter import RequestsGetter
+from selenium_driver_updater.util.endpoints import Endpoints
+from selenium_driver_updater.util.logger import logger
+from selenium_driver_updater.util.http_cache import HttpCache
+from selenium_driver_updater.util.tracer import Tracer
+from selenium_driver_updater.util.exceptions import StatusCodeNotEqualException, NotAvailableOfflineException
+
+class Downloader():
+    """Class for streaming resumable downloads through the shared pooled http session"""
+
+    chunk_size = 64 * 1024
+
+    #part files of other downloads which were not written for this long are abandoned and removed after successful download
+    stale_part_age = 24 * 60 * 60
+
+    @staticmethod
+    def download(url : str, path : str, progress_bar : bool = False, attempts : Optional[int] = None) -> str:
+        """Downloads file by chunks to temporary .part file, resumes it with Range requests and renames it into place
+
+        Args:
+            url (str)           : Url of file.
+            path (str)          : Path where file will be saved.
+            progress_bar (bool) : If true, progress of download is printed to stdout. Defaults to False.
+            attempts (int)      : How many times interrupted download is resumed. Defaults to setting Http maxRetries + 1.
+
+        Returns:
+            str
+
+            path (str) : Path to downloaded file.
+
+        """
+
+        #Requests imports
+        import requests
+
+        url = Endpoints.resolve(url)
+        Downloader._check_is_online(url)
+        attempts = attempts or int(setting["Http"]["maxRetries"]) + 1
+        part_path = Downloader.get_part_path(url, path)
+        error : Any = None
+
+        with Tracer.span('download', url=url, bytes=0):
+
+            for attempt in range(1, attempts + 1):
+                Tracer.set(attempts=attempt)
+                try:
+                    if Downloader._download_part(url, part_path, progress_bar):
+                        os.replace(part_path, path)
+                        Downloader._remove(part_path + '.json')
+                        Downloader._remove_stale_parts(path)
+                        return path
+
+                    error = OSError(f'Download of {url} was truncated')
+
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                        requests.exceptions.ChunkedEncodingError) as connection_error:
+                    error = connection_error
+
+                if attempt < attempts:
+                    logger.warning(f'Download of {url} was interrupted: {error}, resuming attempt {attempt + 1} of {attempts}')
+                    delay = min(0.3 * 2 ** (attempt - 1), 5)
+                    Tracer.add(sleep=delay)
+                    time.sleep(delay)
+
+            raise error
+
+    @staticmethod
+    @contextmanager
+    def open_stream(url : str, progress_bar : bool = False) -> Iterator[Any]:
+        """Opens body of url as readable file object, so it can be processed while it is being downloaded
+
+        Args:
+            url (str)           : Url of file.
+            progress_bar (bool) : If true, progress of download is printed to stdout. Defaults to False.
+
+        Returns:
+            Iterator[Any]
+
+            stream (file) : Readable stream of response body.
+
+        """
+
+        url = Endpoints.resolve(url)
+        Downloader._check_is_online(url)
+        session = HttpSession.get_session()
+        headers = dict(RequestsGetter._headers, **{'Accept-Encoding': 'identity'})
+
+        with Tracer.span('download', url=url, bytes=0, streamed=True), \
+             session.get(url=url, headers=headers, stream=True, timeout=HttpSession.get_timeout()) as response:
+
+            Tracer.set(status_code=response.status_code)
+            if response.status_code != 200:
+                message = f'url: {url} status_code: {response.status_code} not equal to 200'
+                raise StatusCodeNotEqualException(message)
+
+            response.raw.decode_content = True
+            total = int(response.headers.get('Content-Length', 0))
+
+            reader = _ProgressReader(response.raw, total, progress_bar)
+            try:
+                yield reader
+            finally:
+                Tracer.set(bytes=reader.current)
+
+        if progress_bar:
+            sys.stdout.write('\n')
+
+    @staticmethod
+    def get_part_path(url : str, path : str) -> str:
+        """Gets path of partially downloaded file, it is the same for the same url and path to resume download"""
+        return f"{path}.{hashlib.sha256(url.encode('utf-8')).hexdigest()[:16]}.part"
+
+    @staticmethod
+    def _download_part(url : str, part_path : str, progress_bar : bool) -> bool:
+        meta = Downloader._read_meta(part_path, url)
+        offset = os.path.getsize(part_path) if meta and Path(part_path).exists() else 0
+
+        #ranges and Content-Length count bytes of encoded body, so archive is asked for as is
+        headers = dict(RequestsGetter._headers, **{'Accept-Encoding': 'identity'})
+        if offset:
+            headers['Range'] = f'bytes={offset}-'
+            validator = meta.get('etag') or meta.get('last_modified')
+            if validator:
+                headers['If-Range'] = validator
+
+        session = HttpSession.get_session()
+
+        with session.get(url=url, headers=headers, stream=True, timeout=HttpSession.get_timeout()) as response:
+
+            Tracer.set(status_code=response.status_code)
+
+            if response.status_code == 416 and offset and offset == meta.get('total'):
+                return True
+
+            if response.status_code in (206, 416) and Downloader._get_range_start(response) != offset:
+                Downloader._remove(part_path)
+                Downloader._remove(part_path + '.json')
+
+                if not offset:
+                    message = f'url: {url} status_code: {response.status_code} is not a response from the first byte'
+                    raise StatusCodeNotEqualException(message)
+
+                #server could not continue from our offset, download starts from zero right away
+                logger.info(f'Server could not resume download of {url} from {offset} bytes, restarting download')
+                return Downloader._download_part(url, part_path, progress_bar)
+
+            if response.status_code == 206:
+                mode = 'ab'
+                total = offset + int(response.headers.get('Content-Length', 0))
+                logger.info(f'Resuming download of {url} from {offset} bytes')
+                Tracer.set(resumed_from=offset)
+            elif response.status_code == 200:
+                if offset:
+                    logger.info(f'Server ignored range of download of {url}, restarting download')
+                mode, offset = 'wb', 0
+                total = int(response.headers.get('Content-Length', 0))
+            else:
+                Downloader._remove(part_path)
+                Downloader._remove(part_path + '.json')
+                message = f'url: {url} status_code: {response.status_code} not equal to 200'
+                raise StatusCodeNotEqualException(message)
+
+            if response.headers.get('Content-Encoding', 'identity').lower() != 'identity':
+                #server encoded body anyway, decoded bytes can not be compared with Content-Length or resumed by range
+                total = 0
+                Downloader._remove(part_path + '.json')
+            else:
+                Downloader._write_meta(part_path, dict(
+                    url=url, etag=response.headers.get('ETag', ''),
+                    last_modified=response.headers.get('Last-Modified', ''), total=total
+                    ))
+
+            current = offset
+            try:
+                with open(part_path, mode) as file:
+                    for chunk in response.iter_content(chunk_size=Downloader.chunk_size):
+                        file.write(chunk)
+                        current += len(chunk)
+                        if progress_bar:
+                            sys.stdout.write('\r' + Downloader.get_progress_bar(current, total or current))
+                            sys.stdout.flush()
+            finally:
+                #bytes of interrupted attempts are transferred too
+                Tracer.add(bytes=current - offset)
+
+        if progress_bar:
+            sys.stdout.write('\n')
+
+        return not total or current == total
+
+    @staticmethod
+    def get_progress_bar(current : int, total : int, width : int = 80) -> str:
+        """Gets text progress bar like [=====     ] 4.2 / 8.4 MB"""
+
+        progress = f' {round(current / 1024 / 1024, 2)} / {round(total / 1024 / 1024, 2)} MB '
+        bar_width = max(width - len(progress) - 2, 10)
+        filled = int(bar_width * current / total) if total else bar_width
+
+        return '[' + '=' * filled + ' ' * (bar_width - filled) + ']' + progress
+
+    @staticmethod
+    def _check_is_online(url : str) -> None:
+        if HttpCache.is_offline():
+            message = f'url: {url} can not be downloaded in offline mode, import bundle which contains this driver'
+            raise NotAvailableOfflineException(message)
+
+    @staticmethod
+    def _get_range_start(response : Any) -> int:
+        find_string = re.findall(r'bytes (\d+)-', response.headers.get('Content-Range', ''))
+        return int(find_string[0]) if find_string else -1
+
+    @staticmethod
+    def _read_meta(part_path : str, url : str) -> dict:
+        try:
+            meta = json.loads(Path(part_path + '.json').read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        return meta if meta.get('url') == url else {}
+
+    @staticmethod
+    def _write_meta(part_path : str, meta : dict) -> None:
+        Path(part_path + '.json').write_text(json.dumps(meta), encoding='utf-8')
+
+    @staticmethod
+    def _remove_stale_parts(path : str) -> None:
+        """Removes part files of downloaded file from other urls and part files of abandoned downloads in its folder"""
+
+        now = time.time()
+
+        for part_path in Path(path).parent.glob('*.part*'):
+            find = re.fullmatch(r'(.+)\.[0-9a-f]{16}\.part(\.json)?', part_path.name)
+            if not find:
+                continue
+
+            try:
+                if find.group(1) == Path(path).name or now - part_path.stat().st_mtime > Downloader.stale_part_age:
+                    part_path.unlink()
+            except OSError:
+                pass #part file could be removed by another process
+
+    @staticmethod
+    def _remove(path : str) -> None:
+        if Path(path).exists():
+            Path(path).unlink()
+
+class _ProgressReader():
+    """Readable stream which prints progress of download"""
+
+    def __init__(self, raw : Any, total : int, progress_bar : bool):
+        self.raw = raw
+        self.total = total
+        self.progress_bar = progress_bar
+        self.current = 0
+
+    def read(self, size : int = -1) -> bytes:
+        chunk = self.raw.read(size)
+        self.current += len(chunk)
+        if self.progress_bar:
+            sys.stdout.write('\r' + Downloader.get_progress_bar(self.current, self.total or self.current))
+            sys.stdout.flush()
+        return chunk
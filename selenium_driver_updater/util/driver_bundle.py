@@ -0,0 +1,142 @@
+#Standart library imports
+import itertools
+import json
+import os
+import shutil
+import tarfile
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+#Local imports
+from selenium_driver_updater._setting import setting
+from selenium_driver_updater.util import ALL_DRIVERS
+from selenium_driver_updater.util.atomic_file import AtomicFile
+from selenium_driver_updater.util.http_cache import HttpCache
+from selenium_driver_updater.util.driver_store import DriverStore
+from selenium_driver_updater.util.logger import logger
+
+class DriverBundle():
+    """Class for exporting resolved drivers with their metadata into single archive and importing it on machines without network"""
+
+    manifest_name = 'manifest.json'
+    format_version = 1
+
+    @staticmethod
+    def export_bundle(bundle_path : str, driver_names : list, system_names : Optional[list] = None,
+                      versions : Optional[list] = None) -> dict:
+        """Resolves and downloads every driver for every system name into tar.gz bundle with manifest
+
+        Args:
+            bundle_path (str)   : Path of bundle, like drivers.tar.gz
+            driver_names (list) : Names of drivers, like ["chromedriver", "geckodriver"].
+            system_names (list) : Specific OSes of drivers, empty string stands for current OS. Defaults to current OS only.
+            versions (list)     : Channels of drivers like chromedriver_beta, every driver is exported in stable channel and in channels which belong to it. Defaults to stable only.
+
+        Returns:
+            dict
+
+            manifest (dict) : Manifest of written bundle.
+
+        """
+
+        system_names = system_names or ['']
+        versions = versions or []
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+
+            #everything fetched while resolving drivers is recorded into empty cache and store, which become the bundle
+            with HttpCache.override(enabled=True, offline=False, path=os.path.join(tmp_dir, 'cache')), \
+                 DriverStore.override(enabled=True, path=os.path.join(tmp_dir, 'cache', 'store')):
+
+                for driver_name, system_name in itertools.product(driver_names, system_names):
+                    for version in [''] + [version for version in versions if version.startswith(f'{driver_name}_')]:
+                        DriverBundle._resolve_driver(driver_name, system_name, version, tmp_dir)
+
+                manifest = dict(
+                    format_version=DriverBundle.format_version, library_version=str(setting["Program"]["version"]),
+                    created_at=time.time(), drivers=sorted(DriverStore._read_index().values(), key=lambda entry: entry['sha256']),
+                    )
+                Path(tmp_dir, 'cache', DriverBundle.manifest_name).write_text(json.dumps(manifest, indent=1), encoding='utf-8')
+
+                with tarfile.open(bundle_path, 'w:gz') as bundle:
+                    bundle.add(os.path.join(tmp_dir, 'cache', DriverBundle.manifest_name), arcname=DriverBundle.manifest_name)
+                    bundle.add(HttpCache.get_path(), arcname='http', filter=DriverBundle._filter_members)
+                    bundle.add(DriverStore.get_path(), arcname='store', filter=DriverBundle._filter_members)
+
+        logger.info(f'Exported {len(manifest["drivers"])} drivers into bundle: {bundle_path}')
+
+        return manifest
+
+    @staticmethod
+    def import_bundle(bundle_path : str) -> dict:
+        """Imports drivers and metadata of bundle into driver store and http cache, so they can be installed offline
+
+        Args:
+            bundle_path (str) : Path of bundle.
+
+        Returns:
+            dict
+
+            manifest (dict) : Manifest of imported bundle.
+
+        """
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+
+            with tarfile.open(bundle_path, 'r:gz') as bundle:
+                for member in bundle.getmembers():
+                    if not member.isreg() or member.name.startswith('/') or '..' in member.name.split('/'):
+                        continue
+                    member_path = Path(tmp_dir, *member.name.split('/'))
+                    member_path.parent.mkdir(parents=True, exist_ok=True)
+                    with bundle.extractfile(member) as source, open(member_path, 'wb') as destination:
+                        shutil.copyfileobj(source, destination)
+
+            manifest = json.loads(Path(tmp_dir, DriverBundle.manifest_name).read_text(encoding='utf-8'))
+            if manifest.get('format_version') != DriverBundle.format_version:
+                message = f'Unsupported format of bundle: {manifest.get("format_version")}'
+                raise ValueError(message)
+
+            entries = {}
+            for entry in manifest['drivers']:
+                object_path = os.path.join(tmp_dir, 'store', 'objects', entry['sha256'][:2], entry['sha256'])
+                if DriverStore.get_sha256(object_path) != entry['sha256']:
+                    message = f'Binary of {entry["driver_name"]} {entry["version"]} in bundle is damaged'
+                    raise ValueError(message)
+
+                os.chmod(object_path, 0o755)
+                AtomicFile.copy(object_path, DriverStore.get_object_path(entry['sha256']))
+                entries[DriverStore.get_key(entry['driver_name'], entry['version'], entry['platform'])] = entry
+
+            for cached_file in Path(tmp_dir, 'http').glob('*'):
+                AtomicFile.copy(str(cached_file), HttpCache.get_path() + cached_file.name)
+
+            DriverStore._update_index(entries)
+
+        logger.info(f'Imported {len(entries)} drivers from bundle: {bundle_path}')
+
+        return manifest
+
+    @staticmethod
+    def _resolve_driver(driver_name : str, system_name : str, version : str, tmp_dir : str) -> None:
+        path = os.path.join(tmp_dir, 'drivers', system_name or 'current', version or 'stable') + os.path.sep
+        Path(path).mkdir(parents=True, exist_ok=True)
+
+        logger.info(f'Exporting {version or driver_name} for {system_name or "current OS"}')
+
+        driver = ALL_DRIVERS[driver_name](
+            driver_name=driver_name, path=path, filename='', version=version, check_browser=False,
+            info_messages=True, system_name=system_name, progress_bar=False,
+            )
+        driver.main()
+
+    @staticmethod
+    def _filter_members(member : tarfile.TarInfo) -> Optional[tarfile.TarInfo]:
+        if member.name.endswith(('.lock', '.part')):
+            return None
+        member.uid = member.gid = 0
+        member.uname = member.gname = ''
+        return member
+
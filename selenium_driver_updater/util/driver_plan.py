@@ -0,0 +1,30 @@
+#Standart library imports
+from dataclasses import dataclass, replace
+
+@dataclass(frozen=True)
+class DriverPlan():
+    """Resolved target of driver installation, computed from metadata before any archive is downloaded"""
+
+    driver_name: str
+    version: str
+    url: str
+    driver_path: str
+    platform: str = ''
+    current_version: str = ''
+    is_up_to_date: bool = False
+    is_validated: bool = False
+    is_stored: bool = False
+    reason: str = ''
+
+    @property
+    def archive_name(self) -> str:
+        """Gets file name of driver archive"""
+        return self.url.split('/')[-1]
+
+    def up_to_date(self, current_version : str) -> 'DriverPlan':
+        """Gets copy of plan which does not need installation"""
+        return replace(self, current_version=current_version, is_up_to_date=True, reason='up_to_date')
+
+    def validated(self) -> 'DriverPlan':
+        """Gets copy of plan marked as checked for existence"""
+        return replace(self, is_validated=True)
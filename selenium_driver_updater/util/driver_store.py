@@ -0,0 +1,293 @@
+#Standart library imports
+import hashlib
+import os
+import shutil
+import stat
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+#Local imports
+from selenium_driver_updater._setting import setting
+from selenium_driver_updater.util.logger import logger
+from selenium_driver_updater.util.atomic_file import AtomicFile
+from selenium_driver_updater.util.json_index import JsonIndex
+from selenium_driver_updater.util.http_cache import HttpCache
+
+class DriverStore():
+    """Class for working with content-addressable store of extracted driver binaries shared between projects"""
+
+    _options : dict = {}
+    _context : ContextVar = ContextVar('driver_store_options', default={})
+    _lock = threading.Lock()
+
+    #parsed index by its path and identity of stored binaries which were hashed, both are dropped when files change
+    _index_cache : dict = {}
+    _verified : dict = {}
+
+    _FICLONE = 0x40049409
+
+    @staticmethod
+    def configure(**kwargs) -> None:
+        """Changes store options
+
+        Args:
+            enabled (bool)  : If false, store will not be read or written.
+            path (str)      : Directory of the store.
+
+        """
+
+        DriverStore._options.update({key: value for key, value in kwargs.items() if value is not None})
+
+    @staticmethod
+    @contextmanager
+    def override(**kwargs) -> Iterator[None]:
+        """Changes store options only inside this block of the current call, takes the same options as configure()"""
+
+        options = dict(DriverStore._context.get())
+        options.update({key: value for key, value in kwargs.items() if value is not None})
+
+        token = DriverStore._context.set(options)
+        try:
+            yield
+        finally:
+            DriverStore._context.reset(token)
+
+    @staticmethod
+    def _get_option(name : str, default : Any) -> Any:
+        options = DriverStore._context.get()
+        return options[name] if name in options else DriverStore._options.get(name, default)
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Checks if store is enabled"""
+        #offline installs are served from the store, so it can not be disabled then
+        return HttpCache.is_offline() or bool(DriverStore._get_option('enabled', setting["Cache"]["enabled"]))
+
+    @staticmethod
+    def get_path() -> str:
+        """Gets directory of the store"""
+        return os.path.abspath(str(DriverStore._get_option('path', setting["Cache"]["storePath"]))) + os.path.sep
+
+    @staticmethod
+    def get_key(driver_name : str, version : str, platform : str) -> str:
+        """Gets index key of specific driver binary"""
+        return f'{driver_name}/{version}/{platform}'
+
+    @staticmethod
+    def lookup(driver_name : str, version : str, platform : str) -> Optional[dict]:
+        """Gets stored driver binary
+
+        Args:
+            driver_name (str)   : Name of driver, like chromedriver.
+            version (str)       : Version of driver.
+            platform (str)      : Platform of driver archive, like linux64.
+
+        Returns:
+            Optional[dict]
+
+            entry (dict) : Index entry of stored binary or None if binary was not stored.
+
+        """
+
+        if not DriverStore.is_enabled() or not version or not platform:
+            return None
+
+        entry = DriverStore._get_index().get(DriverStore.get_key(driver_name, version, platform))
+        if not entry or not DriverStore.is_intact(entry):
+            return None
+
+        return dict(entry)
+
+    @staticmethod
+    def is_intact(entry : dict) -> bool:
+        """Checks sha256 of stored binary, binary is hashed again only if its size, inode or mtime were changed
+
+        Args:
+            entry (dict) : Index entry of stored binary.
+
+        Returns:
+            bool
+
+            is_intact (bool) : True if stored binary exists and has sha256 of entry.
+
+        """
+
+        object_path = DriverStore.get_object_path(entry['sha256'])
+
+        try:
+            file_stat = os.stat(object_path)
+        except OSError:
+            return False
+
+        identity = (file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns)
+        if file_stat.st_size != entry.get('size'):
+            return False
+
+        with DriverStore._lock:
+            if DriverStore._verified.get(object_path) == identity:
+                return True
+
+        try:
+            if DriverStore.get_sha256(object_path) != entry['sha256']:
+                return False
+        except OSError:
+            return False
+
+        with DriverStore._lock:
+            DriverStore._verified[object_path] = identity
+
+        return True
+
+    @staticmethod
+    def add(driver_name : str, version : str, platform : str, binary_path : str) -> Optional[dict]:
+        """Adds extracted driver binary to the store
+
+        Args:
+            driver_name (str)   : Name of driver, like chromedriver.
+            version (str)       : Version of driver.
+            platform (str)      : Platform of driver archive, like linux64.
+            binary_path (str)   : Path to extracted driver binary.
+
+        Returns:
+            Optional[dict]
+
+            entry (dict) : Index entry of stored binary.
+
+        """
+
+        if not DriverStore.is_enabled() or not version or not platform or not Path(binary_path).exists():
+            return None
+
+        try:
+            sha256 = DriverStore.get_sha256(binary_path)
+            object_path = DriverStore.get_object_path(sha256)
+
+            if not Path(object_path).exists():
+                Path(object_path).parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = AtomicFile.get_tmp_path(object_path)
+                shutil.copyfile(binary_path, tmp_path)
+                os.chmod(tmp_path, os.stat(tmp_path).st_mode | stat.S_IEXEC | stat.S_IXGRP | stat.S_IXOTH)
+                os.replace(tmp_path, object_path)
+
+            entry = dict(
+                sha256=sha256, size=os.stat(object_path).st_size,
+                driver_name=driver_name, version=version, platform=platform, stored_at=time.time()
+                )
+            DriverStore._update_index({DriverStore.get_key(driver_name, version, platform): entry})
+
+        except OSError as error:
+            logger.warning(f'Could not add {driver_name} {version} to driver store: {error}')
+            return None
+
+        logger.info(f'Added {driver_name} {version} {platform} to driver store: {object_path}')
+
+        return entry
+
+    @staticmethod
+    def install(entry : dict, out_path : str) -> str:
+        """Installs stored driver binary by hardlink, reflink or copy and replaces out_path atomically
+
+        Args:
+            entry (dict)    : Index entry of stored binary.
+            out_path (str)  : Path where driver binary will be installed.
+
+        Returns:
+            str
+
+            out_path (str) : Path to installed driver binary.
+
+        """
+
+        object_path = DriverStore.get_object_path(entry['sha256'])
+
+        if not DriverStore.is_intact(entry):
+            message = f'Stored driver binary is corrupted: {object_path}'
+            raise OSError(message)
+
+        tmp_path = f'{out_path}.{os.getpid()}.{threading.get_ident()}.tmp'
+
+        for method in (os.link, DriverStore._reflink, shutil.copyfile):
+            try:
+                method(object_path, tmp_path)
+                break
+            except OSError:
+                if Path(tmp_path).exists():
+                    Path(tmp_path).unlink()
+        else:
+            message = f'Could not install {object_path} to {out_path}'
+            raise OSError(message)
+
+        os.replace(tmp_path, out_path)
+
+        return out_path
+
+    @staticmethod
+    def get_sha256(path : str) -> str:
+        """Gets sha256 of specific file"""
+
+        sha256 = hashlib.sha256()
+        with open(path, 'rb') as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b''):
+                sha256.update(chunk)
+        return sha256.hexdigest()
+
+    @staticmethod
+    def get_object_path(sha256 : str) -> str:
+        """Gets path of stored binary by its sha256"""
+        return os.path.join(DriverStore.get_path(), 'objects', sha256[:2], sha256)
+
+    @staticmethod
+    def _reflink(source : str, destination : str) -> None:
+        if fcntl is None:
+            message = 'Reflinks are not supported on this platform'
+            raise OSError(message)
+
+        with open(source, 'rb') as source_file, open(destination, 'wb') as destination_file:
+            fcntl.ioctl(destination_file.fileno(), DriverStore._FICLONE, source_file.fileno())
+        shutil.copymode(source, destination)
+
+    @staticmethod
+    def _get_index_path() -> str:
+        return DriverStore.get_path() + 'index.json'
+
+    @staticmethod
+    def _get_index() -> dict:
+        """Gets parsed index, file is read again only if it was replaced or changed"""
+
+        index_path = DriverStore._get_index_path()
+
+        try:
+            file_stat = os.stat(index_path)
+        except OSError:
+            return {}
+
+        identity = (file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns)
+
+        with DriverStore._lock:
+            cached = DriverStore._index_cache.get(index_path)
+            if cached and cached[0] == identity:
+                return cached[1]
+
+        index = DriverStore._read_index()
+
+        with DriverStore._lock:
+            DriverStore._index_cache[index_path] = (identity, index)
+
+        return index
+
+    @staticmethod
+    def _read_index() -> Any:
+        return JsonIndex.read(DriverStore._get_index_path())
+
+    @staticmethod
+    def _update_index(entries : dict) -> None:
+        JsonIndex.update(DriverStore._get_index_path(), lambda index: index.update(entries))
@@ -0,0 +1,178 @@
+#Standart library imports
+import json
+import os
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Iterator
+
+class Endpoints():
+    """Class for resolving base urls of upstreams at call time, so every request can be routed to a mirror or local fake"""
+
+    defaults = {
+        'chrome-for-testing'        : 'https://googlechromelabs.github.io/chrome-for-testing/',
+        'chrome-for-testing-public' : 'https://storage.googleapis.com/chrome-for-testing-public/',
+        'edgedriver'                : 'https://msedgedriver.azureedge.net/',
+        'edgewebdriver'             : 'https://msedgewebdriverstorage.blob.core.windows.net/edgewebdriver/',
+        'github'                    : 'https://github.com/',
+        'api.github'                : 'https://api.github.com/',
+        'pypi'                      : 'https://pypi.python.org/pypi/',
+        'chromereleases'            : 'https://chromereleases.googleblog.com/',
+        'firefoxreleases'           : 'https://www.mozilla.org/',
+        'edgereleases'              : 'https://docs.microsoft.com/',
+        'operareleases'             : 'https://get.geo.opera.com/',
+        'safarireleases'            : 'https://support.apple.com/',
+    }
+
+    environ_prefix = 'SELENIUM_DRIVER_UPDATER_ENDPOINT_'
+    environ_file = 'SELENIUM_DRIVER_UPDATER_ENDPOINTS_FILE'
+    environ_mirror = 'SELENIUM_DRIVER_UPDATER_MIRROR'
+
+    _lock = threading.Lock()
+    _options : dict = {}
+    _context : ContextVar = ContextVar('endpoints_options', default={})
+    _file_cache : dict = {}
+
+    @staticmethod
+    def configure(**kwargs) -> None:
+        """Changes base urls of upstreams, None resets specific upstream
+
+        Args:
+            mirror (str)    : Base url of mirror, all upstreams are served from <mirror>/<name>/
+            file (str)      : Path to json file with base urls like {"api.github": "http://mirror/github-api/"}
+            **bases (str)   : Base url of specific upstream, names with dots or dashes are passed like **{"api.github": url}
+
+        """
+
+        Endpoints._check_names(kwargs)
+
+        with Endpoints._lock:
+            for key, value in kwargs.items():
+                if value is None:
+                    Endpoints._options.pop(key, None)
+                else:
+                    Endpoints._options[key] = str(value)
+
+    @staticmethod
+    @contextmanager
+    def override(**kwargs) -> Iterator[None]:
+        """Changes base urls only inside this block of the current call, takes the same arguments as configure()"""
+
+        Endpoints._check_names(kwargs)
+
+        options = dict(Endpoints._context.get())
+        options.update({key: str(value) for key, value in kwargs.items() if value is not None})
+
+        token = Endpoints._context.set(options)
+        try:
+            yield
+        finally:
+            Endpoints._context.reset(token)
+
+    @staticmethod
+    def clear() -> None:
+        """Forgets all configured base urls"""
+
+        with Endpoints._lock:
+            Endpoints._options.clear()
+            Endpoints._file_cache.clear()
+
+    @staticmethod
+    def get_base(name : str) -> str:
+        """Gets base url of specific upstream from the first source which sets it: override(), configure(),
+        SELENIUM_DRIVER_UPDATER_ENDPOINT_<NAME> or SELENIUM_DRIVER_UPDATER_MIRROR environment variables,
+        json file from configure(file=...) or SELENIUM_DRIVER_UPDATER_ENDPOINTS_FILE, default url of setting
+
+        Args:
+            name (str) : Name of upstream, like chrome-for-testing.
+
+        Returns:
+            str
+
+            base (str) : Base url which ends with slash.
+
+        """
+
+        for source in Endpoints._get_sources():
+            if source.get(name):
+                return str(source[name]).rstrip('/') + '/'
+            if source.get('mirror'):
+                return str(source['mirror']).rstrip('/') + f'/{name}/'
+
+        return Endpoints.defaults[name]
+
+    @staticmethod
+    def resolve(url : str) -> str:
+        """Gets url with base of upstream replaced by configured one
+
+        Args:
+            url (str) : Url built from setting values.
+
+        Returns:
+            str
+
+            url (str) : Url which request must be sent to.
+
+        """
+
+        sources = Endpoints._get_sources()
+        if not sources:
+            return url
+
+        for name, base in Endpoints.defaults.items():
+            if url.startswith(base):
+                return Endpoints.get_base(name) + url[len(base):]
+            #query of the base itself, like listing of edgewebdriver container
+            if url.startswith(base.rstrip('/') + '?'):
+                return Endpoints.get_base(name) + url[len(base) - 1:]
+
+        return url
+
+    @staticmethod
+    def _check_names(kwargs : dict) -> None:
+        unknown_options = [key for key in kwargs if key not in Endpoints.defaults and key not in ('mirror', 'file')]
+        if unknown_options:
+            message = f'Unknown endpoints were specified: {unknown_options}, available endpoints are: {list(Endpoints.defaults)}'
+            raise ValueError(message)
+
+    @staticmethod
+    def _get_sources() -> list:
+        context = dict(Endpoints._context.get())
+        options = dict(Endpoints._options)
+
+        environ = {
+            key[len(Endpoints.environ_prefix):].lower().replace('_', '-').replace('api-github', 'api.github'): value
+            for key, value in os.environ.items() if key.startswith(Endpoints.environ_prefix) and value
+            }
+        if os.environ.get(Endpoints.environ_mirror):
+            environ.update(mirror=os.environ[Endpoints.environ_mirror])
+
+        file_path = context.pop('file', '') or options.pop('file', '') or os.environ.get(Endpoints.environ_file, '')
+        from_file = Endpoints._read_file(file_path) if file_path else {}
+
+        return [source for source in (context, options, environ, from_file) if source]
+
+    @staticmethod
+    def _read_file(file_path : str) -> Any:
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            return {}
+
+        identity = (file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns)
+        cached = Endpoints._file_cache.get(file_path)
+        if cached and cached[0] == identity:
+            return cached[1]
+
+        try:
+            bases = json.loads(Path(file_path).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            bases = {}
+
+        bases = bases if isinstance(bases, dict) else {}
+
+        with Endpoints._lock:
+            Endpoints._file_cache[file_path] = (identity, bases)
+
+        return bases
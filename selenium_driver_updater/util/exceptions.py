@@ -13,6 +13,14 @@ class GithubApiLimitException(Error):
     """Raises if access to github api is restricted"""
     pass
 
+class ReleaseNotFoundException(Error):
+    """Raises if repository has fewer releases than index of requested release"""
+    pass
+
 class UnknownArchiveFormatException(Error):
     """Raises if unknown archive format was specified/downloaded"""
     pass
+
+class NotAvailableOfflineException(Error):
+    """Raises if resource was requested in offline mode but it is not in cache or driver store"""
+    pass
@@ -2,15 +2,17 @@
 import zipfile
 import os
 import shutil
-from shutil import copyfile
+import stat
+import threading
 from pathlib import Path
+from typing import Any
 
 # Third party imports
 import tarfile
 
 #Local imports
-from selenium_driver_updater.util.logger import logger
 from selenium_driver_updater.util.exceptions import UnknownArchiveFormatException
+from selenium_driver_updater.util.tracer import Tracer
 
 class Extractor():
     """Class for working with different archive types"""
@@ -20,64 +22,63 @@ class Extractor():
         archive_path: str,
         out_path: str, delete_archive: bool = True
         ) -> None:
-        """Extract all members in specific zip archive
+        """Extract driver member of specific zip archive straight to out_path
 
         Args:
             archive_path (str)      : Path to specific archive.
-            out_path (str)          : Out path, where all members of archive will be gathered.
+            out_path (str)          : Out path, where driver member of archive will be written.
             delete_archive (bool)   : Delete archive after unzip or not. Defaults to True.
 
         """
 
-        member_extract = ''
-
-        with zipfile.ZipFile(archive_path, 'r') as zip_ref:
-            for member in zip_ref.namelist():
-                # Check if the member is a file and its name matches any of the driver names
-                member_name = member.split('/')[-1]
-                if 'driver' in member_name and '.chromedriver' not in member_name.lower():
-                    member_extract = member
-                    # Extract the member to the destination directory
-                    zip_ref.extract(member_extract, out_path)
-                    # Get the full extracted path and the desired new path
-                    extracted_path = os.path.join(out_path, member_extract)
-                    new_path = os.path.join(out_path, os.path.basename(member_extract))
-                    # Move the file to the desired location
-                    shutil.move(extracted_path, new_path)
-                    break
-
-        if not member_extract:
-            message = 'Cannot find any drivers inside archive, maybe the name of driver was changed'
-            raise FileNotFoundError(message)
-
-        # Delete the specific folder created during extraction
-        if '/' in member_extract:
-            shutil.rmtree(os.path.join(out_path, os.path.splitext(os.path.basename(archive_path))[0]))
+        Extractor._extract_zip_member(archive_path=archive_path, out_path=out_path)
 
         if Path(archive_path).exists() and delete_archive:
             Path(archive_path).unlink()
 
-
     @staticmethod
     def extract_all_tar_gz_archive(
         archive_path: str,
         out_path: str, delete_archive: bool = True
         ) -> None:
-        """Extract all members in specific tar.gz archive
+        """Extract driver member of specific tar.gz archive in a single streaming pass
 
         Args:
             archive_path (str)      : Path to specific archive.
-            out_path (str)          : Out path, where all members of archive will be gathered.
+            out_path (str)          : Out path, where driver member of archive will be written.
             delete_archive (bool)   : Delete archive after unzip or not. Defaults to True.
 
         """
 
-        with tarfile.open(archive_path, "r:gz") as tar_ref:
-            Extractor._safe_extract(tar_ref, out_path)
+        Extractor._extract_tar_gz_member(archive_path=archive_path, out_path=out_path)
 
         if Path(archive_path).exists() and delete_archive:
             Path(archive_path).unlink()
 
+    @staticmethod
+    def extract_tar_gz_stream(
+        fileobj: Any, out_path: str,
+        filename: str = '', filename_replace: str = ''
+        ) -> str:
+        """Extract driver member of tar.gz stream while it is being read, for example from http response
+
+        Args:
+            fileobj (file)          : Readable tar.gz stream.
+            out_path (str)          : Out path, where driver member of archive will be written.
+            filename (str)          : If given, only member with this file name is extracted. Defaults to empty string.
+            filename_replace (str)  : If given, driver is written with this name. Defaults to empty string.
+
+        Returns:
+            str
+
+            driver_path (str) : Path to extracted driver.
+
+        """
+
+        return Extractor._extract_tar_gz_member(
+            archive_path='', out_path=out_path, filename=filename, filename_replace=filename_replace, fileobj=fileobj
+            )
+
     @staticmethod
     def extract_all_zip_archive_with_specific_name(
         archive_path: str, out_path: str, filename: str,
@@ -94,43 +95,24 @@ class Extractor():
 
         """
 
-        driver_folder_path = out_path + 'tmp'
-        message = ('Created new safety directory for replacing '
-                    f'filename: {filename} filename_replace: {filename_replace}')
-        logger.info(message)
-
-        if os.path.exists(driver_folder_path):
-            shutil.rmtree(driver_folder_path)
-
         parameters = dict(
-            archive_path=archive_path,out_path=driver_folder_path, delete_archive=delete_archive
+            archive_path=archive_path, out_path=out_path, filename=filename, filename_replace=filename_replace
             )
 
-        if archive_path.endswith('.tar.gz'):
+        if archive_path.endswith('.zip'):
 
-            Extractor.extract_all_tar_gz_archive(**parameters)
+            Extractor._extract_zip_member(**parameters)
 
-        elif archive_path.endswith('.zip'):
+        elif archive_path.endswith('.tar.gz'):
 
-            Extractor.extract_all_zip_archive(**parameters)
+            Extractor._extract_tar_gz_member(**parameters)
 
         else:
             message = f'Unknown archive format was specified archive_path: {archive_path}'
             raise UnknownArchiveFormatException(message)
 
-        old_path = driver_folder_path + os.path.sep + filename
-        new_path = driver_folder_path + os.path.sep + filename_replace
-
-        os.rename(old_path, new_path)
-
-        renamed_driver_path = out_path + filename_replace
-        if Path(renamed_driver_path).exists():
-            Path(renamed_driver_path).unlink()
-
-        copyfile(new_path, renamed_driver_path)
-
-        if Path(driver_folder_path).exists():
-            shutil.rmtree(driver_folder_path)
+        if Path(archive_path).exists() and delete_archive:
+            Path(archive_path).unlink()
 
     @staticmethod
     def extract_and_detect_archive_format(
@@ -182,23 +164,115 @@ class Extractor():
                 
         return prefix == abs_directory
 
-    @staticmethod      
-    def _safe_extract(tar, path=".", members=None, *, numeric_owner=False):
-        """Function that safely extract files to directory
+    @staticmethod
+    def _is_driver_member(member_name : str, filename : str = '') -> bool:
+        """Checks if archive member is driver binary, like chromedriver-linux64/chromedriver
 
         Args:
-            tar (tarfile.Tarfile)   : Target archive.
-            path (str)              : Target directory.
-            members                 : Files that lies in archive.
-            numeric_owner           : If numeric_owner is True, the uid and gid numbers from the tarfile are used to set the owner/group for the extracted files. 
-                                      Otherwise, the named values from the tarfile are used.
+            member_name (str)   : Name of archive member.
+            filename (str)      : If given, only member with this file name is driver binary. Defaults to empty string.
 
         """
-    
-        for member in tar.getmembers():
-            member_path = os.path.join(path, member.name)
-            if not Extractor._is_within_directory(path, member_path):
-                raise tarfile.ExtractError("Attempted Path Traversal in Tar File")
-    
-        tar.extractall(path, members, numeric_owner=numeric_owner) 
-        
\ No newline at end of file
+
+        basename = member_name.split('/')[-1]
+        if filename:
+            return basename == filename
+        return 'driver' in basename and '.chromedriver' not in basename.lower()
+
+    @staticmethod
+    def _extract_zip_member(archive_path : str, out_path : str, filename : str = '', filename_replace : str = '') -> str:
+        """Finds driver member in zip central directory and streams it to temporary file at its final location
+
+        Args:
+            archive_path (str)      : Path to specific archive.
+            out_path (str)          : Directory where driver will be written.
+            filename (str)          : If given, only member with this file name is extracted. Defaults to empty string.
+            filename_replace (str)  : If given, driver is written with this name. Defaults to empty string.
+
+        Returns:
+            str
+
+            driver_path (str) : Path to extracted driver.
+
+        """
+
+        with Tracer.span('extract', archive=archive_path, format='zip'), zipfile.ZipFile(archive_path, 'r') as zip_ref:
+
+            members = [info for info in zip_ref.infolist() if not info.is_dir() and Extractor._is_driver_member(info.filename, filename)]
+            if not members:
+                message = 'Cannot find any drivers inside archive, maybe the name of driver was changed'
+                raise FileNotFoundError(message)
+
+            member = members[0]
+            driver_path = os.path.join(out_path, filename_replace or member.filename.split('/')[-1])
+            mode = (member.external_attr >> 16) & 0o777
+
+            with zip_ref.open(member) as source:
+                Extractor._write_member(source, driver_path, mode)
+
+        return driver_path
+
+    @staticmethod
+    def _extract_tar_gz_member(
+        archive_path : str, out_path : str, filename : str = '',
+        filename_replace : str = '', fileobj : Any = None
+        ) -> str:
+        """Reads tar.gz archive as a stream, checks every header for path traversal and stops after driver member is written
+
+        Args:
+            archive_path (str)      : Path to specific archive.
+            out_path (str)          : Directory where driver will be written.
+            filename (str)          : If given, only member with this file name is extracted. Defaults to empty string.
+            filename_replace (str)  : If given, driver is written with this name. Defaults to empty string.
+            fileobj (file)          : If given, archive is read from this stream instead of archive_path. Defaults to None.
+
+        Returns:
+            str
+
+            driver_path (str) : Path to extracted driver.
+
+        """
+
+        with Tracer.span('extract', archive=archive_path or 'stream', format='tar.gz'):
+
+            with tarfile.open(archive_path or None, 'r|gz', fileobj=fileobj) as tar_ref:
+                for member in tar_ref:
+
+                    if not Extractor._is_within_directory(out_path, os.path.join(out_path, member.name)):
+                        raise tarfile.ExtractError("Attempted Path Traversal in Tar File")
+
+                    if member.isfile() and Extractor._is_driver_member(member.name, filename):
+                        driver_path = os.path.join(out_path, filename_replace or member.name.split('/')[-1])
+
+                        Extractor._write_member(tar_ref.extractfile(member), driver_path, member.mode & 0o777)
+
+                        return driver_path
+
+            message = 'Cannot find any drivers inside archive, maybe the name of driver was changed'
+            raise FileNotFoundError(message)
+
+    @staticmethod
+    def _write_member(source : Any, driver_path : str, mode : int = 0) -> None:
+        """Streams archive member to temporary file next to driver_path and renames it atomically
+
+        Args:
+            source (file)       : Opened archive member.
+            driver_path (str)   : Final path of driver.
+            mode (int)          : Permission bits of archive member, 0o644 is used if empty. Defaults to 0.
+
+        """
+
+        Path(driver_path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = f'{driver_path}.{os.getpid()}.{threading.get_ident()}.tmp'
+
+        try:
+            with open(tmp_path, 'wb') as file:
+                shutil.copyfileobj(source, file, 1024 * 1024)
+                Tracer.set(bytes=file.tell())
+            if os.name == 'posix':
+                #driver is executable already when it appears under its final name
+                os.chmod(tmp_path, (mode or 0o644) | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+            os.replace(tmp_path, driver_path)
+        finally:
+            if Path(tmp_path).exists():
+                Path(tmp_path).unlink()
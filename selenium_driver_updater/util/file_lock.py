@@ -0,0 +1,139 @@
+#Standart library imports
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+#Local imports
+from selenium_driver_updater.util.logger import logger
+from selenium_driver_updater.util.http_cache import HttpCache
+
+class FileLock():
+    """Advisory lock shared between processes and threads, based on flock on posix and msvcrt.locking on windows"""
+
+    def __init__(self, path : str, timeout : Optional[float] = None, poll_interval : float = 0.1, remove_on_release : bool = False):
+        """Prepares lock
+
+        Args:
+            path (str)                  : Path of lock file.
+            timeout (float)             : Seconds to wait for lock, None waits forever. Defaults to None.
+            poll_interval (float)       : Seconds between attempts to acquire lock. Defaults to 0.1.
+            remove_on_release (bool)    : If true, lock file is removed on release, so short-lived locks do not pile up. Defaults to False.
+
+        """
+        self.path = path
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.remove_on_release = remove_on_release
+        self._file : Any = None
+
+    def acquire(self) -> None:
+        """Waits until lock is acquired
+
+        Raises:
+            TimeoutError: Occurs when lock was not acquired in timeout seconds.
+
+        """
+
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'a+b')
+
+        started = time.monotonic()
+        is_waiting_logged = False
+
+        while True:
+
+            if self._try_lock():
+                if self._is_file_current():
+                    return
+                continue
+
+            if not is_waiting_logged:
+                logger.info(f'Waiting for another process to release lock: {self.path}')
+                is_waiting_logged = True
+
+            if self.timeout is not None and time.monotonic() - started > self.timeout:
+                self._file.close()
+                self._file = None
+                message = f'Could not acquire lock in {self.timeout} seconds: {self.path}'
+                raise TimeoutError(message)
+
+            time.sleep(self.poll_interval)
+
+    def release(self) -> None:
+        """Releases lock"""
+
+        if self._file is None:
+            return
+
+        if self.remove_on_release:
+            #file is removed while it is still locked, waiters notice it and lock a new file
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass #on windows file which is open in another process can not be removed
+
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self._file.close()
+            self._file = None
+
+    def _try_lock(self) -> bool:
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            elif msvcrt is not None:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+
+    def _is_file_current(self) -> bool:
+        """Checks that locked file was not removed by previous owner, otherwise lock file is opened again"""
+
+        if not self.remove_on_release:
+            return True
+
+        try:
+            is_current = os.path.samestat(os.fstat(self._file.fileno()), os.stat(self.path))
+        except OSError:
+            is_current = False
+
+        if not is_current:
+            self._file.close()
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, 'a+b')
+
+        return is_current
+
+    def __enter__(self) -> 'FileLock':
+        self.acquire()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.release()
+
+    @staticmethod
+    def get_driver_lock_path(path : str, driver_name : str) -> str:
+        """Gets path of lock file which guards installation of specific driver into specific directory,
+        lock files are kept in cache directory, so folders of drivers stay clean, and are removed on release"""
+
+        key = hashlib.sha256(f'{os.path.abspath(path)}|{driver_name}'.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(HttpCache.get_root_path(), 'locks', f'{driver_name}-{key}.lock')
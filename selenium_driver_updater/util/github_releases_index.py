@@ -0,0 +1,72 @@
+#Standart library imports
+from typing import Any
+
+#Local imports
+from selenium_driver_updater.util.http_cache import HttpCache
+from selenium_driver_updater.util.json_index import JsonIndex
+
+class GithubReleasesIndex():
+    """Class for persistent local index of github releases and names of their assets, keyed by repository and tag"""
+
+    @staticmethod
+    def get_path() -> str:
+        """Gets path of sidecar index file"""
+        return HttpCache.get_root_path() + 'github_releases.json'
+
+    @staticmethod
+    def get(repo_name : str, tag_name : str) -> dict:
+        """Gets indexed release of specific tag
+
+        Args:
+            repo_name (str) : Repository path on github, like mozilla/geckodriver.
+            tag_name (str)  : Tag of release, like v0.34.0.
+
+        Returns:
+            dict
+
+            release (dict) : Release like {"name": "0.34.0", "tag_name": "v0.34.0", "assets": [...]} or empty dict if it is not indexed.
+
+        """
+
+        if not HttpCache.is_enabled():
+            return {}
+
+        return dict(GithubReleasesIndex._read_index().get(repo_name, {}).get(tag_name, {}))
+
+    @staticmethod
+    def add(repo_name : str, releases : list) -> None:
+        """Adds releases from response of github api to index, only names and assets are kept
+
+        Args:
+            repo_name (str) : Repository path on github.
+            releases (list) : Releases of github api.
+
+        """
+
+        if not HttpCache.is_enabled():
+            return
+
+        entries = {
+            release['tag_name']: GithubReleasesIndex.get_compact_release(release)
+            for release in releases if isinstance(release, dict) and release.get('tag_name')
+            }
+        if not entries:
+            return
+
+        JsonIndex.update(
+            GithubReleasesIndex.get_path(), lambda index: index.setdefault(repo_name, {}).update(entries), ignore_errors=True
+            )
+
+    @staticmethod
+    def get_compact_release(release : dict) -> dict:
+        """Gets name, tag and names of assets of release of github api"""
+
+        return dict(
+            name=str(release.get('name') or ''),
+            tag_name=str(release.get('tag_name') or ''),
+            assets=[str(asset.get('name')) for asset in release.get('assets') or []],
+            )
+
+    @staticmethod
+    def _read_index() -> Any:
+        return JsonIndex.read(GithubReleasesIndex.get_path())
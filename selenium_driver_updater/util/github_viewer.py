@@ -1,58 +1,112 @@
 #Standart library imports
 from typing import Any
+from urllib.parse import urlsplit
+import os
 import re
 
-#Third party imports
-from bs4 import BeautifulSoup
-
 # Local imports
 from selenium_driver_updater._setting import setting
 from selenium_driver_updater.util.requests_getter import RequestsGetter
+from selenium_driver_updater.util.github_releases_index import GithubReleasesIndex
+from selenium_driver_updater.util.endpoints import Endpoints
 from selenium_driver_updater.util.logger import logger
+from selenium_driver_updater.util.tracer import Tracer
 
-from selenium_driver_updater.util.exceptions import StatusCodeNotEqualException, GithubApiLimitException
+from selenium_driver_updater.util.exceptions import StatusCodeNotEqualException, GithubApiLimitException, ReleaseNotFoundException
 
 class GithubViewer():
     """Class for working with github repositories"""
 
     API_RATE_LIMIT_MSG = 'API rate limit exceeded for'
 
+    token_environ = 'GITHUB_TOKEN'
+
+    _options : dict = {}
+
+    @staticmethod
+    def configure(**kwargs) -> None:
+        """Changes github options
+
+        Args:
+            token (str) : Token which is sent to github api, so rate limit of authenticated user is used. Defaults to GITHUB_TOKEN environment variable.
+
+        """
+
+        GithubViewer._options.update({key: value for key, value in kwargs.items() if value is not None})
+
+    @staticmethod
+    def get_headers(url : str) -> dict:
+        """Gets headers of github api request, token is sent only to github api itself, never to a mirror or other configured host
+
+        Args:
+            url (str) : Url of github api built from setting values.
+
+        Returns:
+            dict
+
+            headers (dict) : Headers of request.
+
+        """
+
+        headers = {'Accept': 'application/vnd.github+json'}
+
+        token = str(GithubViewer._options.get('token') or os.environ.get(GithubViewer.token_environ, ''))
+        github_api = urlsplit(Endpoints.defaults['api.github'])
+        resolved_url = urlsplit(Endpoints.resolve(url))
+        if token and (resolved_url.scheme, resolved_url.netloc) == (github_api.scheme, github_api.netloc):
+            headers['Authorization'] = f'Bearer {token}'
+
+        return headers
+
     @staticmethod
     def get_release_version_by_repo_name(repo_name: str, index:int = 0) -> str:
         """Gets latest release asset by github repository name
 
         Args:
             repo_name (str): Repository path on github.
+            index (int): Position of release from the latest one, 1 is previous release. Defaults to 0.
 
         Returns:
             Any
 
             version         : All latest release data.
+
+        Raises:
+            ReleaseNotFoundException: Occurs when repository has fewer releases than index
         """
 
+        #only the page with needed release is requested
+        per_page = int(setting["Github"]["releasesPerPage"])
         if index:
-            url: str = str(setting["Github"]["linkAllReleases"]).format(repo_name)
+            url: str = str(setting["Github"]["linkReleasesPage"]).format(repo_name, per_page, index // per_page + 1)
         else:
             url: str = str(setting["Github"]["linkLatestReleaseBySpecificRepoName"]).format(repo_name)
         version: Any = ''
 
-        try:
-            version = RequestsGetter.get_result_by_request(url=url, is_json=True)
+        with Tracer.span('github', repo_name=repo_name, via='api'):
 
-            if index:
-                version = version[index].get('name')
-            else:
-                version = version.get('name')
+            try:
+                json_data = GithubViewer._get_json(url)
+                releases = json_data if index else [json_data]
+                GithubReleasesIndex.add(repo_name, releases)
 
-        except StatusCodeNotEqualException as error:
-            if GithubViewer.API_RATE_LIMIT_MSG in error.args[0]:
-                message = 'Github API rate limit exceeded for your IP, trying to get needed data via site.'
-                logger.warning(message)
+                #the last page is shorter when repository has fewer releases than index
+                if not isinstance(releases, list) or len(releases) <= index % per_page:
+                    message = f'Repository {repo_name} has no release with index {index}, only {index // per_page * per_page + len(releases)} releases were found'
+                    raise ReleaseNotFoundException(message)
 
-                version = GithubViewer.get_release_version_by_repo_name_via_site(repo_name=repo_name, index=index)
+                version = releases[index % per_page].get('name')
 
-            else:
-                raise StatusCodeNotEqualException from error
+            except StatusCodeNotEqualException as error:
+                if GithubViewer.API_RATE_LIMIT_MSG in error.args[0]:
+                    message = 'Github API rate limit exceeded for your IP, trying to get needed data via site.'
+                    logger.warning(message)
+                    Tracer.set(rate_limited=True, via='site')
+
+                    version = GithubViewer.get_release_version_by_repo_name_via_site(repo_name=repo_name, index=index)
+
+                else:
+                    raise StatusCodeNotEqualException from error
 
         return version
 
@@ -71,20 +125,91 @@ class GithubViewer():
 
         url: str = str(setting["Github"]["linkAllReleases"]).format(repo_name)
 
-        try:
+        with Tracer.span('github', repo_name=repo_name, via='api'):
+
+            try:
 
-            json_data = RequestsGetter.get_result_by_request(url=url, is_json=True)
+                json_data = GithubViewer._get_json(url)
+                GithubReleasesIndex.add(repo_name, json_data)
 
-        except StatusCodeNotEqualException as error:
-            if GithubViewer.API_RATE_LIMIT_MSG in error.args[0]:
-                message = 'Github API rate limit exceeded for your IP, could not get needed data.'
-                logger.warning(message)
-                raise GithubApiLimitException(message) from error
-            else:
-                raise StatusCodeNotEqualException from error
+            except StatusCodeNotEqualException as error:
+                if GithubViewer.API_RATE_LIMIT_MSG in error.args[0]:
+                    message = 'Github API rate limit exceeded for your IP, could not get needed data.'
+                    logger.warning(message)
+                    Tracer.set(rate_limited=True)
+                    raise GithubApiLimitException(message) from error
+                else:
+                    raise StatusCodeNotEqualException from error
 
         return json_data
 
+    @staticmethod
+    def get_release_by_tag(repo_name: str, tag_name: str, use_index: bool = True) -> dict:
+        """Gets release of specific tag from local index or via releases/tags/{tag} of github api
+
+        Args:
+            repo_name (str)     : Repository path on github.
+            tag_name (str)      : Tag of release, like v0.34.0.
+            use_index (bool)    : If false, release is requested even if it is indexed. Defaults to True.
+
+        Returns:
+            dict
+
+            release (dict) : Release like {"name": "0.34.0", "tag_name": "v0.34.0", "assets": [...]} or empty dict if there is no such release.
+
+        """
+
+        release = GithubReleasesIndex.get(repo_name, tag_name) if use_index else {}
+        if release:
+            return release
+
+        url: str = str(setting["Github"]["linkReleaseByTag"]).format(repo_name, tag_name)
+
+        with Tracer.span('github', repo_name=repo_name, via='api'):
+
+            try:
+
+                json_data = GithubViewer._get_json(url)
+
+            except StatusCodeNotEqualException as error:
+                if GithubViewer.API_RATE_LIMIT_MSG in error.args[0]:
+                    message = 'Github API rate limit exceeded for your IP, could not get needed data.'
+                    logger.warning(message)
+                    Tracer.set(rate_limited=True)
+                    raise GithubApiLimitException(message) from error
+                if 'status_code: 404' in error.args[0]:
+                    return {}
+                raise
+
+        if not isinstance(json_data, dict):
+            return {}
+
+        GithubReleasesIndex.add(repo_name, [json_data])
+
+        return GithubReleasesIndex.get_compact_release(json_data)
+
+    @staticmethod
+    def is_asset_released(repo_name: str, tag_name: str, asset_name: str) -> bool:
+        """Checks if release of specific tag has asset, indexed release is requested again only if asset is not in it
+
+        Args:
+            repo_name (str)     : Repository path on github.
+            tag_name (str)      : Tag of release, like v0.34.0.
+            asset_name (str)    : Name of asset, like geckodriver-v0.34.0-linux64.tar.gz.
+
+        Returns:
+            bool
+
+            is_released (bool) : True if asset exists.
+
+        """
+
+        if asset_name in GithubReleasesIndex.get(repo_name, tag_name).get('assets', []):
+            return True
+
+        #assets are uploaded after release is created, so indexed release could miss them
+        return asset_name in GithubViewer.get_release_by_tag(repo_name, tag_name, use_index=False).get('assets', [])
+
     @staticmethod
     def get_release_version_by_repo_name_via_site(repo_name: str, index:int = 0) -> Any:
         """Gets latest release asset by github repository name
@@ -101,6 +226,9 @@ class GithubViewer():
         url: str = str(setting["Github"]["linkAllReleases"]).format(repo_name)
         version:str = ''
 
+        #Third party imports
+        from bs4 import BeautifulSoup
+
         json_data = RequestsGetter.get_result_by_request(url=url)
 
         soup = BeautifulSoup(json_data, 'html.parser')
@@ -132,21 +260,31 @@ class GithubViewer():
 
         url: str = str(setting["Github"]["linkAllReleasesTags"]).format(repo_name)
 
-        try:
+        with Tracer.span('github', repo_name=repo_name, via='api'):
+
+            try:
 
-            json_data = RequestsGetter.get_result_by_request(url=url, is_json=True)
+                json_data = GithubViewer._get_json(url)
 
-            find_string = re.findall(str(setting["Program"]["wedriverVersionPattern"]), json_data[-1].get('ref'))
-            tag = find_string[0] if len(find_string) > 0 else ''
+                find_string = re.findall(str(setting["Program"]["wedriverVersionPattern"]), json_data[-1].get('ref'))
+                tag = find_string[0] if len(find_string) > 0 else ''
 
-        except StatusCodeNotEqualException as error:
-            if GithubViewer.API_RATE_LIMIT_MSG in error.args[0]:
-                message = 'Github API rate limit exceeded for your IP, could not get needed data.'
-                logger.warning(message)
+            except StatusCodeNotEqualException as error:
+                if GithubViewer.API_RATE_LIMIT_MSG in error.args[0]:
+                    message = 'Github API rate limit exceeded for your IP, could not get needed data.'
+                    logger.warning(message)
+                    Tracer.set(rate_limited=True, via='site')
 
-                tag = GithubViewer.get_release_version_by_repo_name_via_site(repo_name=repo_name)
+                    tag = GithubViewer.get_release_version_by_repo_name_via_site(repo_name=repo_name)
 
-            else:
-                raise StatusCodeNotEqualException from error
+                else:
+                    raise StatusCodeNotEqualException from error
 
         return tag
+
+    @staticmethod
+    def _get_json(url : str) -> Any:
+        headers = GithubViewer.get_headers(url)
+        Tracer.set(authenticated='Authorization' in headers)
+
+        return RequestsGetter.get_result_by_request(url=url, is_json=True, headers=headers)
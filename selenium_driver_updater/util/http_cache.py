@@ -0,0 +1,231 @@
+#Standart library imports
+import hashlib
+import json
+import os
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+#Local imports
+from selenium_driver_updater._setting import setting
+from selenium_driver_updater.util.atomic_file import AtomicFile
+
+@dataclass
+class CacheEntry():
+    """Cached response body of specific url with its validators"""
+
+    url: str
+    text: str = ''
+    etag: str = ''
+    last_modified: str = ''
+    stored_at: float = 0.0
+    ttl: float = 0.0
+    headers: dict = field(default_factory=dict)
+
+    def is_fresh(self) -> bool:
+        """Checks if entry can be used without revalidation"""
+        return time.time() - self.stored_at < self.ttl
+
+    def get_conditional_headers(self) -> dict:
+        """Gets headers for conditional revalidation request"""
+
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+class HttpCache():
+    """Class for persistent on-disk caching of http metadata responses"""
+
+    _options : dict = {}
+    _context : ContextVar = ContextVar('http_cache_options', default={})
+
+    @staticmethod
+    def configure(**kwargs) -> None:
+        """Changes cache options
+
+        Args:
+            enabled (bool)  : If false, cache will not be read or written.
+            path (str)      : Directory where cached responses will be stored.
+            ttl (int)       : Seconds while cached response is used without revalidation, if server does not specify max-age.
+            offline (bool)  : If true, cached responses are used whatever their age and nothing is requested from network.
+
+        """
+
+        HttpCache._options.update({key: value for key, value in kwargs.items() if value is not None})
+
+    @staticmethod
+    @contextmanager
+    def override(**kwargs) -> Iterator[None]:
+        """Changes cache options only inside this block of the current call, takes the same options as configure()"""
+
+        options = dict(HttpCache._context.get())
+        options.update({key: value for key, value in kwargs.items() if value is not None})
+
+        token = HttpCache._context.set(options)
+        try:
+            yield
+        finally:
+            HttpCache._context.reset(token)
+
+    @staticmethod
+    def _get_option(name : str, default : Any) -> Any:
+        options = HttpCache._context.get()
+        return options[name] if name in options else HttpCache._options.get(name, default)
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Checks if cache is enabled"""
+        return HttpCache.is_offline() or bool(HttpCache._get_option('enabled', setting["Cache"]["enabled"]))
+
+    @staticmethod
+    def is_offline() -> bool:
+        """Checks if requests must be satisfied from cache and driver store only"""
+        return bool(HttpCache._get_option('offline', False))
+
+    @staticmethod
+    def get_root_path() -> str:
+        """Gets root cache directory of the library"""
+        return os.path.abspath(str(HttpCache._get_option('path', setting["Cache"]["path"]))) + os.path.sep
+
+    @staticmethod
+    def get_path() -> str:
+        """Gets directory of cached http responses"""
+        return HttpCache.get_root_path() + 'http' + os.path.sep
+
+    @staticmethod
+    def get_default_ttl() -> float:
+        """Gets seconds while cached metadata is used without revalidation"""
+        return float(HttpCache._get_option('ttl', setting["Cache"]["metadataTTL"]))
+
+    @staticmethod
+    def get(url : str) -> Optional[CacheEntry]:
+        """Gets cached entry of specific url
+
+        Args:
+            url (str) : Url of cached response.
+
+        Returns:
+            Optional[CacheEntry]
+
+            entry (CacheEntry) : Cached entry or None if url was not cached.
+
+        """
+
+        if not HttpCache.is_enabled():
+            return None
+
+        meta_path, body_path = HttpCache._get_entry_paths(url)
+
+        try:
+            meta = json.loads(Path(meta_path).read_text(encoding='utf-8'))
+            body = Path(body_path).read_bytes()
+        except (OSError, ValueError):
+            return None
+
+        if meta.get('url') != url or meta.get('sha256') != hashlib.sha256(body).hexdigest():
+            return None
+
+        return CacheEntry(
+            url=url, text=body.decode('utf-8'), etag=meta.get('etag', ''),
+            last_modified=meta.get('last_modified', ''), stored_at=float(meta.get('stored_at', 0)),
+            ttl=float(meta.get('ttl', 0)), headers=meta.get('headers', {})
+            )
+
+    @staticmethod
+    def store(url : str, text : str, headers : Any) -> Optional[CacheEntry]:
+        """Stores response of specific url
+
+        Args:
+            url (str)       : Url of response.
+            text (str)      : Text of response.
+            headers (dict)  : Headers of response.
+
+        Returns:
+            Optional[CacheEntry]
+
+            entry (CacheEntry) : Stored entry or None if response must not be cached.
+
+        """
+
+        cache_control = str(headers.get('Cache-Control', '')).lower()
+        if not HttpCache.is_enabled() or 'no-store' in cache_control:
+            return None
+
+        entry = CacheEntry(
+            url=url, text=text, etag=headers.get('ETag', ''), last_modified=headers.get('Last-Modified', ''),
+            stored_at=time.time(), ttl=HttpCache._get_ttl(cache_control), headers=HttpCache._get_stored_headers(headers)
+            )
+
+        body = text.encode('utf-8')
+        meta = dict(
+            url=url, etag=entry.etag, last_modified=entry.last_modified, stored_at=entry.stored_at,
+            ttl=entry.ttl, headers=entry.headers, sha256=hashlib.sha256(body).hexdigest()
+            )
+
+        meta_path, body_path = HttpCache._get_entry_paths(url)
+
+        try:
+            AtomicFile.write_bytes(body_path, body)
+            AtomicFile.write_bytes(meta_path, json.dumps(meta).encode('utf-8'))
+        except OSError:
+            pass #read-only or full filesystem must not break requests
+
+        return entry
+
+    @staticmethod
+    def refresh(entry : CacheEntry, headers : Any) -> CacheEntry:
+        """Marks entry as revalidated after 304 Not Modified response
+
+        Args:
+            entry (CacheEntry)  : Revalidated entry.
+            headers (dict)      : Headers of 304 response.
+
+        Returns:
+            CacheEntry
+
+            entry (CacheEntry) : Entry with renewed validators and ttl.
+
+        """
+
+        merged_headers = dict(entry.headers)
+        merged_headers.update(HttpCache._get_stored_headers(headers))
+        merged_headers.setdefault('ETag', entry.etag)
+        merged_headers.setdefault('Last-Modified', entry.last_modified)
+
+        return HttpCache.store(entry.url, entry.text, merged_headers) or entry
+
+    @staticmethod
+    def clear() -> None:
+        """Deletes all cached responses"""
+
+        path = Path(HttpCache.get_path())
+        if path.exists():
+            for cached_file in path.iterdir():
+                cached_file.unlink()
+
+    @staticmethod
+    def _get_ttl(cache_control : str) -> float:
+        find_string = re.findall(r'max-age=(\d+)', cache_control)
+        if 'no-cache' in cache_control:
+            return 0.0
+        if find_string:
+            return float(find_string[0])
+        return HttpCache.get_default_ttl()
+
+    @staticmethod
+    def _get_stored_headers(headers : Any) -> dict:
+        stored_headers = ('ETag', 'Last-Modified', 'Cache-Control', 'Content-Type')
+        return {name: headers.get(name) for name in stored_headers if headers.get(name)}
+
+    @staticmethod
+    def _get_entry_paths(url : str):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        path = HttpCache.get_path()
+        return path + key + '.json', path + key + '.body'
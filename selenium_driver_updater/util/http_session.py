@@ -0,0 +1,123 @@
+#Standart library imports
+import threading
+from typing import Any
+
+#Local imports
+from selenium_driver_updater._setting import setting
+
+class HttpSession():
+    """Class for sharing pooled keep-alive http connections between all requests of the library"""
+
+    _lock = threading.Lock()
+    _local = threading.local()
+    _adapter : Any = None
+
+    _options : dict = {}
+
+    _setting_names = {
+        'pool_connections'  : 'poolConnections',
+        'pool_maxsize'      : 'poolMaxsize',
+        'max_retries'       : 'maxRetries',
+        'timeout'           : 'timeout',
+    }
+
+    @staticmethod
+    def configure(**kwargs) -> None:
+        """Changes connection pool options. Already opened connections are closed.
+
+        Args:
+            pool_connections (int)  : Number of per-host connection pools to cache. Defaults to setting value.
+            pool_maxsize (int)      : Maximum number of connections to keep in each pool. Defaults to setting value.
+            max_retries (int)       : How many times failed connections or reads are retried. Defaults to setting value.
+            timeout (tuple)         : Connect and read timeout for every request in seconds. Defaults to setting value.
+
+        """
+
+        unknown_options = [key for key in kwargs if key not in HttpSession._setting_names]
+        if unknown_options:
+            message = f'Unknown http session options were specified: {unknown_options}'
+            raise ValueError(message)
+
+        with HttpSession._lock:
+            HttpSession._options.update({key: value for key, value in kwargs.items() if value is not None})
+            HttpSession._close_adapter()
+
+    @staticmethod
+    def get_session() -> Any:
+        """Gets http session of the current thread. All sessions share the same connection pools.
+
+        Returns:
+            requests.Session
+
+            session (requests.Session) : Session with mounted shared http adapter.
+
+        """
+
+        #Requests imports
+        import requests
+
+        adapter = HttpSession._get_adapter()
+        session : Any = getattr(HttpSession._local, 'session', None)
+
+        if session is None or session.adapters.get('https://') is not adapter:
+            session = requests.Session()
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            HttpSession._local.session = session
+
+        return session
+
+    @staticmethod
+    def get_timeout() -> Any:
+        """Gets connect and read timeout for requests
+
+        Returns:
+            tuple
+
+            timeout (tuple) : Connect and read timeouts in seconds.
+
+        """
+        return HttpSession._get_option('timeout')
+
+    @staticmethod
+    def close() -> None:
+        """Closes all pooled connections"""
+
+        with HttpSession._lock:
+            HttpSession._close_adapter()
+
+    @staticmethod
+    def _get_option(name : str) -> Any:
+        if name in HttpSession._options:
+            return HttpSession._options[name]
+        return setting["Http"][HttpSession._setting_names[name]]
+
+    @staticmethod
+    def _get_adapter() -> Any:
+        adapter = HttpSession._adapter
+        if adapter is not None:
+            return adapter
+
+        #Requests imports, deferred until the first request
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        with HttpSession._lock:
+            if HttpSession._adapter is None:
+                retries = Retry(
+                    total=HttpSession._get_option('max_retries'), connect=HttpSession._get_option('max_retries'),
+                    read=HttpSession._get_option('max_retries'), status=0, backoff_factor=0.3,
+                    allowed_methods=frozenset(['GET', 'HEAD']), raise_on_status=False
+                    )
+                HttpSession._adapter = HTTPAdapter(
+                    pool_connections=HttpSession._get_option('pool_connections'),
+                    pool_maxsize=HttpSession._get_option('pool_maxsize'),
+                    max_retries=retries, pool_block=False
+                    )
+            return HttpSession._adapter
+
+    @staticmethod
+    def _close_adapter() -> None:
+        if HttpSession._adapter is not None:
+            HttpSession._adapter.close()
+            HttpSession._adapter = None
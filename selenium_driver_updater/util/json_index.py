@@ -0,0 +1,52 @@
+#Standart library imports
+import json
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+#Local imports
+from selenium_driver_updater.util.atomic_file import AtomicFile
+from selenium_driver_updater.util.file_lock import FileLock
+
+class JsonIndex():
+    """Class for json index files in cache directory which are shared by threads and processes"""
+
+    _lock = threading.Lock()
+
+    @staticmethod
+    def read(path : str) -> Any:
+        """Gets parsed index or empty dict if it is missing or broken"""
+
+        try:
+            return json.loads(Path(path).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def update(path : str, change : Callable[[dict], Any], ignore_errors : bool = False) -> bool:
+        """Changes index under lock of file and replaces it atomically, so concurrent updates are not lost
+
+        Args:
+            path (str)              : Path of index file.
+            change (Callable)       : Function which changes parsed index in place.
+            ignore_errors (bool)    : If true, errors of filesystem are ignored. Defaults to False.
+
+        Returns:
+            bool
+
+            is_updated (bool) : True if index was written.
+
+        """
+
+        try:
+            with JsonIndex._lock, FileLock(path + '.lock'):
+                index = JsonIndex.read(path)
+                change(index)
+                AtomicFile.write_text(path, json.dumps(index, indent=1, sort_keys=True))
+        except OSError:
+            #index only saves requests and probes, so read-only or full filesystem is not an error for callers which ignore errors
+            if not ignore_errors:
+                raise
+            return False
+
+        return True
@@ -1,5 +1,8 @@
 #Standart library imports
 import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
 
 logger = logging.getLogger('selenium_driver_updater')
 logger.propagate = False
@@ -8,9 +11,31 @@ levels = {
     "error": logging.ERROR,
 }
 
+#level is chosen by every install call for its own context, so concurrent calls with different info_messages do not change each other,
+#messages outside of install calls, like of mirror, watcher and bundle, are shown from info level
+_context_level : ContextVar = ContextVar('logger_level', default=logging.INFO)
+
+class _ContextLevelFilter(logging.Filter):
+    """Filter which drops messages below level of the current call"""
+
+    def filter(self, record : logging.LogRecord) -> bool:
+        return record.levelno >= _context_level.get()
+
+@contextmanager
+def override_level(level : int) -> Iterator[None]:
+    """Changes level of messages only inside this block of the current call and threads started with its context"""
+
+    token = _context_level.set(level)
+    try:
+        yield
+    finally:
+        _context_level.reset(token)
+
 logFormatter = logging.Formatter('%(asctime)s %(levelname)s %(message)s ')
 
 consoleHandler = logging.StreamHandler()
 consoleHandler.setFormatter(logFormatter)
 
+logger.setLevel(logging.INFO)
+logger.addFilter(_ContextLevelFilter())
 logger.addHandler(consoleHandler)
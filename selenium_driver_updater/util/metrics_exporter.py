@@ -0,0 +1,170 @@
+#Standart library imports
+import re
+import threading
+from pathlib import Path
+from typing import Any, Iterator
+from urllib.parse import urlsplit
+
+#Local imports
+from selenium_driver_updater.util.atomic_file import AtomicFile
+from selenium_driver_updater.util.endpoints import Endpoints
+from selenium_driver_updater.util.tracer import Tracer
+
+class MetricsExporter():
+    """Class for writing report of updater run as Prometheus textfile, which node exporter serves with metrics of the node"""
+
+    prefix = 'selenium_driver_updater_'
+
+    metrics = {
+        'last_run_timestamp_seconds'            : 'Unix time when last run of updater finished.',
+        'last_run_duration_seconds'             : 'Duration of last run of updater.',
+        'last_run_success'                      : 'If 1, last run of updater finished without errors.',
+        'driver_last_success_timestamp_seconds' : 'Unix time when driver was last installed or found up to date.',
+        'driver_up_to_date'                     : 'If 1, installed version of driver is latest version.',
+        'driver_info'                           : 'Installed and latest version of driver.',
+        'driver_download_bytes'                 : 'Bytes of driver archives downloaded during last run.',
+        'driver_download_seconds'               : 'Seconds spent downloading driver archives during last run.',
+        'http_requests'                         : 'Http requests of metadata and archives during last run by upstream and cache result.',
+        'http_cache_hit_ratio'                  : 'Part of metadata requests served from cache during last run.',
+        'github_rate_limit_remaining'           : 'Requests to github api left in current rate limit window.',
+    }
+
+    _lock = threading.Lock()
+
+    @staticmethod
+    def write_textfile(report : dict, textfile_path : str) -> None:
+        """Writes metrics of report to textfile atomically, so node exporter never reads half written file.
+        Last success of drivers which are not in report is kept from previous textfile.
+
+        Args:
+            report (dict)           : Report of Tracer.collect(), like report of DriverUpdater.install.
+            textfile_path (str)     : Path of textfile, must end with .prom to be read by node exporter.
+
+        """
+
+        with MetricsExporter._lock:
+            try:
+                previous_text = Path(textfile_path).read_text(encoding='utf-8')
+            except OSError:
+                previous_text = ''
+
+            text = MetricsExporter.render(report, previous_text)
+
+            AtomicFile.write_text(textfile_path, text)
+
+    @staticmethod
+    def render(report : dict, previous_text : str = '') -> str:
+        """Gets metrics of report in Prometheus text format
+
+        Args:
+            report (dict)           : Report of Tracer.collect().
+            previous_text (str)     : Previous textfile, last success of drivers is taken from it. Defaults to empty string.
+
+        Returns:
+            str
+
+            text (str) : Metrics in Prometheus text format.
+
+        """
+
+        samples : dict = {name: {} for name in MetricsExporter.metrics}
+        finished_at = report['started_at'] + report['duration']
+
+        samples['last_run_timestamp_seconds'][()] = finished_at
+        samples['last_run_duration_seconds'][()] = report['duration']
+        samples['last_run_success'][()] = int(report['status'] == 'ok' and not report['summary'].get('driver', {}).get('errors'))
+
+        pattern = rf'^{MetricsExporter.prefix}driver_last_success_timestamp_seconds({{.*}}) (\S+)$'
+        for labels_text, value in re.findall(pattern, previous_text, flags=re.MULTILINE):
+            samples['driver_last_success_timestamp_seconds'][MetricsExporter._parse_labels(labels_text)] = float(value)
+
+        for span in MetricsExporter._walk(report, 'driver'):
+            MetricsExporter._add_driver_samples(samples, span)
+
+        fetches = list(MetricsExporter._walk(report, 'fetch'))
+        for span in fetches + list(MetricsExporter._walk(report, 'download')):
+            labels = (
+                ('upstream', MetricsExporter.get_upstream(span['attributes'].get('url', ''))),
+                ('cache', span['attributes'].get('cache', 'miss')),
+                )
+            samples['http_requests'][labels] = samples['http_requests'].get(labels, 0) + 1
+
+        if fetches:
+            hits = [span for span in fetches if span['attributes'].get('cache', 'miss') != 'miss']
+            samples['http_cache_hit_ratio'][()] = round(len(hits) / len(fetches), 6)
+
+        for span in fetches:
+            if 'rate_limit_remaining' in span['attributes'] and MetricsExporter.get_upstream(span['attributes']['url']) == 'api.github':
+                samples['github_rate_limit_remaining'][()] = span['attributes']['rate_limit_remaining']
+
+        lines = []
+        for name, help_text in MetricsExporter.metrics.items():
+            if not samples[name]:
+                continue
+
+            lines.append(f'# HELP {MetricsExporter.prefix}{name} {help_text}')
+            lines.append(f'# TYPE {MetricsExporter.prefix}{name} gauge')
+            for labels, value in sorted(samples[name].items()):
+                lines.append(f'{MetricsExporter.prefix}{name}{MetricsExporter._format_labels(labels)} {MetricsExporter._format_value(value)}')
+
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def get_upstream(url : str) -> str:
+        """Gets name of upstream of url, like api.github, or host of url if it is not default upstream"""
+
+        for name, base in Endpoints.defaults.items():
+            if url.startswith(base):
+                return name
+
+        return urlsplit(url).netloc
+
+    @staticmethod
+    def _add_driver_samples(samples : dict, span : dict) -> None:
+        attributes = span['attributes']
+        labels : Any = tuple((label, str(attributes.get(name, ''))) for label, name in
+                             (('driver', 'driver_name'), ('system_name', 'system_name'), ('path', 'path')))
+
+        verified = [child['attributes'].get('version', '') for child in MetricsExporter._walk(span, 'verify')]
+        verified_version = next((version for version in reversed(verified) if version), '')
+        latest_version = str(attributes.get('version', ''))
+
+        #downloaded driver is not probed again, so after successful download its version is the latest version
+        is_downloaded = span['status'] == 'ok' and bool(latest_version) and not attributes.get('is_up_to_date')
+        installed_version = latest_version if is_downloaded else verified_version
+
+        if span['status'] == 'ok' and latest_version:
+            samples['driver_last_success_timestamp_seconds'][labels] = span['started_at'] + span['duration']
+
+        samples['driver_up_to_date'][labels] = int(bool(installed_version) and installed_version == latest_version)
+        samples['driver_info'][labels + (('installed_version', installed_version), ('latest_version', latest_version))] = 1
+
+        downloads = list(MetricsExporter._walk(span, 'download'))
+        samples['driver_download_bytes'][labels] = sum(int(download['attributes'].get('bytes', 0)) for download in downloads)
+        samples['driver_download_seconds'][labels] = round(sum(download['duration'] for download in downloads), 6)
+
+    @staticmethod
+    def _walk(span : dict, name : str) -> Iterator[Any]:
+        return (child for child in Tracer._walk(span) if child['name'] == name)
+
+    @staticmethod
+    def _format_labels(labels : tuple) -> str:
+        if not labels:
+            return ''
+
+        escaped = [
+            (key, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+            for key, value in labels
+            ]
+        return '{' + ','.join(f'{key}="{value}"' for key, value in escaped) + '}'
+
+    @staticmethod
+    def _parse_labels(labels_text : str) -> tuple:
+        return tuple(
+            (key, re.sub(r'\\(.)', lambda match: '\n' if match.group(1) == 'n' else match.group(1), value))
+            for key, value in re.findall(r'(\w+)="((?:[^"\\]|\\.)*)"', labels_text)
+            )
+
+    @staticmethod
+    def _format_value(value : Any) -> str:
+        return repr(value) if isinstance(value, float) else str(value)
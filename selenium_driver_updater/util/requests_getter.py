@@ -1,12 +1,16 @@
 #Standart library imports
-from typing import Any, Optional
-
-#Requests imports
-import requests
-from requests.models import Response
+import json
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional
 
 #Local imports
-from selenium_driver_updater.util.exceptions import StatusCodeNotEqualException
+from selenium_driver_updater.util.http_session import HttpSession
+from selenium_driver_updater.util.http_cache import HttpCache
+from selenium_driver_updater.util.endpoints import Endpoints
+from selenium_driver_updater.util.tracer import Tracer
+from selenium_driver_updater.util.exceptions import StatusCodeNotEqualException, NotAvailableOfflineException
 
 class RequestsGetter():
     """Class for working with requests module"""
@@ -17,10 +21,15 @@ class RequestsGetter():
 
     _headers = {'User-Agent': user_agent}
 
+    _lock = threading.Lock()
+    _shared : ContextVar = ContextVar('shared_responses', default=None)
+
     @staticmethod
     def get_result_by_request(
         url : str, is_json : bool = False,
-        no_error_status_code : bool = False) -> Any:
+        no_error_status_code : bool = False,
+        use_cache : bool = True,
+        headers : Optional[dict] = None) -> Any:
         """Gets html text and status_code from the specified url by get request
 
         Args:
@@ -28,6 +37,8 @@ class RequestsGetter():
             cookies                     : Specific cookies for request
             is_json (bool)              : Transorm request.text to json or not. Defaults to False.
             no_error_status_code (bool) : Will not throw an error if status_code not equal to 200.
+            use_cache (bool)            : Use on-disk cache with conditional revalidation. Defaults to True.
+            headers (dict)              : Additional headers of request, like Authorization. Defaults to None.
 
         Returns:
             str
@@ -36,21 +47,96 @@ class RequestsGetter():
 
         """
 
+        url = Endpoints.resolve(url)
+
+        with Tracer.span('fetch', url=url):
+
+            shared = RequestsGetter._shared.get()
+            if shared is None:
+                request_text = RequestsGetter._request(url, no_error_status_code, use_cache, headers)
+            else:
+                key = (url, no_error_status_code)
+                with RequestsGetter._lock:
+                    key_lock = shared['locks'].setdefault(key, threading.Lock())
+
+                #concurrent requests of the same url wait for the first one instead of fetching it again
+                with key_lock:
+                    if key not in shared['responses']:
+                        shared['responses'][key] = RequestsGetter._request(url, no_error_status_code, use_cache, headers)
+                    else:
+                        Tracer.set(cache='shared')
+                    request_text = shared['responses'][key]
+
+        if is_json:
+            return json.loads(request_text)
+
+        return request_text
+
+    @staticmethod
+    @contextmanager
+    def shared_responses() -> Iterator[None]:
+        """Inside this block of the current call every url is requested only once, all callers get the same response text.
+        Threads share responses when they run in a copy of the context, like contextvars.copy_context().run"""
+
+        if RequestsGetter._shared.get() is not None:
+            yield
+            return
+
+        token = RequestsGetter._shared.set(dict(responses={}, locks={}))
+        try:
+            yield
+        finally:
+            RequestsGetter._shared.reset(token)
+
+    @staticmethod
+    def _request(url : str, no_error_status_code : bool, use_cache : bool, extra_headers : Optional[dict] = None) -> str:
         status_code : int = 0
         request_text : str = ''
-        request : Optional[Response] = None
+        request : Any = None
+
+        cache_entry = HttpCache.get(url) if use_cache or HttpCache.is_offline() else None
+
+        if HttpCache.is_offline():
+            if not cache_entry:
+                message = f'url: {url} is not available in offline mode, import bundle which contains it'
+                raise NotAvailableOfflineException(message)
+            Tracer.set(cache='offline', bytes=len(cache_entry.text))
+            return cache_entry.text
+
+        if cache_entry and cache_entry.is_fresh():
+            Tracer.set(cache='hit', bytes=len(cache_entry.text))
+            return cache_entry.text
+
+        headers = dict(RequestsGetter._headers)
+        headers.update(extra_headers or {})
+        if cache_entry:
+            headers.update(cache_entry.get_conditional_headers())
 
-        request = requests.get(url=url, headers=RequestsGetter._headers)
+        session = HttpSession.get_session()
+        request = session.get(url=url, headers=headers, timeout=HttpSession.get_timeout())
         status_code = request.status_code
-        request_text = request.text
 
-        if status_code != 200 and not no_error_status_code:
+        if request.headers.get('X-RateLimit-Remaining', '').isdigit():
+            Tracer.set(rate_limit_remaining=int(request.headers['X-RateLimit-Remaining']))
 
-            message_run = (f'url: {url} status_code: {status_code}'
-                            f'not equal to 200 request_text: {request.text}')
-            raise StatusCodeNotEqualException(message_run)
+        if status_code == 304 and cache_entry:
 
-        if is_json:
-            request_text = request.json()
+            cache_entry = HttpCache.refresh(cache_entry, request.headers)
+            request_text = cache_entry.text
+            Tracer.set(cache='revalidated', status_code=status_code, bytes=0)
+
+        else:
+
+            request_text = request.text
+            Tracer.set(cache='miss', status_code=status_code, bytes=len(request.content))
+
+            if status_code != 200 and not no_error_status_code:
+
+                message_run = (f'url: {url} status_code: {status_code}'
+                                f'not equal to 200 request_text: {request.text}')
+                raise StatusCodeNotEqualException(message_run)
+
+            if status_code == 200 and use_cache:
+                HttpCache.store(url, request_text, request.headers)
 
         return request_text
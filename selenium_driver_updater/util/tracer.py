@@ -0,0 +1,183 @@
+#Standart library imports
+import json
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional
+
+#Local imports
+from selenium_driver_updater._setting import setting
+from selenium_driver_updater.util.atomic_file import AtomicFile
+
+class Tracer():
+    """Class for recording durations, bytes and cache usage of install phases into machine-readable report"""
+
+    format_version = 1
+
+    _lock = threading.Lock()
+    _current : ContextVar = ContextVar('tracer_span', default=None)
+
+    @staticmethod
+    @contextmanager
+    def collect(name : str = 'report', **attributes) -> Iterator[dict]:
+        """Records spans of this block of the current call into report, spans of threads are recorded
+        when they run in a copy of the context, like contextvars.copy_context().run.
+        Report of nested block is also added to the outer report as span.
+
+        Args:
+            name (str)          : Name of report, like install.
+            **attributes        : Attributes of report, like driver_name.
+
+        Returns:
+            Iterator[dict]
+
+            report (dict) : Report which is completed with duration and summary when block ends.
+
+        """
+
+        report = Tracer._create_span(name, attributes)
+        report.update(format_version=Tracer.format_version, library_version=str(setting["Program"]["version"]))
+
+        Tracer._add_child(Tracer._current.get(), report)
+
+        started = time.perf_counter()
+        token = Tracer._current.set(report)
+        try:
+            yield report
+        except BaseException as error:
+            Tracer._set_error(report, error)
+            raise
+        finally:
+            Tracer._current.reset(token)
+            report['duration'] = round(time.perf_counter() - started, 6)
+            report['summary'] = Tracer.get_summary(report)
+
+    @staticmethod
+    @contextmanager
+    def span(name : str, **attributes) -> Iterator[dict]:
+        """Records duration and status of this block as span of current report, does nothing outside of Tracer.collect()
+
+        Args:
+            name (str)      : Name of phase, like resolve, fetch, download, extract, chmod or verify.
+            **attributes    : Attributes of span, like url.
+
+        Returns:
+            Iterator[dict]
+
+            span (dict) : Recorded span.
+
+        """
+
+        parent = Tracer._current.get()
+        span = Tracer._create_span(name, attributes)
+
+        if parent is None:
+            yield span
+            return
+
+        Tracer._add_child(parent, span)
+
+        started = time.perf_counter()
+        token = Tracer._current.set(span)
+        try:
+            yield span
+        except BaseException as error:
+            Tracer._set_error(span, error)
+            raise
+        finally:
+            Tracer._current.reset(token)
+            span['duration'] = round(time.perf_counter() - started, 6)
+
+    @staticmethod
+    def set(**attributes) -> None:
+        """Sets attributes of current span, like status_code=200"""
+
+        span = Tracer._current.get()
+        if span is not None:
+            span['attributes'].update(attributes)
+
+    @staticmethod
+    def add(**counters) -> None:
+        """Adds numbers to attributes of current span, like bytes=1024"""
+
+        span = Tracer._current.get()
+        if span is not None:
+            with Tracer._lock:
+                for key, value in counters.items():
+                    span['attributes'][key] = span['attributes'].get(key, 0) + value
+
+    @staticmethod
+    def fail(error : BaseException) -> None:
+        """Marks current span as failed when error is handled inside of it"""
+
+        span = Tracer._current.get()
+        if span is not None:
+            Tracer._set_error(span, error)
+
+    @staticmethod
+    def get_summary(report : dict) -> dict:
+        """Gets totals of every phase in report
+
+        Args:
+            report (dict) : Report of Tracer.collect().
+
+        Returns:
+            dict
+
+            summary (dict) : Totals like {"download": {"count": 1, "duration": 0.5, "errors": 0, "bytes": 1024}}.
+
+        """
+
+        summary : dict = {}
+
+        for span in Tracer._walk(report):
+            entry = summary.setdefault(span['name'], dict(count=0, duration=0.0, errors=0))
+            entry['count'] += 1
+            entry['duration'] = round(entry['duration'] + span['duration'], 6)
+            entry['errors'] += span['status'] == 'error'
+
+            attributes = span['attributes']
+            if isinstance(attributes.get('bytes'), int):
+                entry['bytes'] = entry.get('bytes', 0) + attributes['bytes']
+            if attributes.get('cache'):
+                entry.setdefault('cache', {})
+                entry['cache'][attributes['cache']] = entry['cache'].get(attributes['cache'], 0) + 1
+
+        return summary
+
+    @staticmethod
+    def write(report : dict, report_path : str) -> None:
+        """Writes report as json file, file is replaced atomically
+
+        Args:
+            report (dict)       : Report of Tracer.collect().
+            report_path (str)   : Path of json file.
+
+        """
+
+        AtomicFile.write_text(report_path, json.dumps(report, indent=1, default=str))
+
+    @staticmethod
+    def _create_span(name : str, attributes : dict) -> dict:
+        return dict(
+            name=name, started_at=time.time(), duration=0.0, status='ok', error='',
+            attributes=dict(attributes), children=[],
+            )
+
+    @staticmethod
+    def _add_child(parent : Optional[dict], span : dict) -> None:
+        if parent is not None:
+            with Tracer._lock:
+                parent['children'].append(span)
+
+    @staticmethod
+    def _set_error(span : dict, error : BaseException) -> None:
+        span['status'] = 'error'
+        span['error'] = f'{type(error).__name__}: {error}'
+
+    @staticmethod
+    def _walk(span : dict) -> Iterator[Any]:
+        for child in list(span['children']):
+            yield child
+            yield from Tracer._walk(child)
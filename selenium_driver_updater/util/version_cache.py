@@ -0,0 +1,101 @@
+#Standart library imports
+import hashlib
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+#Local imports
+from selenium_driver_updater.util.http_cache import HttpCache
+from selenium_driver_updater.util.json_index import JsonIndex
+
+class DriverVersionCache():
+    """Class for persistent caching of driver binary versions keyed by file identity"""
+
+    _prefix_size = 64 * 1024
+
+    @staticmethod
+    def get_path() -> str:
+        """Gets path of sidecar index file"""
+        return HttpCache.get_root_path() + 'driver_versions.json'
+
+    @staticmethod
+    def get(driver_path : str) -> str:
+        """Gets cached version of specific driver binary
+
+        Args:
+            driver_path (str) : Path to driver binary.
+
+        Returns:
+            str
+
+            driver_version (str) : Cached version or empty string if binary was changed or not cached.
+
+        """
+
+        if not HttpCache.is_enabled():
+            return ''
+
+        entry = DriverVersionCache._read_index().get(os.path.abspath(driver_path))
+        if not entry:
+            return ''
+
+        identity = DriverVersionCache._get_identity(driver_path, sha256=False)
+        if identity is None or any(entry.get(key) != value for key, value in identity.items()):
+            return ''
+
+        if entry.get('sha256') != DriverVersionCache._get_sha256_prefix(driver_path):
+            return ''
+
+        return str(entry.get('version', ''))
+
+    @staticmethod
+    def store(driver_path : str, driver_version : str) -> None:
+        """Stores version of specific driver binary
+
+        Args:
+            driver_path (str)       : Path to driver binary.
+            driver_version (str)    : Version printed by driver binary.
+
+        """
+
+        if not HttpCache.is_enabled() or not driver_version:
+            return
+
+        identity = DriverVersionCache._get_identity(driver_path)
+        if identity is None:
+            return
+
+        identity.update(version=driver_version)
+
+        entries = {os.path.abspath(driver_path): identity}
+        JsonIndex.update(DriverVersionCache.get_path(), lambda index: DriverVersionCache._update_entries(index, entries), ignore_errors=True)
+
+    @staticmethod
+    def _get_identity(driver_path : str, sha256 : bool = True) -> Optional[dict]:
+        try:
+            file_stat = os.stat(driver_path)
+            identity : dict = dict(inode=file_stat.st_ino, size=file_stat.st_size, mtime=file_stat.st_mtime_ns)
+            if sha256:
+                identity.update(sha256=DriverVersionCache._get_sha256_prefix(driver_path))
+        except OSError:
+            return None
+
+        return identity
+
+    @staticmethod
+    def _get_sha256_prefix(driver_path : str) -> str:
+        try:
+            with open(driver_path, 'rb') as file:
+                return hashlib.sha256(file.read(DriverVersionCache._prefix_size)).hexdigest()
+        except OSError:
+            return ''
+
+    @staticmethod
+    def _read_index() -> Any:
+        return JsonIndex.read(DriverVersionCache.get_path())
+
+    @staticmethod
+    def _update_entries(index : dict, entries : dict) -> None:
+        for path in [path for path in index if not Path(path).exists()]:
+            del index[path]
+        index.update(entries)
@@ -0,0 +1,189 @@
+#Standart library imports
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+#Local imports
+from selenium_driver_updater._setting import setting
+from selenium_driver_updater.util.requests_getter import RequestsGetter
+from selenium_driver_updater.util.http_cache import HttpCache
+from selenium_driver_updater.util.atomic_file import AtomicFile
+from selenium_driver_updater.util.logger import logger
+
+class ChromeVersionsIndex():
+    """Class for working with persistent sqlite index of chrome for testing known good versions"""
+
+    _lock = threading.Lock()
+
+    _schema = (
+        'CREATE TABLE downloads (product TEXT, version TEXT, major INTEGER, minor INTEGER, build INTEGER, '
+        'patch INTEGER, platform TEXT, url TEXT, PRIMARY KEY (product, version, platform))',
+        'CREATE INDEX downloads_milestone ON downloads (product, major, platform)',
+        'CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)',
+    )
+
+    @staticmethod
+    def get_path() -> str:
+        """Gets path of sqlite index file"""
+        return HttpCache.get_root_path() + 'chrome_versions.sqlite3'
+
+    @staticmethod
+    def get_download_url(version : str, platform : str, product : str = 'chromedriver') -> str:
+        """Gets download url of specific version and platform
+
+        Args:
+            version (str)   : Specific version, like 120.0.6099.109.
+            platform (str)  : Specific platform, like linux64 or mac-arm64.
+            product (str)   : Product name in known good versions, like chromedriver or chrome. Defaults to chromedriver.
+
+        Returns:
+            str
+
+            url (str) : Download url or empty string if version was not found.
+
+        """
+
+        row = ChromeVersionsIndex._query(
+            'SELECT url FROM downloads WHERE product = ? AND version = ? AND platform = ?',
+            (product, version, platform)
+            )
+        return row[0] if row else ''
+
+    @staticmethod
+    def get_latest_version_for_milestone(milestone : int, platform : str = '', product : str = 'chromedriver') -> str:
+        """Gets latest known good version of specific milestone
+
+        Args:
+            milestone (int) : Major version, like 120.
+            platform (str)  : If given, only versions available for this platform are used. Defaults to empty string.
+            product (str)   : Product name in known good versions. Defaults to chromedriver.
+
+        Returns:
+            str
+
+            version (str) : Latest version of milestone or empty string if milestone was not found.
+
+        """
+
+        query = 'SELECT version FROM downloads WHERE product = ? AND major = ?'
+        parameters : tuple = (product, int(milestone))
+        if platform:
+            query += ' AND platform = ?'
+            parameters += (platform,)
+        query += ' ORDER BY minor DESC, build DESC, patch DESC LIMIT 1'
+
+        row = ChromeVersionsIndex._query(query, parameters)
+        return row[0] if row else ''
+
+    @staticmethod
+    def refresh(force : bool = False) -> bool:
+        """Rebuilds index if known good versions document was changed
+
+        Args:
+            force (bool) : If true, document is revalidated even if index was refreshed recently. Defaults to False.
+
+        Returns:
+            bool
+
+            is_refreshed (bool) : True if document was requested.
+
+        """
+
+        path = ChromeVersionsIndex.get_path()
+
+        with ChromeVersionsIndex._lock:
+
+            refreshed_at, document_sha256 = ChromeVersionsIndex._get_meta(path)
+            if not force and time.time() - refreshed_at < HttpCache.get_default_ttl():
+                return False
+
+            url = str(setting["ChromeDriver"]["LinkCheckVersionIsValid"])
+            try:
+                text = RequestsGetter.get_result_by_request(url=url)
+            except Exception:
+                if not document_sha256:
+                    raise
+                logger.warning('Could not refresh known good versions of chromedriver, using previously indexed versions')
+                return False
+
+            text_sha256 = hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+            if text_sha256 == document_sha256:
+                ChromeVersionsIndex._execute(path, "REPLACE INTO meta VALUES ('refreshed_at', ?)", (str(time.time()),))
+            else:
+                ChromeVersionsIndex._build(path, json.loads(text), text_sha256)
+
+        return True
+
+    @staticmethod
+    def _query(query : str, parameters : tuple) -> Optional[tuple]:
+        is_refreshed = ChromeVersionsIndex.refresh()
+        row = ChromeVersionsIndex._execute(ChromeVersionsIndex.get_path(), query, parameters)
+
+        if row is None and not is_refreshed:
+            #version could be released after the last refresh
+            ChromeVersionsIndex.refresh(force=True)
+            row = ChromeVersionsIndex._execute(ChromeVersionsIndex.get_path(), query, parameters)
+
+        return row
+
+    @staticmethod
+    def _execute(path : str, query : str, parameters : tuple) -> Optional[tuple]:
+        connection = sqlite3.connect(path, timeout=30)
+        try:
+            with connection:
+                return connection.execute(query, parameters).fetchone()
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _get_meta(path : str):
+        if not Path(path).exists():
+            return 0.0, ''
+
+        connection = sqlite3.connect(path)
+        try:
+            meta = dict(connection.execute('SELECT key, value FROM meta').fetchall())
+        except sqlite3.Error:
+            return 0.0, ''
+        finally:
+            connection.close()
+
+        return float(meta.get('refreshed_at', 0)), meta.get('sha256', '')
+
+    @staticmethod
+    def _build(path : str, json_data : dict, document_sha256 : str) -> None:
+        rows = []
+        for item in json_data.get('versions', []):
+            version = str(item.get('version', ''))
+            parts = [int(part) for part in version.split('.') if part.isdigit()]
+            if len(parts) != 4:
+                continue
+
+            for product, downloads in item.get('downloads', {}).items():
+                for download in downloads:
+                    rows.append((product, version, *parts, download.get('platform'), download.get('url')))
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = AtomicFile.get_tmp_path(path)
+        if Path(tmp_path).exists():
+            Path(tmp_path).unlink()
+
+        connection = sqlite3.connect(tmp_path)
+        try:
+            with connection:
+                for statement in ChromeVersionsIndex._schema:
+                    connection.execute(statement)
+                connection.executemany('INSERT OR REPLACE INTO downloads VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows)
+                connection.executemany('INSERT INTO meta VALUES (?, ?)', [
+                    ('refreshed_at', str(time.time())), ('sha256', document_sha256)
+                    ])
+        finally:
+            connection.close()
+
+        os.replace(tmp_path, path)
@@ -43,7 +43,7 @@ setup(
   classifiers=classifiers,
   keywords=keywords,
   packages=packages,
-  install_requires=['wget', 'requests', 'selenium', 'beautifulsoup4', 'packaging'],
+  install_requires=['requests', 'selenium', 'beautifulsoup4', 'packaging'],
   entry_points={
         "console_scripts": [
             "selenium_driver_updater = selenium_driver_updater.consoleUpdater:ConsoleUpdater.install",